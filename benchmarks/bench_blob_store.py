@@ -0,0 +1,81 @@
+# benchmarks/bench_blob_store.py
+
+"""
+Microbenchmark: note bodies in a content-addressed BlobStore vs a JSON
+file embedding every body (analysis_results.json style)
+
+Bodies are the sample notes with a note number appended, repeated to
+--notes pages; --distinct of them are unique, the rest are copies
+(identical bodies are stored once). Phase 2 only needs the bodies of
+--fetch proposals, which is what the read columns measure.
+
+Usage: python benchmarks/bench_blob_store.py [--notes 5000] [--distinct 2000] [--fetch 50]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_vault import sample_bodies
+from tools.blob_store import BlobStore
+
+
+def timed(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--distinct", type=int, default=2000)
+    parser.add_argument("--fetch", type=int, default=50)
+    args = parser.parse_args()
+
+    samples = sample_bodies()
+    bodies = [f"{samples[i % len(samples)]}\n\nNote {i % args.distinct}" for i in range(args.notes)]
+    wanted = random.Random(42).sample(range(args.notes), args.fetch)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        json_path = tmp / "analysis_results.json"
+        records = [{"title": f"Note {i}", "content": body} for i, body in enumerate(bodies)]
+        _, json_write = timed(lambda: json_path.write_text(json.dumps(records, indent=2, ensure_ascii=False),
+                                                          encoding='utf-8'))
+        json_size = json_path.stat().st_size
+        _, json_read = timed(lambda: [json.loads(json_path.read_text(encoding='utf-8'))[i]["content"]
+                                      for i in wanted[:1]])
+
+        store = BlobStore(tmp / "bodies")
+        hashes, put_time = timed(lambda: [store.put(body) for body in bodies])
+        _, save_time = timed(store.save)
+        store.close()
+        pack_size = store.pack_path.stat().st_size + store.index_path.stat().st_size
+
+        def fetch():
+            reader = BlobStore(tmp / "bodies").load()
+            fetched = [reader.get(hashes[i]) for i in wanted]
+            reader.close()
+            return fetched
+
+        fetched, fetch_time = timed(fetch)
+        assert fetched == [bodies[i] for i in wanted]
+
+    print(f"{args.notes} notes, {args.distinct} distinct bodies, fetching {args.fetch}\n")
+    print(f"JSON with bodies   write {json_write * 1e3:>7.0f} ms   {json_size / 1e6:>6.1f} MB   "
+          f"read {json_read * 1e3:>6.0f} ms (whole file for any body)")
+    print(f"BlobStore          write {(put_time + save_time) * 1e3:>7.0f} ms   {pack_size / 1e6:>6.1f} MB   "
+          f"read {fetch_time * 1e3:>6.1f} ms (load index + {args.fetch} bodies)")
+
+
+if __name__ == "__main__":
+    main()
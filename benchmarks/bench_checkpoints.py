@@ -0,0 +1,71 @@
+# benchmarks/bench_checkpoints.py
+
+"""
+Phase 1 run time with the analysis checkpoint: cold (empty cache), warm
+(nothing changed), after a new day's Presence.md, after editing --edit
+notes, and with --force
+
+Usage: python benchmarks/bench_checkpoints.py [--notes 1000] [--edit 10]
+"""
+
+from pathlib import Path
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from phase1_intelligence import ContentIntelligence
+from synthetic_vault import build_vault
+
+
+def run(vault: Path, cache: Path, label: str, force: bool = False):
+    intelligence = ContentIntelligence(str(vault), cache_dir=str(cache))
+    plan = intelligence.plan(force=force)
+    start = time.perf_counter()
+    safe_pages, _ = intelligence.run(force=force)
+    elapsed = time.perf_counter() - start
+    analyze = intelligence.metrics.stages["analyze"].wall_ns / 1e9 if "analyze" in intelligence.metrics.stages else 0.0
+    rescored = intelligence.metrics.counts["rescored"]
+    print(f"{label:<8} {elapsed:>9.3f} {analyze:>11.3f} {len(plan.rebuild):>9} {len(plan.reuse):>8} {rescored:>9}")
+    return safe_pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=1000)
+    parser.add_argument("--edit", type=int, default=10)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = build_vault(Path(tmp) / "vault", args.notes)
+        cache = Path(tmp) / "cache"
+        presence = vault / "Presence.md"
+        presence.write_text("# Today\n\nWorked on the agent memory design.\n", encoding='utf-8')
+        print(f"📂 Synthetic vault: {args.notes} notes\n")
+        print(f"{'run':<8} {'total (s)':>9} {'analyze (s)':>11} {'rebuilt':>9} {'reused':>8} {'rescored':>9}")
+
+        cold = run(vault, cache, "cold")
+        warm = run(vault, cache, "warm")
+        assert [page["tone"] for page in warm] == [page["tone"] for page in cold]
+
+        # A new day: only presence mentions are re-scored
+        presence.write_text("# Today\n\nShipped the python refactor, wrote about testing.\n", encoding='utf-8')
+        stat = presence.stat()
+        os.utime(presence, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        run(vault, cache, "presence")
+
+        for path in sorted(vault.rglob("*.md"))[:args.edit]:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write("\nEdited for the benchmark.\n")
+        run(vault, cache, "edited")
+        run(vault, cache, "forced", force=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# benchmarks/bench_content_analyzer.py
+
+"""
+Microbenchmark: ContentAnalyzer.analyze() vs the old three-method path
+
+The legacy path is the previous analyze_tone + suggest_platforms +
+extract_keywords (five lowercase copies of the note, substring scans,
+Counter imported per call), kept verbatim below. Runs over the notes in
+analysis_results.json and reports how often the two disagree (analyze()
+matches keywords at word starts, so "ai" no longer fires on "said").
+
+Usage: python benchmarks/bench_content_analyzer.py [--number 20]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tools.content_analyzer import ContentAnalyzer
+
+project_root = Path(__file__).parent.parent
+
+
+def legacy_analyze_tone(content):
+    content_lower = content.lower()
+    tones = {
+        "professional": ["business", "enterprise", "solution", "strategy", "innovation"],
+        "technical": ["code", "api", "system", "architecture", "implementation"],
+        "casual": ["hey", "awesome", "cool", "love", "excited"],
+        "educational": ["learn", "guide", "tutorial", "how to", "step by step"]
+    }
+    tone_scores = {}
+    for tone, keywords in tones.items():
+        tone_scores[tone] = sum(1 for kw in keywords if kw in content_lower)
+    return max(tone_scores, key=tone_scores.get) if tone_scores else "neutral"
+
+
+def legacy_suggest_platforms(page_data):
+    content = page_data["content"]
+    metadata = page_data["metadata"]
+    if "platforms" in metadata:
+        return metadata["platforms"]
+    suggested = []
+    if any(kw in content.lower() for kw in ["business", "strategy", "innovation", "ai", "tech"]):
+        suggested.append("linkedin")
+    if page_data["word_count"] < 500 or "announcement" in content.lower():
+        suggested.append("x")
+    if any(kw in content.lower() for kw in ["community", "event", "join", "share"]):
+        suggested.append("facebook")
+    if page_data["images"]:
+        suggested.append("instagram")
+    return suggested if suggested else ["linkedin", "x"]
+
+
+def legacy_extract_keywords(content, top_n=5):
+    stop_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "is", "are"}
+    words = content.lower().split()
+    filtered = [w for w in words if w not in stop_words and len(w) > 3]
+    from collections import Counter
+    word_counts = Counter(filtered)
+    return [word for word, _ in word_counts.most_common(top_n)]
+
+
+def legacy(page):
+    return (legacy_analyze_tone(page["content"]), legacy_suggest_platforms(page),
+            legacy_extract_keywords(page["content"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(project_root / "analysis_results.json", 'r', encoding='utf-8') as f:
+        pages = [{
+            "content": page["content"],
+            "metadata": {},
+            "word_count": len(page["content"].split()),
+            "images": page.get("images", []),
+        } for page in json.load(f)]
+
+    corpora = {
+        "notes": pages,
+        "notes x10": [{**page, "content": page["content"] * 10, "word_count": page["word_count"] * 10}
+                      for page in pages],
+    }
+
+    print(f"{'corpus':<10} {'notes':>6} {'legacy ms':>10} {'analyze ms':>11} {'speedup':>8}  "
+          f"{'tone diff':>9} {'platform diff':>13}")
+    for name, corpus in corpora.items():
+        old = [legacy(page) for page in corpus]
+        new = [ContentAnalyzer.analyze(page) for page in corpus]
+        tone_diff = sum(1 for o, n in zip(old, new) if o[0] != n["tone"])
+        platform_diff = sum(1 for o, n in zip(old, new) if o[1] != n["platforms"])
+
+        legacy_time = min(timeit.repeat(lambda: [legacy(page) for page in corpus], number=args.number, repeat=5))
+        new_time = min(timeit.repeat(lambda: [ContentAnalyzer.analyze(page) for page in corpus],
+                                     number=args.number, repeat=5))
+        print(f"{name:<10} {len(corpus):>6} {legacy_time / args.number * 1e3:>10.2f} "
+              f"{new_time / args.number * 1e3:>11.2f} {legacy_time / new_time:>7.2f}x  "
+              f"{tone_diff:>9} {platform_diff:>13}")
+
+
+if __name__ == "__main__":
+    main()
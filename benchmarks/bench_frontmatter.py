@@ -0,0 +1,63 @@
+# benchmarks/bench_frontmatter.py
+
+"""
+Microbenchmark: parse_frontmatter() vs python-frontmatter's loads()
+
+Headers are a mix of what real notes carry: flat scalars + lists (fast
+path), and nested/dated headers that need the YAML loader (C loader +
+header cache). Bodies come from the synthetic vault samples.
+
+Usage: python benchmarks/bench_frontmatter.py [--notes 2000]
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+import frontmatter
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_vault import sample_bodies
+from tools.frontmatter_parser import parse_frontmatter, YAMLLoader
+
+HEADERS = {
+    "flat": "title: Note {i}\ntags: [tech, ai]\nready: true\nplatforms:\n  - linkedin\n  - x",
+    "nested": "title: Note {i}\ncreated: 2025-11-{day:02d}\nsocial:\n  topic: ai\n  audience: devs",
+}
+
+
+def build_notes(kind: str, n_notes: int) -> list:
+    bodies = sample_bodies()
+    header = HEADERS[kind]
+    return [
+        f"---\n{header.format(i=i % 50, day=i % 28 + 1)}\n---\n{bodies[i % len(bodies)]}\n"
+        for i in range(n_notes)
+    ]
+
+
+def timed(fn, notes: list) -> float:
+    start = time.perf_counter()
+    for text in notes:
+        fn(text)
+    return (time.perf_counter() - start) / len(notes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"YAML loader: {YAMLLoader.__name__}")
+    print(f"{'headers':<8} {'frontmatter µs':>15} {'fast µs':>8} {'speedup':>8}")
+    for kind in HEADERS:
+        notes = build_notes(kind, args.notes)
+        legacy = min(timed(frontmatter.loads, notes) for _ in range(3))
+        fast = min(timed(parse_frontmatter, notes) for _ in range(3))
+        print(f"{kind:<8} {legacy * 1e6:>15.1f} {fast * 1e6:>8.1f} {legacy / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/bench_ip_filter.py
+
+"""
+Microbenchmark: compiled is_safe_to_share() vs the old per-call pattern lists
+
+Runs over the notes in analysis_results.json (mostly clean: every rule has
+to be ruled out) and over the same notes with a secret near the top
+(early exit).
+
+Usage: python benchmarks/bench_ip_filter.py [--number 50]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tools.ip_filter import PresenceBasedIPFilter
+
+project_root = Path(__file__).parent.parent
+
+
+def legacy_is_safe(note_content: str, note_metadata: dict) -> bool:
+    """The pre-compiled-rules is_safe_to_share, kept verbatim for comparison"""
+    vault_only_tags = ['vault-only', 'private', 'internal', 'confidential', 'secret']
+    for tag in note_metadata.get('tags', []):
+        if tag.lower().replace('#', '').strip() in vault_only_tags:
+            return False
+
+    dangerous_patterns = ['api_key', 'secret_key', 'password:', 'token:', 'private_key', 'credential']
+    content_lower = note_content.lower()
+    if any(pattern in content_lower for pattern in dangerous_patterns):
+        return False
+
+    private_markers = ['#vault-only', '#private', '#internal', '⚠️ vault only', '⚠️ private']
+    if any(marker.lower() in content_lower for marker in private_markers):
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    with open(project_root / "analysis_results.json", 'r', encoding='utf-8') as f:
+        notes = [page["content"] for page in json.load(f)]
+
+    with tempfile.TemporaryDirectory() as vault:
+        ip_filter = PresenceBasedIPFilter(vault)
+
+    corpora = {
+        "clean notes": notes,
+        "secret at top": ["password: hunter2\n" + note for note in notes],
+    }
+
+    print(f"{'corpus':<14} {'notes':>6} {'legacy ms':>10} {'compiled ms':>12} {'speedup':>8}")
+    for name, corpus in corpora.items():
+        assert [legacy_is_safe(n, {}) for n in corpus] == [bool(ip_filter.is_safe_to_share(n, {})) for n in corpus]
+        legacy = min(timeit.repeat(lambda: [legacy_is_safe(n, {}) for n in corpus], number=args.number, repeat=5))
+        compiled = min(timeit.repeat(lambda: [ip_filter.is_safe_to_share(n, {}) for n in corpus],
+                                     number=args.number, repeat=5))
+        print(f"{name:<14} {len(corpus):>6} {legacy / args.number * 1e3:>10.2f} "
+              f"{compiled / args.number * 1e3:>12.2f} {legacy / compiled:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
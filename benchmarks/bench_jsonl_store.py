@@ -0,0 +1,88 @@
+# benchmarks/bench_jsonl_store.py
+
+"""
+Microbenchmark: indent=2 JSON arrays vs streamed JSONL artifacts
+
+Records are the pages of analysis_results.json (full bodies included,
+the worst case) repeated to --records. Write time, file size, full read
+time and the peak memory of a pass over the records (tracemalloc) are
+reported for the old json.dump/json.load pair and each JSONL variant.
+
+Usage: python benchmarks/bench_jsonl_store.py [--records 5000]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tools import jsonl_store
+from tools.jsonl_store import iter_jsonl, jsonl_path, write_jsonl
+
+project_root = Path(__file__).parent.parent
+
+
+def timed(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def legacy_write(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+
+
+def legacy_read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=5000)
+    args = parser.parse_args()
+
+    with open(project_root / "analysis_results.json", 'r', encoding='utf-8') as f:
+        pages = json.load(f)
+    records = [pages[i % len(pages)] for i in range(args.records)]
+
+    backend = "orjson" if jsonl_store.orjson is not None else "json"
+    print(f"{len(records)} records, JSON backend: {backend}\n")
+    print(f"{'format':<22} {'write':>9} {'size':>10} {'read all':>10} {'peak (scan)':>12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        path = tmp / "safe_content.json"
+        _, write_time = timed(lambda: legacy_write(path, records))
+        _, read_time = timed(lambda: legacy_read(path))
+        peak = peak_memory(lambda: sum(1 for _ in legacy_read(path)))
+        print(f"{'json indent=2':<22} {write_time * 1e3:>7.0f}ms {path.stat().st_size / 1e6:>8.1f}MB "
+              f"{read_time * 1e3:>8.0f}ms {peak / 1e6:>10.1f}MB")
+
+        compressions = [None, "gzip"] + (["zstd"] if jsonl_store.zstd is not None else [])
+        for compression in compressions:
+            path = jsonl_path(tmp / "safe_content.jsonl", compression)
+            _, write_time = timed(lambda: write_jsonl(path, records))
+            _, read_time = timed(lambda: list(iter_jsonl(path)))
+            peak = peak_memory(lambda: sum(1 for _ in iter_jsonl(path)))
+            print(f"{'jsonl ' + (compression or 'plain'):<22} {write_time * 1e3:>7.0f}ms "
+                  f"{path.stat().st_size / 1e6:>8.1f}MB {read_time * 1e3:>8.0f}ms {peak / 1e6:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_keyword_index.py
+
+"""
+Benchmark: corpus TF-IDF keywords (KeywordIndex) at vault scale
+
+Synthetic notes are random 100-800 word runs of the real note bodies.
+Reports the cold index build (tokenize + df updates), the vectorized
+top-k ranking of every note, save/load of the cache, and an incremental
+run where 1% of the notes changed.
+
+Usage: python benchmarks/bench_keyword_index.py [--notes 50000]
+"""
+
+from pathlib import Path
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_vault import sample_bodies
+from tools.keyword_index import KeywordIndex
+
+
+def synthetic_notes(n_notes: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    words = " ".join(sample_bodies()).split()
+    notes = []
+    for _ in range(n_notes):
+        length = rng.randint(100, 800)
+        start = rng.randrange(len(words) - length)
+        notes.append(" ".join(words[start:start + length]))
+    return notes
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {time.perf_counter() - start:>8.2f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=50000)
+    args = parser.parse_args()
+
+    notes = synthetic_notes(args.notes)
+    keys = [f"Folder/Note {i}.md" for i in range(len(notes))]
+    print(f"{len(notes)} notes, {sum(len(note.split()) for note in notes) / len(notes):.0f} words avg\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = KeywordIndex(Path(tmp) / "keywords.pkl")
+        timed("cold build", lambda: [index.add(key, note, str(i)) for i, (key, note) in enumerate(zip(keys, notes))])
+        print(f"{'':<28} {index.term_count} terms, {sum(len(doc[1]) for doc in index.docs.values())} nonzeros")
+        top = timed("top-5 keywords (all notes)", lambda: index.top_keywords(top_n=5))
+        timed("save", index.save)
+
+        index = timed("load", lambda: KeywordIndex(Path(tmp) / "keywords.pkl").load())
+        changed = set(random.Random(1).sample(range(len(notes)), len(notes) // 100))
+
+        def incremental():
+            for i, (key, note) in enumerate(zip(keys, notes)):
+                if i in changed:
+                    index.add(key, note[::-1], f"{i}-changed")
+                else:
+                    index.add(key, note, str(i))
+            return index.top_keywords(top_n=5)
+
+        timed("incremental run (1% changed)", incremental)
+        print(f"\nsample: {keys[0]} → {top[keys[0]]}")
+
+
+if __name__ == "__main__":
+    main()
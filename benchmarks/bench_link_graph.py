@@ -0,0 +1,76 @@
+# benchmarks/bench_link_graph.py
+
+"""
+Benchmark: LinkGraph build / save / load / queries on a large synthetic vault
+
+Builds the graph straight from note keys + links (no files), with the
+same shape as synthetic_vault.py: notes spread over folders, a few
+[[Note N]] links each, plus some dangling links.
+
+Usage: python benchmarks/bench_link_graph.py [--notes 50000] [--links 5]
+"""
+
+from pathlib import Path
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tools.link_graph import LinkGraph
+
+
+def timed(label: str, fn, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    unit, scale = ("ms", 1e3) if elapsed >= 1e-3 else ("µs", 1e6)
+    print(f"   {label:<36} {elapsed * scale:>9.2f} {unit}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=50000)
+    parser.add_argument("--links", type=int, default=5)
+    parser.add_argument("--folders", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    keys = [f"Folder_{i % args.folders:02d}/Note {i}.md" for i in range(args.notes)]
+    links = {
+        key: [f"Note {rng.randrange(args.notes)}" for _ in range(args.links)] + ["Missing"]
+        for key in keys
+    }
+
+    print(f"🕸️  {args.notes} notes, {args.links} links each")
+    with tempfile.TemporaryDirectory() as tmp:
+        graph_path = Path(tmp) / "link_graph.pkl"
+
+        def build():
+            graph = LinkGraph(graph_path)
+            graph.sync(keys)
+            for key in keys:
+                graph.update(key, links[key])
+            return graph
+
+        graph = timed("build (sync + update all)", build)
+        print(f"   → {len(graph)} nodes, {graph.edge_count} edges")
+        timed("save", graph.save)
+        print(f"   → {graph_path.stat().st_size / 1e6:.1f} MB on disk")
+        graph = timed("load", lambda: LinkGraph(graph_path).load())
+
+        probe = keys[len(keys) // 2]
+        timed("backlinks", lambda: graph.backlinks(probe), repeat=1000)
+        timed("neighborhood (1 hop)", lambda: graph.neighborhood(probe, hops=1), repeat=1000)
+        timed("neighborhood (2 hops)", lambda: graph.neighborhood(probe, hops=2), repeat=100)
+        timed("orphans", graph.orphans, repeat=5)
+        timed("update one note", lambda: graph.update(probe, [f"Note {rng.randrange(args.notes)}"]), repeat=1000)
+        timed("add + remove one note", lambda: (graph.sync(keys + ["Folder_00/New.md"]), graph.sync(keys)), repeat=5)
+
+
+if __name__ == "__main__":
+    main()
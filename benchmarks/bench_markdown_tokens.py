@@ -0,0 +1,70 @@
+# benchmarks/bench_markdown_tokens.py
+
+"""
+Microbenchmark: single-pass tokenize() vs the old four findall passes + split()
+
+Runs on the "Archies Guardian" note from analysis_results.json (~1,800 words)
+when available, plus a synthetic note scaled up to --words.
+
+Usage: python benchmarks/bench_markdown_tokens.py [--words 20000] [--number 2000]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import re
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tools.markdown_tokens import tokenize
+
+project_root = Path(__file__).parent.parent
+
+
+def legacy_extract(content: str):
+    """The pre-tokenizer _parse_page extraction, kept verbatim for comparison"""
+    internal_links = re.findall(r'\[\[(.*?)\]\]', content)
+    image_refs = re.findall(r'!\[\[?(.*?\.(?:png|jpg|jpeg|gif|svg|webp))\]?\]', content, re.IGNORECASE)
+    md_images = re.findall(r'!\[.*?\]\((.*?\.(?:png|jpg|jpeg|gif|svg|webp))\)', content, re.IGNORECASE)
+    all_images = list(set(image_refs + md_images))
+    tags = re.findall(r'#(\w+)', content)
+    return internal_links, all_images, tags, len(content.split())
+
+
+def load_notes(words: int) -> dict:
+    notes = {}
+    results_file = project_root / "analysis_results.json"
+    if results_file.exists():
+        with open(results_file, 'r', encoding='utf-8') as f:
+            for page in json.load(f):
+                if page["title"] == "Archies Guardian":
+                    notes["Archies Guardian"] = page["content"]
+
+    base = notes.get("Archies Guardian") or (
+        "## Widget\nThe [[File Monitor]] widget ![[diagram.png]] watches #security events.\n"
+        "```python\n#include fake\n```\n" * 20
+    )
+    repeats = max(1, words // max(1, len(base.split())))
+    notes[f"synthetic ({repeats}x)"] = "\n".join([base] * repeats)
+    return notes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=20000)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'note':<24} {'words':>7} {'legacy µs':>10} {'tokenize µs':>12} {'speedup':>8}")
+    for name, content in load_notes(args.words).items():
+        number = max(10, args.number * 2000 // max(1, len(content.split())))
+        legacy = min(timeit.repeat(lambda: legacy_extract(content), number=number, repeat=5)) / number
+        single = min(timeit.repeat(lambda: tokenize(content), number=number, repeat=5)) / number
+        print(f"{name:<24} {len(content.split()):>7} {legacy * 1e6:>10.1f} {single * 1e6:>12.1f} "
+              f"{legacy / single:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
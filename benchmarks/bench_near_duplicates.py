@@ -0,0 +1,75 @@
+# benchmarks/bench_near_duplicates.py
+
+"""
+Benchmark: MinHash + LSH near-duplicate clustering vs all-pairs comparison
+
+Notes are the sample bodies (analysis_results.json) with a random slice
+of words each; every 10th note is an edited copy of another one.
+
+Usage: python benchmarks/bench_near_duplicates.py [--notes 5000]
+"""
+
+from pathlib import Path
+import argparse
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_vault import sample_bodies
+from tools.near_duplicates import NearDuplicateDetector
+
+
+def build_notes(n_notes: int, seed: int = 42) -> dict:
+    rng = random.Random(seed)
+    words = " ".join(sample_bodies()).split()
+    notes = {}
+    for i in range(n_notes):
+        if i % 10 == 9:
+            source = notes[f"note{rng.randrange(i - 1)}"].split()
+            source[rng.randrange(len(source))] = "edited"
+            notes[f"note{i}"] = " ".join(source + ["draft", "copy"])
+        else:
+            start = rng.randrange(len(words) - 400)
+            notes[f"note{i}"] = " ".join(words[start:start + rng.randrange(150, 400)])
+    return notes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=5000)
+    args = parser.parse_args()
+
+    notes = build_notes(args.notes)
+    detector = NearDuplicateDetector()
+
+    start = time.perf_counter()
+    for key, content in notes.items():
+        detector.add(key, content)
+    signatures = time.perf_counter() - start
+
+    start = time.perf_counter()
+    candidates = detector.candidate_pairs()
+    clusters = detector.clusters()
+    lsh = time.perf_counter() - start
+
+    all_pairs = len(notes) * (len(notes) - 1) // 2
+    print(f"🧬 {len(notes)} notes")
+    print(f"   signatures      {signatures * 1e3:>9.1f} ms ({signatures / len(notes) * 1e6:.0f} µs/note)")
+    print(f"   LSH + clusters  {lsh * 1e3:>9.1f} ms, {len(candidates)} candidate pairs "
+          f"(vs {all_pairs} all-pairs), {len(clusters)} clusters")
+
+    # All-pairs signature comparison on a sample, extrapolated
+    sample = list(detector.signatures.values())[:500]
+    start = time.perf_counter()
+    for i, first in enumerate(sample):
+        for second in sample[i + 1:]:
+            detector.similarity(first, second)
+    per_pair = (time.perf_counter() - start) / (len(sample) * (len(sample) - 1) // 2)
+    print(f"   all-pairs       {per_pair * all_pairs * 1e3:>9.1f} ms (extrapolated)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_page_memory.py
+
+"""
+Per-page memory: legacy page dicts (body included) vs PageRecord (lazy body)
+
+Usage: python benchmarks/bench_page_memory.py [--notes 50000]
+"""
+
+from pathlib import Path
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tools.obsidian_scanner import ObsidianScanner
+from synthetic_vault import build_vault
+
+
+def traced_bytes() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        vault = build_vault(Path(tmp) / "vault", args.notes, folders=200)
+        print(f"📂 Synthetic vault: {args.notes} notes ({time.perf_counter() - start:.1f}s to build)\n")
+
+        scanner = ObsidianScanner(str(vault))
+        tracemalloc.start()
+        baseline = traced_bytes()
+
+        pages = scanner.scan_vault()
+        with_body = traced_bytes() - baseline
+
+        for page in pages:
+            page.release_content()
+        records = traced_bytes() - baseline
+
+        # Legacy layout: one dict per page carrying every key + the full body
+        legacy = [page.to_dict() for page in pages]
+        del pages
+        dicts = traced_bytes() - baseline
+        tracemalloc.stop()
+
+        n = len(legacy)
+        print(f"{'layout':<34} {'total MB':>10} {'bytes/page':>11}")
+        for label, size in [
+            ("dict per page (legacy, body)", dicts),
+            ("PageRecord, body loaded", with_body),
+            ("PageRecord, body released (lazy)", records),
+        ]:
+            print(f"{label:<34} {size / 1e6:>10.1f} {size / n:>11.0f}")
+
+        print(f"\n💾 Saving per page: {(dicts - records) / n:.0f} bytes "
+              f"({100 * (1 - records / dicts):.0f}% less than legacy dicts)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# benchmarks/bench_platform_router.py
+
+"""
+Microbenchmark: compiled PlatformRouter vs the two old routing chains
+
+Both legacy implementations (ContentAnalyzer.suggest_platforms and the
+classify_content tool) are kept verbatim below. Runs over the notes in
+analysis_results.json repeated to --notes pages, then prints the
+per-rule hit counters of the batch run.
+
+Usage: python benchmarks/bench_platform_router.py [--notes 5000]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tools.lexicon import tokenize
+from tools.platform_router import PlatformRouter
+
+project_root = Path(__file__).parent.parent
+
+
+def legacy_suggest_platforms(page_data):
+    content = page_data["content"]
+    metadata = page_data["metadata"]
+    if "platforms" in metadata:
+        return metadata["platforms"]
+    suggested = []
+    if any(kw in content.lower() for kw in ["business", "strategy", "innovation", "ai", "tech"]):
+        suggested.append("linkedin")
+    if page_data["word_count"] < 500 or "announcement" in content.lower():
+        suggested.append("x")
+    if any(kw in content.lower() for kw in ["community", "event", "join", "share"]):
+        suggested.append("facebook")
+    if page_data["images"]:
+        suggested.append("instagram")
+    return suggested if suggested else ["linkedin", "x"]
+
+
+def legacy_classify_content(content, metadata):
+    if 'platforms' in metadata and metadata['platforms']:
+        return metadata['platforms']
+    platforms = []
+    tags = metadata.get('tags', [])
+    word_count = len(content.split())
+    if any(tag in ['tech', 'ai', 'professional', 'business', 'opensource', 'security'] for tag in tags) \
+            or word_count > 300:
+        platforms.append('linkedin')
+    if word_count < 280 or any(tag in ['update', 'news', 'quick'] for tag in tags):
+        platforms.append('x')
+    if 'visual' in tags or '![' in content:
+        platforms.append('instagram')
+    if any(tag in ['community', 'discussion', 'social'] for tag in tags):
+        platforms.append('facebook')
+    return platforms or ['linkedin']
+
+
+def timed(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=5000)
+    args = parser.parse_args()
+
+    with open(project_root / "analysis_results.json", 'r', encoding='utf-8') as f:
+        notes = json.load(f)
+    pages = []
+    for i in range(args.notes):
+        note = notes[i % len(notes)]
+        metadata = {key: value for key, value in note.get("metadata", {}).items() if key != "platforms"}
+        pages.append({"content": note["content"], "metadata": metadata,
+                      "word_count": len(note["content"].split()), "images": note.get("images", [])})
+
+    router, compile_time = timed(PlatformRouter)
+    _, analyzer_time = timed(lambda: [legacy_suggest_platforms(page) for page in pages])
+    _, classifier_time = timed(lambda: [legacy_classify_content(page["content"], page["metadata"]) for page in pages])
+    routes, batch_time = timed(lambda: router.route_batch(pages))
+
+    tokens = [tokenize(page["content"]) for page in pages]
+    _, tokens_time = timed(lambda: PlatformRouter().route_batch(pages, tokens))
+
+    print(f"{len(pages)} notes (compile rules: {compile_time * 1e3:.1f} ms)\n")
+    print(f"legacy suggest_platforms   {analyzer_time * 1e3:>9.1f} ms")
+    print(f"legacy classify_content    {classifier_time * 1e3:>9.1f} ms")
+    print(f"  both chains              {(analyzer_time + classifier_time) * 1e3:>9.1f} ms")
+    print(f"route_batch (raw text)     {batch_time * 1e3:>9.1f} ms  "
+          f"({(analyzer_time + classifier_time) / batch_time:.2f}x vs both)")
+    print(f"route_batch (with tokens)  {tokens_time * 1e3:>9.1f} ms  (tokens shared with analyze())")
+
+    agree = sum(1 for page, route in zip(pages, routes) if legacy_suggest_platforms(page) == route.platforms)
+    print(f"\nsame platforms as suggest_platforms: {agree}/{len(pages)}\n")
+    for line in router.report():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
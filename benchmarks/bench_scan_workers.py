@@ -0,0 +1,50 @@
+# benchmarks/bench_scan_workers.py
+
+"""
+Scan time vs worker count for ObsidianScanner.scan_vault
+
+Usage: python benchmarks/bench_scan_workers.py [--notes 5000] [--workers 1 2 4 8]
+"""
+
+from pathlib import Path
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tools.obsidian_scanner import ObsidianScanner
+from synthetic_vault import build_vault
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = build_vault(Path(tmp) / "vault", args.notes)
+        print(f"📂 Synthetic vault: {args.notes} notes | CPUs: {os.cpu_count()}\n")
+        print(f"{'workers':>8} {'best (s)':>10} {'notes/s':>10} {'speedup':>8}")
+
+        baseline = None
+        for workers in args.workers:
+            scanner = ObsidianScanner(str(vault))
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                pages = scanner.scan_vault(workers=workers)
+                timings.append(time.perf_counter() - start)
+
+            best = min(timings)
+            baseline = baseline or best
+            print(f"{workers:>8} {best:>10.3f} {len(pages) / best:>10.0f} {baseline / best:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/bench_tone_classifier.py
+
+"""
+Microbenchmark: batched ToneClassifier vs the old per-note analyze_tone
+
+The legacy loop (substring scan per tone keyword, argmax that falls on
+"professional" when nothing matches) is kept verbatim below. Runs over
+the notes in analysis_results.json repeated to --notes pages.
+
+Usage: python benchmarks/bench_tone_classifier.py [--notes 5000]
+"""
+
+from collections import Counter
+from pathlib import Path
+import argparse
+import json
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tools.tone_classifier import ToneClassifier
+
+project_root = Path(__file__).parent.parent
+
+
+def legacy_analyze_tone(content):
+    content_lower = content.lower()
+    tones = {
+        "professional": ["business", "enterprise", "solution", "strategy", "innovation"],
+        "technical": ["code", "api", "system", "architecture", "implementation"],
+        "casual": ["hey", "awesome", "cool", "love", "excited"],
+        "educational": ["learn", "guide", "tutorial", "how to", "step by step"]
+    }
+    tone_scores = {}
+    for tone, keywords in tones.items():
+        tone_scores[tone] = sum(1 for kw in keywords if kw in content_lower)
+    return max(tone_scores, key=tone_scores.get) if tone_scores else "neutral"
+
+
+def timed(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, default=5000)
+    args = parser.parse_args()
+
+    with open(project_root / "analysis_results.json", 'r', encoding='utf-8') as f:
+        bodies = [page["content"] for page in json.load(f)]
+    notes = [bodies[i % len(bodies)] for i in range(args.notes)]
+
+    classifier, compile_time = timed(ToneClassifier)
+    legacy, legacy_time = timed(lambda: [legacy_analyze_tone(note) for note in notes])
+    batch, batch_time = timed(lambda: classifier.classify_batch(notes))
+
+    signals = [classifier.matcher.match_text(note) for note in notes]
+    _, product_time = timed(lambda: classifier.classify_signals(signals))
+
+    print(f"{len(notes)} notes (compile lexicons: {compile_time * 1e3:.1f} ms)\n")
+    print(f"legacy analyze_tone loop   {legacy_time * 1e3:>9.1f} ms")
+    print(f"classify_batch             {batch_time * 1e3:>9.1f} ms  ({legacy_time / batch_time:.2f}x)")
+    print(f"  of which X·W + results   {product_time * 1e3:>9.1f} ms")
+
+    agree = sum(1 for old, new in zip(legacy, batch) if old == new.tone)
+    print(f"\nsame label: {agree}/{len(notes)}   neutral: {sum(r.tone == 'neutral' for r in batch)}   "
+          f"tied: {sum(len(r.ties) > 1 for r in batch)}")
+    print("labels:", dict(Counter(result.tone for result in batch)))
+
+
+if __name__ == "__main__":
+    main()
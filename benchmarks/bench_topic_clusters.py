@@ -0,0 +1,50 @@
+# benchmarks/bench_topic_clusters.py
+
+"""
+Benchmark: topic clustering (spherical k-means over TF-IDF) at vault scale
+
+Builds a KeywordIndex over synthetic notes (random runs of the real note
+bodies), then times TopicClusterer.fit: full k-means below
+4 × batch_size notes, mini-batch k-means + one assignment pass above.
+No pairwise note × note matrix is ever built.
+
+Usage: python benchmarks/bench_topic_clusters.py [--notes 50000] [--topics N]
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_keyword_index import synthetic_notes
+from tools.keyword_index import KeywordIndex
+from tools.topic_clusters import TopicClusterer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notes", type=int, nargs="+", default=[1000, 8000, 50000])
+    parser.add_argument("--topics", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"{'notes':>7} {'topics':>7} {'mode':>10} {'iters':>6} {'fit s':>7} {'largest':>8}")
+    for n_notes in args.notes:
+        index = KeywordIndex()
+        for i, note in enumerate(synthetic_notes(n_notes)):
+            index.add(f"Note {i}.md", note, str(i))
+
+        clusterer = TopicClusterer(n_topics=args.topics)
+        start = time.perf_counter()
+        labels, topics = clusterer.fit(index)
+        elapsed = time.perf_counter() - start
+
+        mode = "mini-batch" if n_notes > 4 * clusterer.batch_size else "full"
+        print(f"{n_notes:>7} {len(topics):>7} {mode:>10} {clusterer.iterations:>6} {elapsed:>7.2f} "
+              f"{len(topics[0].members):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# benchmarks/synthetic_vault.py
+
+"""Build throwaway Obsidian vaults for the benchmark scripts"""
+
+from pathlib import Path
+import json
+import random
+
+project_root = Path(__file__).parent.parent
+
+FALLBACK_WORDS = (
+    "local first security agent orchestration vault note privacy crew widget "
+    "threat monitor process network model ollama llama pipeline release build"
+).split()
+
+
+def sample_bodies() -> list:
+    """Real note bodies from analysis_results.json when available, else lorem-style text"""
+    results_file = project_root / "analysis_results.json"
+    if results_file.exists():
+        with open(results_file, 'r', encoding='utf-8') as f:
+            bodies = [page["content"] for page in json.load(f) if page.get("content")]
+        if bodies:
+            return bodies
+
+    rng = random.Random(42)
+    return [" ".join(rng.choice(FALLBACK_WORDS) for _ in range(rng.randint(50, 1500)))
+            for _ in range(50)]
+
+
+def build_vault(root: Path, n_notes: int, folders: int = 20, seed: int = 42) -> Path:
+    """Write n_notes markdown files (frontmatter + real-ish bodies) under root"""
+    rng = random.Random(seed)
+    bodies = sample_bodies()
+
+    for i in range(n_notes):
+        folder = root / f"Folder_{i % folders:02d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        body = bodies[i % len(bodies)]
+        links = " ".join(f"[[Note {rng.randrange(n_notes)}]]" for _ in range(3))
+        (folder / f"Note {i}.md").write_text(
+            f"---\ntitle: Note {i}\ntags: [tech, ai]\n---\n{body}\n\n{links}\n",
+            encoding='utf-8',
+        )
+
+    return root
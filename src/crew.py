@@ -38,13 +38,16 @@ class SocialCrewAI:
         self.facebook_writer = create_facebook_writer(self.llm)
         self.instagram_writer = create_instagram_writer(self.llm)
     
-    def process_staging_content(self):
+    def process_staging_content(self, notes: list = None):
         """
         Main pipeline: Read staging notes → Filter → Route → Generate
+        
+        Pass `notes` (e.g. from the watcher) to skip rescanning the folder
         """
         
-        print("🔍 Scanning staging folder...")
-        notes = self.vault_reader.read_staging_notes()
+        if notes is None:
+            print("🔍 Scanning staging folder...")
+            notes = self.vault_reader.read_staging_notes()
         
         if not notes:
             print("⚠️ No ready notes found in staging folder")
@@ -62,7 +65,7 @@ class SocialCrewAI:
             )
             
             if not is_safe:
-                print(f"⚠️ BLOCKED: {note['title']} contains sensitive content")
+                print(f"⚠️ BLOCKED: {note['title']} contains sensitive content ({is_safe.reason})")
                 continue
             
             # Classify content
@@ -73,6 +76,16 @@ class SocialCrewAI:
             for platform in classification['platforms']:
                 self.generate_platform_content(note, platform)
     
+    def watch_staging_content(self, debounce: float = 1.0):
+        """
+        Daemon mode: process each note as soon as it's saved with `ready: true`
+        """
+        try:
+            for notes in self.vault_reader.watch_staging_notes(debounce=debounce):
+                self.process_staging_content(notes)
+        except KeyboardInterrupt:
+            print("\n🛑 Stopped watching")
+    
     def generate_platform_content(self, note: dict, platform: str):
         """
         Generate platform-specific content using appropriate writer
@@ -1,5 +1,6 @@
 # src/main.py
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -10,12 +11,25 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.crew import SocialCrewAI
+from src.tools.console import configure_logging
 
 def main():
     """
     Main entry point for Socials_CrewAI
     """
     
+    parser = argparse.ArgumentParser(description="Socials_CrewAI staging pipeline")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and process staging notes as they become ready")
+    parser.add_argument("--debounce", type=float, default=1.0,
+                        help="Seconds a note must be quiet before it's processed (watch mode)")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Console verbosity of the phase + tool loggers (default: INFO)")
+    args = parser.parse_args()
+    
+    # Shared entry point: phase 1-3 summaries are logged, not printed
+    configure_logging(args.log_level)
+    
     # Load environment variables
     load_dotenv()
     
@@ -34,7 +48,10 @@ def main():
     crew = SocialCrewAI(vault_path=vault_path)
     
     # Process staging content
-    crew.process_staging_content()
+    if args.watch:
+        crew.watch_staging_content(debounce=args.debounce)
+    else:
+        crew.process_staging_content()
     
     print("✅ Processing complete!")
 
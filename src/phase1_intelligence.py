@@ -8,121 +8,495 @@ sys.path.insert(0, str(project_root))
 
 from tools.obsidian_scanner import ObsidianScanner
 from tools.content_analyzer import ContentAnalyzer
+from tools.platform_router import ROUTING_CONFIG, default_router
 from tools.ip_filter import PresenceBasedIPFilter
+from tools.near_duplicates import NearDuplicateDetector
+from tools.keyword_index import KeywordIndex
+from tools.topic_clusters import TopicClusterer
+from tools.presence_cache import NO_MATCH
+from tools.stage_metrics import StageMetrics
+from tools.jsonl_store import JsonlWriter, jsonl_path, write_jsonl
+from tools.blob_store import BlobStore
+from tools.checkpoints import Checkpoint, Plan, file_fingerprint, fingerprint
+from tools.scan_manifest import hash_bytes
+from tools.tone_classifier import TONES_CONFIG
+from tools.console import configure_logging
 
-from typing import List, Dict
+from typing import Iterator, List, Dict
+import heapq
 import json
+import logging
 import os
 from dotenv import load_dotenv
 
+logger = logging.getLogger("phase1")
+
+# Bump when the per-note analysis changes, so checkpointed analyses are redone
+ANALYSIS_VERSION = 2
+
+BLOCKED = {"blocked": True}  # checkpoint output of a blocked note
+
 
 class ContentIntelligence:
     """Phase 1: Scan vault, analyze, filter, and extract images"""
     
-    def __init__(self, vault_path: str):
-        self.scanner = ObsidianScanner(vault_path)
+    def __init__(self, vault_path: str, cache_dir: str = None,
+                 include: List[str] = None, exclude: List[str] = None):
+        cache_dir = self.cache_dir = Path(cache_dir or Path(__file__).parent.parent / ".cache")
+        self.scanner = ObsidianScanner(vault_path, cache_dir=cache_dir, include=include, exclude=exclude)
+        self.duplicates = NearDuplicateDetector(cache_dir / "minhash.pkl")
+        self.keywords = KeywordIndex(cache_dir / "keywords.pkl")
+        self.bodies = BlobStore(cache_dir / "bodies")
+        self.clusterer = TopicClusterer()
+        self.topics = []
+        self.rebuilt = []  # note keys whose checkpoint entry the last run (re)built
         self.analyzer = ContentAnalyzer()
-        self.ip_filter = PresenceBasedIPFilter(vault_path)
+        self.ip_filter = PresenceBasedIPFilter(vault_path, cache_dir=cache_dir)
+        self.metrics = StageMetrics("phase1")
     
-    def run(self, filter_unsafe: bool = True) -> tuple:
+    def run(self, filter_unsafe: bool = True, incremental: bool = False, workers: int = 1,
+            force: bool = False, blocked_writer: JsonlWriter = None) -> tuple:
         """Execute Phase 1: Scan, analyze, filter + images
         
-        Returns: (safe_pages, blocked_pages)
+        Pages are streamed from the scanner: each one is filtered, analyzed
+        and reduced to its compact record before the next is read, so the
+        note bodies are never all held in memory at once.
+        
+        incremental=True only re-parses notes changed since the last run,
+        workers > 1 parses pages on a process pool
+        
+        A safe note's analysis (tone, platforms, keywords, body hash) is
+        reused from the phase 1 checkpoint when the note's content hash
+        and the config fingerprint are unchanged; force=True analyzes
+        every note again. Presence.md changes daily, so it isn't part of
+        the config: a reused analysis only gets its presence mentions
+        re-scored when today's public narrative differs from the one
+        they were scored against. self.rebuilt lists the notes whose
+        checkpoint entry was (re)built, what plan() predicts.
+        
+        Blocked records are final as soon as the filter rejects a note: with
+        a blocked_writer they are streamed to it (blocked_content.jsonl)
+        instead of being collected, and the returned list stays empty.
+        
+        Every stage is timed into self.metrics: walk, then per page parse,
+        filter + analyze (one latency sample each), then the corpus-wide
+        keywords, topics, duplicates + bodies stages (save_analysis adds
+        serialize).
+        
+        Returns: (safe_records, blocked_pages)
         """
-        print("🔍 Phase 1: Content Intelligence + IP Protection + Images")
-        print("=" * 60)
+        logger.info("🔍 Phase 1: Content Intelligence + IP Protection + Images")
+        logger.info("=" * 60)
         
         # Scan vault
-        print(f"📂 Scanning vault...")
-        pages = self.scanner.scan_vault()
-        print(f"✅ Found {len(pages)} pages\n")
+        logger.info("📂 Scanning vault...\n")
+        
+        metrics = self.metrics = StageMetrics("phase1")
+        for stage in ("walk", "parse", "filter", "analyze"):
+            metrics.stage(stage)
+        
+        self.duplicates.load()
+        self.keywords.load()
+        self.bodies.load()
+        default_router().reset_stats()  # the shared router's report covers this run only
+        
+        # Today's presence index, fetched once for the whole run
+        presence = self.ip_filter.presence
+        presence_key = self._presence_key(presence)
+        presence_fingerprint = fingerprint(presence_key, presence.public_narrative)
+        checkpoint = self.checkpoint().load()
         
         # Analyze + Filter each page
         safe_pages = []
         blocked_pages = []
+        blocked_count = 0
+        total_scanned = 0
+        seen = set()
+        self.rebuilt = []
+        rescored = 0
         
-        for page in pages:
-            print(f"📄 Analyzing: {page['title']}")
+        # Per-page lines are DEBUG, formatted lazily: free unless asked for
+        pages = self.scanner.iter_vault(incremental=incremental, workers=workers)
+        while True:
+            with metrics.measure("parse") as parsing:
+                page = next(pages, None)
+                if page is None:
+                    parsing.items, parsing.sample = 0, False  # end of scan: manifest + caches saved
+            if page is None:
+                break
+            
+            total_scanned += 1
+            note_key = self.scanner.note_key(page["file_path"])
+            seen.add(note_key)
+            logger.debug("📄 Analyzing: %s", page["title"])
             
-            # IP FILTER CHECK
-            is_safe = self.ip_filter.is_safe_to_share(
-                page["content"], 
-                page["metadata"]
-            )
+            # IP FILTER CHECK (cached per content hash + tags + ruleset)
+            with metrics.measure("filter"):
+                is_safe = self.ip_filter.check_page(page)
             
             if not is_safe:
-                print(f"   🚨 BLOCKED: Private/vault-only/sensitive content")
-                blocked_pages.append({
+                logger.debug("   🚨 BLOCKED: Private/vault-only/sensitive content (%s)", is_safe.reason)
+                if force or checkpoint.output(note_key, page["content_hash"]) != BLOCKED:
+                    checkpoint.record(note_key, page["content_hash"], BLOCKED)
+                    self.rebuilt.append(note_key)
+                blocked = {
                     "title": page["title"],
-                    "reason": "IP/Privacy protection"
-                })
+                    "reason": "IP/Privacy protection",
+                    "rule": is_safe.rule,
+                    "rule_kind": is_safe.kind,
+                    "position": is_safe.position,
+                }
+                blocked_count += 1
+                if blocked_writer is not None:
+                    blocked_writer.write(blocked)
+                else:
+                    blocked_pages.append(blocked)
                 continue
             
-            # Add analysis
-            page["tone"] = self.analyzer.analyze_tone(page["content"])
-            page["suggested_platforms"] = self.analyzer.suggest_platforms(page)
-            page["keywords"] = self.analyzer.extract_keywords(page["content"])
-            page["is_safe"] = True
-            
-            safe_pages.append(page)
+            with metrics.measure("analyze"):
+                # Per-note analysis, reused from the checkpoint while note + config are unchanged
+                analysis = None if force else checkpoint.output(note_key, page["content_hash"])
+                if analysis is None or not self.bodies.keep(analysis.get("body_hash")):
+                    analysis = self._analyze(page)
+                    self.rebuilt.append(note_key)
+                
+                # Mentioned in today's Presence.md? Only re-scored when the public narrative changed
+                if analysis.get("presence_fingerprint") != presence_fingerprint:
+                    if "presence_fingerprint" in analysis:
+                        rescored += 1
+                    mention = self._mention(page, note_key, presence, presence_key)
+                    analysis = {**analysis, "presence_score": mention.score, "presence_lines": mention.lines,
+                                "presence_fingerprint": presence_fingerprint}
+                    checkpoint.record(note_key, page["content_hash"], analysis)
+                
+                page["tone"] = analysis["tone"]
+                page["tone_confidence"] = analysis["tone_confidence"]
+                page["suggested_platforms"] = analysis["platforms"]
+                page["keywords"] = analysis["keywords"]
+                page["is_safe"] = True
+                
+                # MinHash signature + term counts for the corpus keyword stage, cached per
+                # content hash: the (lazy) body is only read on a cache miss
+                body = lambda: page["content"]
+                self.duplicates.add(note_key, body, page["content_hash"])
+                self.keywords.add(note_key, body, page["content_hash"])
+                
+                # Keep only the compact record, the full page is released here
+                record = self._to_record(page, note_key)
+                record["presence_score"] = analysis["presence_score"]
+                record["presence_lines"] = analysis["presence_lines"]
+                record["body_hash"] = analysis["body_hash"]
+                safe_pages.append(record)
             
             # Show image info
-            img_status = f"🖼️  {page['image_count']} images" if page["image_count"] > 0 else "📝 No images"
-            print(f"   ✅ SAFE: {page['tone']} → {', '.join(page['suggested_platforms'])} | {img_status}")
+            logger.debug("   ✅ SAFE: %s → %s | %s", page["tone"], ", ".join(page["suggested_platforms"]),
+                         f"🖼️  {page['image_count']} images" if page["image_count"] > 0 else "📝 No images")
+        
+        walk = self.scanner.last_walk_stats
+        self._split_walk(walk)
+        
+        # Only notes scanned this run stay recorded (scan errors are retried next run)
+        checkpoint.retain(seen)
+        checkpoint.save()
         
-        print(f"\n📊 Summary:")
-        print(f"   Total scanned: {len(pages)}")
-        print(f"   ✅ Safe to share: {len(safe_pages)}")
-        print(f"   🚨 Blocked (private/IP): {len(blocked_pages)}")
+        logger.info(f"\n✅ Found {total_scanned} pages")
+        logger.info(f"   ♻️  Checkpoint: {len(self.rebuilt)} rebuilt, {total_scanned - len(self.rebuilt)} reused, "
+                    f"{rescored} re-scored against Presence.md" + (" (forced)" if force else ""))
+        logger.info(f"   🚶 Walked {walk['entries_visited']} entries in {walk['dirs_visited']} folders, "
+                    f"skipped {walk['dirs_skipped']} folders + {walk['files_skipped']} notes")
+        graph = self.scanner.link_graph
+        logger.info(f"   🕸️  Link graph: {len(graph)} notes, {graph.edge_count} resolved links, "
+                    f"{len(graph.orphans())} orphans")
+        if incremental:
+            stats = self.scanner.last_scan_stats
+            logger.info(f"   ♻️  Incremental: +{stats['added']} added, ~{stats['changed']} changed, "
+                        f"-{stats['removed']} removed, {stats['unchanged']} unchanged")
+        
+        with metrics.measure("keywords", items=len(safe_pages), sample=False):
+            self._rank_keywords(safe_pages)
+        with metrics.measure("topics", items=len(safe_pages), sample=False):
+            self._cluster_topics(safe_pages)
+        with metrics.measure("duplicates", items=len(safe_pages), sample=False):
+            clusters = self._mark_duplicates(safe_pages)
+            self.duplicates.save()
+        with metrics.measure("bodies", items=len(safe_pages), sample=False):
+            self.bodies.save()
+        logger.info(f"   📦 Bodies: {len(self.bodies)} stored ({self.bodies.size / 1e6:.1f} MB compressed), "
+                    f"{self.bodies.added} added, {self.bodies.reused} reused")
+        with metrics.measure("filter", items=0, sample=False):
+            self.ip_filter.save_decisions()
+        decisions = self.ip_filter.decisions
+        if decisions is not None:
+            logger.info(f"   🛡️  IP decisions: {decisions.hits} cached, {decisions.misses} filtered")
+        logger.info(f"   🧭 Routing rules (hits/evaluated, time):")
+        for line in default_router().report():
+            logger.info(f"      {line}")
+        
+        # "Mentioned today" are listed first when saved (see _presence_order)
+        mentioned = sum(1 for record in safe_pages if record["presence_score"] >= 2)
+        
+        logger.info(f"\n📊 Summary:")
+        logger.info(f"   Total scanned: {total_scanned}")
+        logger.info(f"   ✅ Safe to share: {len(safe_pages)}")
+        logger.info(f"   🚨 Blocked (private/IP): {blocked_count}")
+        logger.info(f"   📣 Mentioned in today's presence: {mentioned} (listed first)")
+        logger.info(f"   🧬 Near-duplicate clusters: {len(clusters)} "
+                    f"({sum(len(cluster) for cluster in clusters)} pages → {len(clusters)} proposals)")
         
         # Image stats
         total_images = sum(page.get("image_count", 0) for page in safe_pages)
-        print(f"   🖼️  Total images found: {total_images}")
+        logger.info(f"   🖼️  Total images found: {total_images}")
+        
+        metrics.counts.update({
+            "scanned": total_scanned,
+            "rebuilt": len(self.rebuilt),
+            "rescored": rescored,
+            "safe": len(safe_pages),
+            "blocked": blocked_count,
+            "mentioned": mentioned,
+            "duplicate_clusters": len(clusters),
+            "topics": len(self.topics),
+            "images": total_images,
+            "parse_errors": len(self.scanner.last_scan_errors),
+            **{f"walk_{key}": value for key, value in walk.items() if not key.endswith("_ns")},
+            **({f"scan_{key}": value for key, value in self.scanner.last_scan_stats.items()} if incremental else {}),
+        })
+        logger.info(f"\n⏱️  Stages:")
+        for line in metrics.report():
+            logger.info(f"   {line}")
         
         return safe_pages, blocked_pages
     
-    def save_analysis(self, safe_pages: List[Dict], blocked_pages: List[Dict]):
-        """Save analysis + image info to JSON files"""
-        output_path = Path(__file__).parent.parent
+    def _split_walk(self, walk: Dict):
+        """Move the vault walk (timed by the scanner, before the first page) out of the parse stage"""
+        parse = self.metrics.stage("parse")
+        wall_ns, cpu_ns = walk.get("wall_ns", 0), walk.get("cpu_ns", 0)
+        self.metrics.stage("walk").add(wall_ns, cpu_ns, items=walk.get("entries_visited", 0), sample=False)
+        parse.wall_ns -= wall_ns
+        parse.cpu_ns -= cpu_ns
+        if parse.latencies:
+            parse.latencies[0] -= wall_ns
+    
+    def checkpoint(self) -> Checkpoint:
+        """Phase 1 checkpoint: note key → content hash + analysis, under the current config"""
+        return Checkpoint(self.cache_dir / "checkpoints" / "phase1.pkl", self.config_fingerprint())
+    
+    def config_fingerprint(self) -> str:
+        """Everything a note's analysis depends on besides the note: code version, block rules, lexicons (not Presence.md)"""
+        return fingerprint(ANALYSIS_VERSION, self.ip_filter.rules_fingerprint(),
+                           file_fingerprint(TONES_CONFIG, ROUTING_CONFIG))
+    
+    def plan(self, force: bool = False) -> Plan:
+        """Which notes a run would analyze again (dry run: walks + hashes the vault, writes nothing)"""
+        inputs = {key: hash_bytes(path.read_bytes()) for key, path in self.scanner.note_paths()}
+        return self.checkpoint().load().plan(inputs, force)
+    
+    def _analyze(self, page) -> Dict:
+        """Presence-independent per-note analysis, as recorded in the checkpoint (run() adds the presence mentions)"""
+        # One tokenizer pass for tone, platforms + keywords
+        analysis = self.analyzer.analyze(page)
+        
+        return {
+            "tone": analysis["tone"],
+            "tone_confidence": analysis["tone_confidence"],
+            "platforms": analysis["platforms"],
+            "keywords": analysis["keywords"],
+            # Body for Phase 2/3, by hash (identical bodies stored once)
+            "body_hash": self.bodies.put(page["content"]),
+        }
+    
+    @staticmethod
+    def _mention(page, note_key: str, presence, presence_key: str):
+        """Presence match of a note (inverted index lookups), the presence note never scores against itself"""
+        if note_key == presence_key:
+            return NO_MATCH
+        return presence.match(f"{page['title']}\n{page['content']}")
+    
+    def _presence_key(self, presence) -> str:
+        """Note key of the presence note itself (it shouldn't score against itself)"""
+        try:
+            return presence.path.relative_to(self.scanner.vault_path.resolve()).as_posix()
+        except (AttributeError, ValueError):
+            return None
+    
+    def _rank_keywords(self, safe_pages: List[Dict]):
+        """
+        Replace each record's keywords with its top TF-IDF terms over the safe corpus
+        
+        Blocked notes are never indexed, so their words can't surface as
+        keywords nor end up in the keyword cache.
+        """
+        dropped = self.keywords.prune(page["note_key"] for page in safe_pages)
+        top = self.keywords.top_keywords([page["note_key"] for page in safe_pages])
+        for page in safe_pages:
+            page["keywords"] = top.get(page["note_key"], page["keywords"])
+        self.keywords.save()
+        
+        logger.info(f"   🔑 Keywords: TF-IDF over {len(self.keywords)} notes, {self.keywords.term_count} terms "
+                    f"({self.keywords.cache_hits} cached, {dropped} dropped)")
+    
+    def _cluster_topics(self, safe_pages: List[Dict]):
+        """
+        Group safe pages into topics (spherical k-means over their TF-IDF vectors)
         
-        # Clean + save safe pages with image info
-        clean_safe = []
+        Every record gets topic_id (None for notes without indexed terms);
+        self.topics keeps each topic's members, top terms + centroid for
+        topics.json, which Phase 2 can turn into one proposal per topic.
+        """
+        labels, topics = self.clusterer.fit(self.keywords, [page["note_key"] for page in safe_pages])
         for page in safe_pages:
-            clean_page = {
-                "title": page["title"],
-                "file_name": page["file_name"],
-                "tone": page["tone"],
-                "platforms": page["suggested_platforms"],
-                "keywords": page["keywords"],
-                "word_count": page["word_count"],
-                "images": page.get("images", []),  # ← Image paths!
-                "image_count": page.get("image_count", 0),
-            }
-            clean_safe.append(clean_page)
-        
-        with open(output_path / "safe_content.json", 'w', encoding='utf-8') as f:
-            json.dump(clean_safe, f, indent=2, ensure_ascii=False)
-        print(f"\n✅ Safe content saved to: safe_content.json ({len(clean_safe)} items)")
-        
-        # Save blocked pages for review
-        with open(output_path / "blocked_content.json", 'w', encoding='utf-8') as f:
-            json.dump(blocked_pages, f, indent=2, ensure_ascii=False)
-        print(f"🚨 Blocked content saved to: blocked_content.json ({len(blocked_pages)} items)")
+            page["topic_id"] = labels.get(page["note_key"])
+        
+        self.topics = [topic._asdict() for topic in topics]
+        logger.info(f"   🗂️  Topics: {len(topics)} over {len(labels)} notes "
+                    f"({self.clusterer.iterations} k-means iterations)")
+        for topic in topics[:5]:
+            logger.info(f"      #{topic.topic_id} ({len(topic.members)}): {', '.join(topic.top_terms[:5])}")
+    
+    def _mark_duplicates(self, safe_pages: List[Dict]) -> List[List[str]]:
+        """
+        Cluster near-duplicate safe pages (MinHash + LSH)
+        
+        Every record gets cluster_id (None if it has no duplicates) and
+        canonical; within a cluster the longest page is canonical, and
+        Phase 2 only turns canonical pages into proposals.
+        """
+        by_key = {page["note_key"]: page for page in safe_pages}
+        for page in safe_pages:
+            page["cluster_id"] = None
+            page["canonical"] = True
+        
+        clusters = self.duplicates.clusters()
+        for cluster_id, members in enumerate(clusters, 1):
+            canonical = max(members, key=lambda key: (by_key[key]["word_count"], by_key[key]["image_count"], key))
+            for key in members:
+                by_key[key]["cluster_id"] = cluster_id
+                by_key[key]["canonical"] = key == canonical
+            logger.debug(f"   🧬 Duplicates: {', '.join(by_key[key]['title'] for key in members)} "
+                        f"→ keeping '{by_key[canonical]['title']}'")
+        
+        return clusters
+    
+    @staticmethod
+    def _to_record(page: Dict, note_key: str) -> Dict:
+        """Reduce an analyzed page to the fields saved in safe_content.jsonl (body goes to the blob store)"""
+        return {
+            "title": page["title"],
+            "file_name": page["file_name"],
+            "note_key": note_key,  # vault-relative path, the link graph node
+            "tone": page["tone"],
+            "tone_confidence": page["tone_confidence"],  # share of the winning tone (0.0 = neutral)
+            "platforms": page["suggested_platforms"],
+            "keywords": page["keywords"],
+            "word_count": page["word_count"],
+            "images": page.get("images", []),  # ← Image paths!
+            "image_count": page.get("image_count", 0),
+        }
+    
+    @staticmethod
+    def _presence_order(safe_pages: List[Dict]) -> Iterator[Dict]:
+        """
+        Safe records, today's presence mentions first
+
+        Mentioned notes (usually a handful) come off a heap by score, ties
+        in vault order; the rest follow in vault order. Same order as a
+        stable sort by score, without sorting or copying the corpus.
+        """
+        heap = [(-record["presence_score"], index) for index, record in enumerate(safe_pages)
+                if record["presence_score"] > 0]
+        heapq.heapify(heap)
+        while heap:
+            yield safe_pages[heapq.heappop(heap)[1]]
+        for record in safe_pages:
+            if record["presence_score"] <= 0:
+                yield record
+    
+    def save_analysis(self, safe_pages: List[Dict], blocked_pages: List[Dict] = None, metrics_path: str = None,
+                      compression: str = None):
+        """
+        Save analysis + image info as JSONL, then the run's stage metrics
+        
+        Records are streamed one compact line each (orjson when installed)
+        into safe_content.jsonl / blocked_content.jsonl, gzip- or
+        zstd-compressed (.gz / .zst) if asked; Phase 2 reads them lazily.
+        blocked_pages=None: run() already streamed them to its blocked_writer.
+        """
+        output_path = project_root
+        safe_path = jsonl_path(output_path / "safe_content.jsonl", compression)
+        blocked_path = jsonl_path(output_path / "blocked_content.jsonl", compression)
+        blocked_count = self.metrics.counts.get("blocked", 0) if blocked_pages is None else len(blocked_pages)
+        
+        with self.metrics.measure("serialize", items=len(safe_pages) + blocked_count, sample=False):
+            write_jsonl(safe_path, self._presence_order(safe_pages))
+            logger.info(f"\n✅ Safe content saved to: {safe_path.name} ({len(safe_pages)} items, mentions first)")
+            
+            # Save blocked pages for review
+            if blocked_pages is not None:
+                write_jsonl(blocked_path, blocked_pages)
+            logger.info(f"🚨 Blocked content saved to: {blocked_path.name} ({blocked_count} items)")
+            
+            # Topics (members, top terms, centroids) for topic-level proposals
+            with open(output_path / "topics.json", 'w', encoding='utf-8') as f:
+                json.dump(self.topics, f, indent=2, ensure_ascii=False)
+            logger.info(f"🗂️  Topics saved to: topics.json ({len(self.topics)} topics)")
+        
+        # Wall/CPU time, item counts + per-page latency percentiles per stage
+        metrics_path = Path(metrics_path or output_path / "phase1_metrics.json")
+        self.metrics.save(metrics_path)
+        logger.info(f"⏱️  Stage metrics saved to: {metrics_path.name}")
 
 
 # Test runner
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Phase 1: Content Intelligence")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only re-parse notes changed since the last scan")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parse pages across N processes (default: 1)")
+    parser.add_argument("--include", action="append", metavar="GLOB",
+                        help="Only scan notes matching this vault-relative glob (repeatable; "
+                             "* stays within a folder, ** crosses folders: 'Projects/**')")
+    parser.add_argument("--exclude", action="append", metavar="GLOB",
+                        help="Skip notes/folders matching this vault-relative glob (repeatable, same syntax)")
+    parser.add_argument("--force", action="store_true",
+                        help="Analyze every note again, ignoring the checkpoint")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="List the notes a run would analyze again, then exit (writes nothing)")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Console verbosity, DEBUG adds a line per page (default: INFO)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="No console output at all (metrics + results are still written)")
+    parser.add_argument("--compress", choices=["none", "gzip", "zstd"], default="none",
+                        help="Compress safe_content.jsonl / blocked_content.jsonl (default: none)")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="Stage metrics JSON (default: phase1_metrics.json)")
+    args = parser.parse_args()
+    
+    configure_logging(args.log_level, args.quiet)
+    
     env_path = Path(__file__).parent.parent / ".env"
     load_dotenv(dotenv_path=env_path)
     
     vault_path = os.getenv("OBSIDIAN_VAULT_PATH")
     
     if not vault_path:
-        print("❌ OBSIDIAN_VAULT_PATH not set in .env")
+        logger.error("❌ OBSIDIAN_VAULT_PATH not set in .env")
         exit(1)
     
-    print(f"🔍 Vault path: {vault_path}\n")
+    logger.info(f"🔍 Vault path: {vault_path}\n")
+    
+    intelligence = ContentIntelligence(vault_path, include=args.include, exclude=args.exclude)
+    if args.dry_run:
+        for line in intelligence.plan(force=args.force).describe():
+            logger.info(f"🧪 {line}")
+        exit(0)
     
-    intelligence = ContentIntelligence(vault_path)
-    safe_pages, blocked_pages = intelligence.run(filter_unsafe=True)
-    intelligence.save_analysis(safe_pages, blocked_pages)
+    # Blocked records are streamed to blocked_content.jsonl during the scan
+    with JsonlWriter(jsonl_path(project_root / "blocked_content.jsonl", args.compress)) as blocked_writer:
+        safe_pages, _ = intelligence.run(
+            filter_unsafe=True, incremental=args.incremental, workers=args.workers, force=args.force,
+            blocked_writer=blocked_writer
+        )
+    intelligence.save_analysis(safe_pages, metrics_path=args.metrics, compression=args.compress)
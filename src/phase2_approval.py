@@ -1,17 +1,30 @@
 # src/phase2_approval.py (UPGRADED VERSION)
 
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict
 import json
+import logging
+import os
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+logger = logging.getLogger("phase2")
+
 
 class ProposalGenerator:
     """Phase 2: Generate social media proposals from safe content"""
     
+    def __init__(self, link_graph=None, related_hops: int = 2, related_limit: int = 5, bodies=None):
+        # Optional LinkGraph from Phase 1's scan (.cache/link_graph.pkl)
+        self.link_graph = link_graph
+        # Optional BlobStore of note bodies from Phase 1 (.cache/bodies), records reference them by body_hash
+        self.bodies = bodies
+        self.related_hops = related_hops
+        self.related_limit = related_limit
+    
     def generate_proposals(self, safe_pages: List[Dict]) -> List[Dict]:
         """
         Convert vault content → social media proposals
@@ -19,41 +32,154 @@ class ProposalGenerator:
         """
         proposals = []
         
-        for page in safe_pages:
-            # Only include pages with content
-            if not page.get("word_count", 0) > 10:
+        # Related notes are only ever picked among safe pages (canonical ones, if clustered)
+        safe_by_key = self._safe_by_key(safe_pages)
+        
+        # Near-duplicate clusters from Phase 1: one proposal per cluster
+        cluster_titles = self._cluster_titles(safe_pages)
+        
+        for page in self._proposable(safe_pages):
+            proposals.append(self._proposal(len(proposals) + 1, page, safe_by_key, cluster_titles))
+        
+        return proposals
+    
+    def generate_topic_proposals(self, safe_pages: List[Dict], topics: List[Dict] = None) -> List[Dict]:
+        """
+        One proposal per Phase 1 topic, with every note of the topic as a source
+        
+        The lead page (most mentioned in today's presence, then longest)
+        drives preview + angles; the topic's top terms become the keywords.
+        Pages without a topic_id still get a proposal of their own.
+        
+        Args:
+            topics: topics.json from Phase 1 (topic_id, top_terms...), optional
+        """
+        proposals = []
+        safe_by_key = self._safe_by_key(safe_pages)
+        cluster_titles = self._cluster_titles(safe_pages)
+        terms_by_topic = {topic["topic_id"]: topic.get("top_terms", []) for topic in topics or []}
+        
+        groups: Dict = {}
+        for page in self._proposable(safe_pages):
+            topic_id = page.get("topic_id")
+            groups.setdefault(topic_id if topic_id is not None else ("page", page["title"]), []).append(page)
+        
+        for topic_id, members in groups.items():
+            members.sort(key=lambda page: (-page.get("presence_score", 0), -page.get("word_count", 0)))
+            lead = members[0]
+            
+            if isinstance(topic_id, tuple):
+                proposals.append(self._proposal(len(proposals) + 1, lead, safe_by_key, cluster_titles))
                 continue
             
-            proposal = {
-                "id": len(proposals) + 1,
-                "source_page": page["title"],
-                "source_file": page["file_name"],
-                "content_preview": self._get_preview(page),
-                "tone": page.get("tone", "neutral"),
-                "suggested_platforms": page.get("platforms", ["linkedin"]),
-                "images": page.get("images", []),
-                "image_count": page.get("image_count", 0),
-                "keywords": page.get("keywords", []),
-                
-                # Generate platform-specific angles
-                "platform_angles": self._generate_angles(page),
-                
-                # Readiness for posting
-                "ready_to_post": True,
-                "status": "pending_approval",
-                "notes": ""
+            platforms = Counter(platform for page in members for platform in page.get("platforms", ["linkedin"]))
+            topic_page = {
+                **lead,
+                "keywords": terms_by_topic.get(topic_id, [])[:5] or lead.get("keywords", []),
+                "platforms": [platform for platform, _ in platforms.most_common()],
+                "images": [image for page in members for image in page.get("images", [])],
+                "image_count": sum(page.get("image_count", 0) for page in members),
             }
+            
+            proposal = self._proposal(len(proposals) + 1, topic_page, safe_by_key, cluster_titles)
+            sources = {page["title"] for page in members}
+            proposal["related_pages"] = [related for related in proposal["related_pages"]
+                                         if related["title"] not in sources]
+            proposal["source_key"] = f"topic:{proposal['source_key']}"
+            proposal["topic_id"] = topic_id
+            proposal["topic_terms"] = terms_by_topic.get(topic_id, [])
+            proposal["sources"] = [
+                {"title": page["title"], "file_name": page["file_name"], "note_key": page.get("note_key"),
+                 "body_hash": page.get("body_hash")}
+                for page in members
+            ]
             proposals.append(proposal)
         
         return proposals
     
+    @staticmethod
+    def _safe_by_key(safe_pages: List[Dict]) -> Dict[str, Dict]:
+        return {page["note_key"]: page for page in safe_pages
+                if page.get("note_key") and page.get("canonical", True)}
+    
+    @staticmethod
+    def _cluster_titles(safe_pages: List[Dict]) -> Dict:
+        cluster_titles = {}
+        for page in safe_pages:
+            if page.get("cluster_id") is not None:
+                cluster_titles.setdefault(page["cluster_id"], []).append(page["title"])
+        return cluster_titles
+    
+    @staticmethod
+    def _proposable(safe_pages: List[Dict]) -> List[Dict]:
+        """Canonical pages with content (non-canonical near-duplicates are covered by their canonical page)"""
+        return [page for page in safe_pages
+                if page.get("word_count", 0) > 10 and page.get("canonical", True)]
+    
+    def _proposal(self, proposal_id: int, page: Dict, safe_by_key: Dict[str, Dict], cluster_titles: Dict) -> Dict:
+        return {
+            "id": proposal_id,
+            "source_page": page["title"],
+            "source_file": page["file_name"],
+            "source_key": page.get("note_key") or page["file_name"],  # Phase 3 checkpoint key
+            "content_preview": self._get_preview(page),
+            "body_hash": page.get("body_hash"),  # full body for Phase 3 (body store)
+            "tone": page.get("tone", "neutral"),
+            "suggested_platforms": page.get("platforms", ["linkedin"]),
+            "images": page.get("images", []),
+            "image_count": page.get("image_count", 0),
+            "keywords": page.get("keywords", []),
+            "related_pages": self._related_pages(page, safe_by_key),
+            "duplicates": [title for title in cluster_titles.get(page.get("cluster_id"), [])
+                           if title != page["title"]],
+            
+            # Generate platform-specific angles
+            "platform_angles": self._generate_angles(page),
+            
+            # Readiness for posting
+            "ready_to_post": True,
+            "status": "pending_approval",
+            "notes": ""
+        }
+    
+    def _related_pages(self, page: Dict, safe_by_key: Dict[str, Dict]) -> List[Dict]:
+        """Closest linked notes (links + backlinks, up to related_hops away), best connected first"""
+        key = page.get("note_key")
+        if self.link_graph is None or key not in self.link_graph:
+            return []
+        
+        graph = self.link_graph
+        neighbors = graph.neighborhood(key, hops=self.related_hops)
+        ranked = sorted(
+            (other for other in neighbors if other in safe_by_key),
+            key=lambda other: (neighbors[other], -graph.degree(other), other),
+        )
+        
+        return [
+            {
+                "title": safe_by_key[other]["title"],
+                "file_name": safe_by_key[other]["file_name"],
+                "hops": neighbors[other],
+            }
+            for other in ranked[:self.related_limit]
+        ]
+    
     def _get_preview(self, page: Dict) -> str:
         """Get clean content preview"""
-        content = page.get("content", "")
+        content = self._get_body(page)
         # Clean preview (remove extra whitespace, images, etc.)
         preview = " ".join(content.split())[:300]
         return preview + "..." if len(preview) == 300 else preview
     
+    def _get_body(self, page: Dict) -> str:
+        """Note body: in the record (full Phase 1 pages) or fetched from the body store by hash"""
+        if page.get("content"):
+            return page["content"]
+        body_hash = page.get("body_hash")
+        if self.bodies is None or body_hash not in self.bodies:
+            return ""
+        return self.bodies.get(body_hash)
+    
     def _generate_angles(self, page: Dict) -> Dict:
         """Generate platform-specific content angles"""
         title = page["title"]
@@ -92,12 +218,83 @@ class ProposalGenerator:
                 "length": "50-100 word caption",
                 "cta": "Save this for later 📌",
                 "hashtags": ["#Tech", "#AI", "#Developer", "#Learning"] + keywords[:1],
-                "visual": f"REQUIRED: {image_count} images available" if image_count > 0 else "❌ No images (IG needs visuals)"
+                "visual": self._instagram_visual(page.get("images", []), image_count),
+                "best_images": [image["path"] for image in self._instagram_images(page.get("images", []))[:3]]
             }
         }
         
         return angles
     
+    # Instagram feed posts accept 4:5 portrait up to 1.91:1 landscape, 1080px wide recommended
+    IG_MIN_ASPECT = 0.8
+    IG_MAX_ASPECT = 1.91
+    IG_MIN_WIDTH = 1080
+    IG_FORMATS = ("jpeg", "png", "webp", "gif")
+    
+    def _instagram_images(self, images: List[Dict]) -> List[Dict]:
+        """Images Instagram takes as-is (format + aspect ratio), best candidates first"""
+        usable = [
+            image for image in images
+            if image.get("format") in self.IG_FORMATS and image.get("aspect")
+            and self.IG_MIN_ASPECT <= image["aspect"] <= self.IG_MAX_ASPECT
+        ]
+        # Large enough first, then closest to square / 4:5, then biggest
+        return sorted(usable, key=lambda image: (
+            image["width"] < self.IG_MIN_WIDTH,
+            min(abs(image["aspect"] - 1.0), abs(image["aspect"] - 0.8)),
+            -image["width"],
+        ))
+    
+    def _instagram_visual(self, images: List[Dict], image_count: int) -> str:
+        if image_count == 0:
+            return "❌ No images (IG needs visuals)"
+        
+        # Phase 1 output from before image metadata existed: no sizes to check
+        if not any("aspect" in image for image in images):
+            return f"REQUIRED: {image_count} images available"
+        
+        usable = self._instagram_images(images)
+        if not usable:
+            return f"⚠️ {image_count} images, none fit IG (needs 4:5 to 1.91:1 jpeg/png) → crop/convert"
+        
+        best = usable[0]
+        size_note = "" if best["width"] >= self.IG_MIN_WIDTH else f", upscale to {self.IG_MIN_WIDTH}px"
+        return (f"REQUIRED: {len(usable)}/{image_count} images IG-ready, "
+                f"best {best['width']}x{best['height']} {best['format']}{size_note}")
+    
+    def checkpoint(self, path=None):
+        """
+        Fingerprints of the proposals written last time (.cache/checkpoints/phase2.pkl)
+
+        Phase 2 regenerates every proposal on every run (it's cheap, and a
+        proposal's fingerprint is taken from the proposal itself), so the
+        checkpoint never skips work here: it reports what changed since the
+        last run, i.e. what Phase 3 will regenerate, on dry and real runs alike.
+        """
+        from tools.checkpoints import Checkpoint, fingerprint
+        
+        path = path or project_root / ".cache" / "checkpoints" / "phase2.pkl"
+        return Checkpoint(path, fingerprint(self.related_hops, self.related_limit))
+    
+    @staticmethod
+    def proposal_inputs(proposals: List[Dict]) -> Dict[str, str]:
+        """source_key → fingerprint of the proposal (minus the review fields id / status / notes)"""
+        from tools.checkpoints import fingerprint
+        
+        return {
+            proposal["source_key"]: fingerprint({key: value for key, value in proposal.items()
+                                                 if key not in ("id", "status", "notes")})
+            for proposal in proposals
+        }
+    
+    @staticmethod
+    def record_checkpoint(checkpoint, inputs: Dict[str, str]):
+        """After saving proposals.json: remember exactly these proposals"""
+        checkpoint.retain(inputs)
+        for key, input_hash in inputs.items():
+            checkpoint.record(key, input_hash, None)
+        checkpoint.save()
+    
     def save_proposals(self, proposals: List[Dict], output_file: str = "proposals.json"):
         """Save proposals for human review"""
         output_path = Path(__file__).parent.parent / output_file
@@ -105,8 +302,8 @@ class ProposalGenerator:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(proposals, f, indent=2, ensure_ascii=False)
         
-        print(f"\n📋 {len(proposals)} proposals generated!")
-        print(f"💾 Saved to: {output_file}")
+        logger.info(f"\n📋 {len(proposals)} proposals generated!")
+        logger.info(f"💾 Saved to: {output_file}")
         
         return output_path
 
@@ -173,28 +370,70 @@ class HITLApproval:
 # Main execution
 if __name__ == "__main__":
     from dotenv import load_dotenv
+    from tools.console import configure_logging
+    
+    configure_logging()
     
     # Load safe content from Phase 1
     env_path = Path(__file__).parent.parent / ".env"
     load_dotenv(dotenv_path=env_path)
     
-    safe_content_file = Path(__file__).parent.parent / "safe_content.json"
+    # safe_content.jsonl(.gz/.zst) streamed line by line, or a legacy safe_content.json
+    from tools.jsonl_store import find_jsonl, iter_records
     
-    if not safe_content_file.exists():
-        print("❌ safe_content.json not found. Run Phase 1 first!")
-        print(f"   python src/phase1_intelligence.py")
+    safe_content_file = Path(__file__).parent.parent / "safe_content.jsonl"
+    
+    if find_jsonl(safe_content_file) is None and not safe_content_file.with_suffix(".json").exists():
+        logger.error("❌ safe_content.jsonl not found. Run Phase 1 first!")
+        logger.error(f"   python src/phase1_intelligence.py")
         exit(1)
     
-    print("📂 Loading safe content from Phase 1...")
-    with open(safe_content_file, 'r', encoding='utf-8') as f:
-        safe_pages = json.load(f)
+    logger.info("📂 Loading safe content from Phase 1...")
+    # Related notes + duplicate clusters look across all pages, so the records are kept
+    safe_pages = list(iter_records(safe_content_file))
+    
+    logger.info(f"✅ Loaded {len(safe_pages)} safe pages\n")
+    
+    # Link graph from Phase 1 (related notes without rescanning the vault)
+    from tools.link_graph import LinkGraph
+    
+    graph_path = Path(__file__).parent.parent / ".cache" / "link_graph.pkl"
+    link_graph = LinkGraph(graph_path, os.getenv("OBSIDIAN_VAULT_PATH")).load() if graph_path.exists() else None
+    if link_graph is not None:
+        logger.info(f"🕸️  Link graph: {len(link_graph)} notes\n")
+    
+    # Note bodies from Phase 1 (memory-mapped, only the proposals' bodies are decompressed)
+    from tools.blob_store import BlobStore
+    
+    bodies_path = Path(__file__).parent.parent / ".cache" / "bodies"
+    bodies = BlobStore(bodies_path).load() if (bodies_path / "bodies.idx").exists() else None
+    
+    # Generate proposals (--by-topic: one per Phase 1 topic, several source notes each)
+    generator = ProposalGenerator(link_graph=link_graph, bodies=bodies)
+    if "--by-topic" in sys.argv:
+        topics_file = Path(__file__).parent.parent / "topics.json"
+        topics = None
+        if topics_file.exists():
+            with open(topics_file, 'r', encoding='utf-8') as f:
+                topics = json.load(f)
+        proposals = generator.generate_topic_proposals(safe_pages, topics)
+        logger.info(f"🗂️  Topic mode: {len(safe_pages)} pages → {len(proposals)} proposals\n")
+    else:
+        proposals = generator.generate_proposals(safe_pages)
+    
+    # What changed since the last run (what Phase 3 will regenerate), reported on every run;
+    # --force reports every proposal as changed, --dry-run stops before proposals.json is written
+    dry_run = "--dry-run" in sys.argv
+    checkpoint = generator.checkpoint().load()
+    inputs = generator.proposal_inputs(proposals)
+    for line in checkpoint.plan(inputs, force="--force" in sys.argv).describe():
+        logger.info(f"{'🧪' if dry_run else '♻️ '} {line}")
     
-    print(f"✅ Loaded {len(safe_pages)} safe pages\n")
+    if dry_run:
+        exit(0)
     
-    # Generate proposals
-    generator = ProposalGenerator()
-    proposals = generator.generate_proposals(safe_pages)
     proposals_path = generator.save_proposals(proposals)
+    generator.record_checkpoint(checkpoint, inputs)
     
     # Interactive approval
     print("\n" + "="*60)
@@ -209,10 +448,10 @@ if __name__ == "__main__":
         with open(approved_path, 'w', encoding='utf-8') as f:
             json.dump(approved, f, indent=2, ensure_ascii=False)
         
-        print(f"\n✅ {len(approved)} proposals approved!")
-        print(f"💾 Saved to: approved_proposals.json")
-        print(f"\n🚀 Next step: Phase 3 (Content Generation)")
-        print(f"   python src/phase3_content_generation.py")
+        logger.info(f"\n✅ {len(approved)} proposals approved!")
+        logger.info(f"💾 Saved to: approved_proposals.json")
+        logger.info(f"\n🚀 Next step: Phase 3 (Content Generation)")
+        logger.info(f"   python src/phase3_content_generation.py")
     else:
-        print("\n📦 Batch mode: All proposals saved to proposals.json")
-        print("Next: python src/phase3_content_generation.py")
+        logger.info("\n📦 Batch mode: All proposals saved to proposals.json")
+        logger.info("Next: python src/phase3_content_generation.py")
@@ -4,6 +4,7 @@ import sys
 from pathlib import Path
 from typing import List, Dict
 import json
+import logging
 import os
 from dotenv import load_dotenv
 
@@ -12,14 +13,27 @@ sys.path.insert(0, str(project_root))
 
 from crewai import Crew, Task, Agent, LLM
 
+from tools.checkpoints import Checkpoint, Plan, fingerprint
+from tools.console import configure_logging
+
+logger = logging.getLogger("phase3")
+
 
 class SocialContentGenerator:
     """Phase 3: Generate platform-specific content using CrewAI"""
     
-    def __init__(self, ollama_model: str = "ollama/llama3", base_url: str = "http://localhost:11434"):
+    # Source text handed to a writer (the full note body when the body store has it)
+    MAX_SOURCE_CHARS = 4000
+    
+    def __init__(self, ollama_model: str = "ollama/llama3", base_url: str = "http://localhost:11434",
+                 bodies=None):
         """Initialize CrewAI with Ollama using new LLM wrapper"""
+        self.ollama_model = ollama_model
+        self.base_url = base_url
         self.llm = LLM(model=ollama_model, base_url=base_url)
         self.writers = self._create_writers()
+        # Optional BlobStore of note bodies from Phase 1 (.cache/bodies), proposals reference them by body_hash
+        self.bodies = bodies
     
     def _create_writers(self) -> Dict[str, Agent]:
         """Create platform-specific writer agents with EXPLICIT output instructions"""
@@ -106,8 +120,18 @@ class SocialContentGenerator:
         
         return writers
     
-    def generate_content(self, proposals: List[Dict], max_posts: int = None) -> Dict:
-        """Generate platform-specific content for each proposal"""
+    def generate_content(self, proposals: List[Dict], max_posts: int = None, force: bool = False) -> Dict:
+        """Generate platform-specific content for each proposal
+        
+        Posts are checkpointed per proposal: a proposal whose inputs
+        (title, platforms, preview, body hash) and writer config are
+        unchanged gets its previous posts back without calling the LLM.
+        Proposals with a failed platform are retried next run;
+        force=True regenerates everything.
+        """
+        checkpoint = self.checkpoint().load()
+        inputs = {self.proposal_key(proposal): self.proposal_inputs(proposal) for proposal in proposals}
+        checkpoint.retain(inputs)
         
         if max_posts:
             proposals = proposals[:max_posts]
@@ -118,9 +142,16 @@ class SocialContentGenerator:
         }
         
         for i, proposal in enumerate(proposals, 1):
-            print(f"\n{'='*60}")
-            print(f"[{i}/{len(proposals)}] {proposal['source_page']}")
-            print(f"{'='*60}")
+            logger.info(f"\n{'='*60}")
+            logger.info(f"[{i}/{len(proposals)}] {proposal['source_page']}")
+            logger.info(f"{'='*60}")
+            
+            key = self.proposal_key(proposal)
+            previous = None if force else checkpoint.output(key, inputs[key])
+            if previous is not None:
+                logger.info(f"   ♻️  Up to date, reusing {len(previous['platforms'])} posts")
+                results["posts"].append({**previous, "proposal_id": proposal["id"]})
+                continue
             
             post_data = {
                 "proposal_id": proposal["id"],
@@ -128,14 +159,17 @@ class SocialContentGenerator:
                 "platforms": {}
             }
             
+            # Body fetched once per proposal, shared by its platform writers
+            source_text = self._source_text(proposal)
+            
             for platform in proposal["suggested_platforms"]:
                 if platform not in self.writers:
                     continue
                 
-                print(f"\n   📱 {platform.upper()}...")
+                logger.info(f"\n   📱 {platform.upper()}...")
                 
                 task = Task(
-                    description=f"Create a {platform} post for: {proposal['source_page']}\nContent: {proposal['content_preview']}",
+                    description=f"Create a {platform} post for: {proposal['source_page']}\nContent: {source_text}",
                     expected_output=f"{platform.upper()} post ready to publish",
                     agent=self.writers[platform]
                 )
@@ -180,26 +214,64 @@ class SocialContentGenerator:
                     
                     # Accept anything with content
                     if not content:
-                        print(f"         DEBUG: Got empty content")
+                        logger.debug("         Got empty content")
                         raise ValueError("Agent produced no content")
                     
                     post_data["platforms"][platform] = {
                         "status": "generated",
                         "content": content
                     }
-                    print(f"      ✅ Done! ({len(content)} chars)")
+                    logger.info(f"      ✅ Done! ({len(content)} chars)")
                     
                 except Exception as e:
-                    print(f"      ❌ Error: {e}")
+                    logger.error(f"      ❌ Error: {e}")
                     post_data["platforms"][platform] = {
                         "status": "error",
                         "error": str(e)
                     }
             
             results["posts"].append(post_data)
+            
+            # Saved per proposal: an interrupted run keeps what it generated
+            if all(post["status"] == "generated" for post in post_data["platforms"].values()):
+                checkpoint.record(key, inputs[key], post_data)
+                checkpoint.save()
         
+        checkpoint.save()
         return results
     
+    def checkpoint(self) -> Checkpoint:
+        """Phase 3 checkpoint: proposal key → inputs + generated posts, under the current writer config"""
+        return Checkpoint(project_root / ".cache" / "checkpoints" / "phase3.pkl", self.config_fingerprint())
+    
+    def config_fingerprint(self) -> str:
+        """Model, endpoint + writer instructions: any change regenerates every post"""
+        writers = {platform: (agent.role, agent.goal, agent.backstory) for platform, agent in self.writers.items()}
+        return fingerprint(self.ollama_model, self.base_url, writers, self.MAX_SOURCE_CHARS)
+    
+    @staticmethod
+    def proposal_key(proposal: Dict) -> str:
+        return proposal.get("source_key") or proposal["source_file"]
+    
+    @staticmethod
+    def proposal_inputs(proposal: Dict) -> str:
+        """Hash of what the writers see of a proposal"""
+        return fingerprint(proposal["source_page"], proposal["suggested_platforms"],
+                           proposal["content_preview"], proposal.get("body_hash"))
+    
+    def plan(self, proposals: List[Dict], force: bool = False) -> Plan:
+        """Which proposals a run would send to the LLM again (dry run, writes nothing)"""
+        inputs = {self.proposal_key(proposal): self.proposal_inputs(proposal) for proposal in proposals}
+        return self.checkpoint().load().plan(inputs, force)
+    
+    def _source_text(self, proposal: Dict) -> str:
+        """Full note body from the body store (capped), else the Phase 2 preview"""
+        body_hash = proposal.get("body_hash")
+        if self.bodies is None or body_hash not in self.bodies:
+            return proposal["content_preview"]
+        body = " ".join(self.bodies.get(body_hash).split())
+        return body[:self.MAX_SOURCE_CHARS] + "..." if len(body) > self.MAX_SOURCE_CHARS else body
+    
     def save_posts(self, results: Dict, output_file: str = "generated_posts.json"):
         """Save generated posts to JSON"""
         output_path = Path(__file__).parent.parent / output_file
@@ -207,46 +279,62 @@ class SocialContentGenerator:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(results, f, indent=2, ensure_ascii=False)
         
-        print(f"\n✅ Saved: {output_file}")
+        logger.info(f"\n✅ Saved: {output_file}")
         return output_path
 
 
 if __name__ == "__main__":
+    configure_logging()
+    
     env_path = Path(__file__).parent.parent / ".env"
     load_dotenv(dotenv_path=env_path)
     
     proposals_file = Path(__file__).parent.parent / "proposals.json"
     
     if not proposals_file.exists():
-        print("❌ Run Phase 2 first: python src/phase2_approval.py")
+        logger.error("❌ Run Phase 2 first: python src/phase2_approval.py")
         exit(1)
     
-    print("📂 Loading proposals...")
+    logger.info("📂 Loading proposals...")
     with open(proposals_file, 'r', encoding='utf-8') as f:
         proposals = json.load(f)
     
-    print(f"✅ {len(proposals)} proposals\n")  # ← correct
+    logger.info(f"✅ {len(proposals)} proposals\n")  # ← correct
     
-    test_mode = input("Test with 3 posts or generate all? (test/all): ").strip().lower()
+    # Note bodies from Phase 1 (memory-mapped, read per proposal)
+    from tools.blob_store import BlobStore
     
-    print("\n🚀 Initializing CrewAI...")
-    generator = SocialContentGenerator()
+    bodies_path = Path(__file__).parent.parent / ".cache" / "bodies"
+    bodies = BlobStore(bodies_path).load() if (bodies_path / "bodies.idx").exists() else None
+    
+    # --force: regenerate every post, --dry-run: list what would be regenerated
+    force = "--force" in sys.argv
+    
+    logger.info("\n🚀 Initializing CrewAI...")
+    generator = SocialContentGenerator(bodies=bodies)
+    
+    if "--dry-run" in sys.argv:
+        for line in generator.plan(proposals, force=force).describe():
+            logger.info(f"🧪 {line}")
+        exit(0)
+    
+    test_mode = input("Test with 3 posts or generate all? (test/all): ").strip().lower()
     
-    print("\n" + "="*60)
-    print("📝 GENERATING CONTENT")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("📝 GENERATING CONTENT")
+    logger.info("="*60)
     
     max_posts = 3 if test_mode == "test" else None
-    results = generator.generate_content(proposals, max_posts=max_posts)
+    results = generator.generate_content(proposals, max_posts=max_posts, force=force)
     generator.save_posts(results)
     
-    print(f"\n📊 Generated {len(results['posts'])} posts")
-    print(f"💾 Check: generated_posts.json")
+    logger.info(f"\n📊 Generated {len(results['posts'])} posts")
+    logger.info(f"💾 Check: generated_posts.json")
     
     # Auto-launch viewer
-    print(f"\n🎨 Generating visual preview...")
+    logger.info(f"\n🎨 Generating visual preview...")
     import subprocess
     try:
         subprocess.run([sys.executable, "src/post_viewer.py"], check=True)
     except:
-        print("   (Run manually: python src/post_viewer.py)")
+        logger.info("   (Run manually: python src/post_viewer.py)")
@@ -0,0 +1,106 @@
+# src/tools/attachment_index.py
+
+from typing import Dict, List, Optional
+from urllib.parse import unquote
+import posixpath
+import re
+
+
+class AttachmentIndex:
+    """
+    Vault-wide attachment lookup (built once per scan from the vault walk)
+
+    Resolves embed/link targets with Obsidian semantics using only dict
+    lookups — no filesystem probing per reference:
+    - explicit paths: relative to the note's folder, then the vault root,
+      then any attachment whose path ends with the reference
+    - bare file names: same folder as the note first, otherwise the
+      "shortest path" match anywhere in the vault
+    Matching is case-insensitive, like Obsidian on Windows/macOS.
+    """
+
+    def __init__(self):
+        self.by_path: Dict[str, str] = {}        # lowercased rel path → rel path
+        self.by_name: Dict[str, List[str]] = {}  # lowercased basename → rel paths
+
+    def __len__(self) -> int:
+        return len(self.by_path)
+
+    def add(self, rel_path: str):
+        key = rel_path.lower()
+        if key in self.by_path:
+            return
+        self.by_path[key] = rel_path
+        self.by_name.setdefault(posixpath.basename(key), []).append(rel_path)
+
+    def remove(self, rel_path: str):
+        key = rel_path.lower()
+        if self.by_path.pop(key, None) is None:
+            return
+        name = posixpath.basename(key)
+        candidates = [path for path in self.by_name[name] if path.lower() != key]
+        if candidates:
+            self.by_name[name] = candidates
+        else:
+            del self.by_name[name]
+
+    def sync(self, rel_paths: List[str]) -> tuple:
+        """Bring the index in line with the latest walk, return (added, removed) counts"""
+        current = {rel_path.lower(): rel_path for rel_path in rel_paths}
+        removed = [path for key, path in self.by_path.items() if key not in current]
+        added = [path for key, path in current.items() if key not in self.by_path]
+
+        for rel_path in removed:
+            self.remove(rel_path)
+        for rel_path in added:
+            self.add(rel_path)
+
+        return len(added), len(removed)
+
+    def resolve(self, reference: str, note_dir: str = "") -> Optional[str]:
+        """
+        Resolve an embed/image reference to a vault-relative path
+
+        Args:
+            reference: Raw target, e.g. "img.png", "assets/img.png|300",
+                "../img%20one.png"
+            note_dir: Vault-relative folder of the referencing note ("" = root)
+        """
+        target = unquote(reference.split("|", 1)[0].split("#", 1)[0]).strip()
+        if not target:
+            return None
+
+        target = target.replace("\\", "/").lower()
+        note_dir = note_dir.lower()
+
+        if "/" in target:
+            # Relative to the note, then to the vault root
+            for candidate in (posixpath.join(note_dir, target), target):
+                candidate = posixpath.normpath(candidate).lstrip("/")
+                if candidate in self.by_path:
+                    return self.by_path[candidate]
+
+            # Partial path: any attachment ending in this path
+            suffix = "/" + re.sub(r'^(\.\.?/)+', '', target)
+            name = posixpath.basename(target)
+            matches = [path for path in self.by_name.get(name, [])
+                       if ("/" + path.lower()).endswith(suffix)]
+            return self._shortest(matches)
+
+        candidates = self.by_name.get(target)
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+
+        # Same folder as the note wins, otherwise Obsidian's shortest path
+        same_folder = posixpath.join(note_dir, target) if note_dir else target
+        if same_folder in self.by_path:
+            return self.by_path[same_folder]
+        return self._shortest(candidates)
+
+    @staticmethod
+    def _shortest(paths: List[str]) -> Optional[str]:
+        if not paths:
+            return None
+        return min(paths, key=lambda path: (path.count("/"), len(path), path))
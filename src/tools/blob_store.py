@@ -0,0 +1,184 @@
+# src/tools/blob_store.py
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+import logging
+import mmap
+import os
+import pickle
+import zlib
+
+from .scan_manifest import hash_bytes
+
+logger = logging.getLogger(__name__)
+
+
+class BlobStore:
+    """
+    Content-addressed note bodies: hash → zlib-compressed UTF-8 text
+
+    Bodies are appended to one pack file (bodies.pack) and located
+    through an index (bodies.idx: hash → offset, length), so identical
+    bodies are stored once and a reader memory-maps the pack and only
+    decompresses the bodies it asks for. The index only covers bytes
+    written before the last save(): a crashed run leaves a harmless tail
+    that the next writer truncates. save() drops bodies that weren't put
+    this run and rewrites the pack once they are most of it.
+    """
+
+    VERSION = 1
+
+    def __init__(self, root: str, level: int = 6, compact_ratio: float = 0.5):
+        self.root = Path(root)
+        self.pack_path = self.root / "bodies.pack"
+        self.index_path = self.root / "bodies.idx"
+        self.level = level
+        self.compact_ratio = compact_ratio
+
+        self.index: Dict[str, Tuple[int, int]] = {}  # body hash → (offset, compressed length)
+        self.used = set()
+        self.added = 0
+        self.reused = 0
+
+        self._size = 0        # pack bytes covered by the index
+        self._pack = None     # append handle
+        self._map: Optional[mmap.mmap] = None
+
+    # ===== Index =====
+
+    def load(self) -> "BlobStore":
+        """Load the index (silently starts empty if missing/stale), starting a new run"""
+        # Bodies used + counters are per run, reloading on the same instance starts them over
+        self.close()
+        self.index = {}
+        self.used = set()
+        self.added = 0
+        self.reused = 0
+        self._size = 0
+
+        if not self.index_path.exists():
+            return self
+
+        try:
+            with open(self.index_path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable body store index: {e}")
+            return self
+
+        pack_size = self.pack_path.stat().st_size if self.pack_path.exists() else 0
+        if data.get("version") == self.VERSION and data.get("size", 0) <= pack_size:
+            self.index = data.get("entries", {})
+            self._size = data["size"]
+        return self
+
+    def save(self):
+        """Forget bodies not put this run (compacting the pack if mostly garbage), write the index atomically"""
+        live = {digest: self.index[digest] for digest in self.used if digest in self.index}
+        live_bytes = sum(length for _, length in live.values())
+        if self._size and self._size - live_bytes > self.compact_ratio * self._size:
+            live = self._compact(live)
+        self.index = live
+
+        self._close_pack()
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(self.index_path.suffix + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({"version": self.VERSION, "size": self._size, "entries": self.index},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.index_path)
+
+    def _compact(self, live: Dict[str, Tuple[int, int]]) -> Dict[str, Tuple[int, int]]:
+        """Rewrite the pack with only the live bodies (in pack order)"""
+        view = self._view(self._size)
+        tmp_path = self.pack_path.with_suffix(self.pack_path.suffix + ".tmp")
+        compacted = {}
+        with open(tmp_path, 'wb') as f:
+            for digest, (offset, length) in sorted(live.items(), key=lambda item: item[1][0]):
+                compacted[digest] = (f.tell(), length)
+                f.write(view[offset:offset + length])
+            size = f.tell()
+
+        self.close()
+        os.replace(tmp_path, self.pack_path)
+        self._size = size
+        return compacted
+
+    # ===== Bodies =====
+
+    def put(self, text: str) -> str:
+        """Store a body (once per distinct text), return its hash"""
+        raw = text.encode('utf-8')
+        digest = hash_bytes(raw)
+        self.used.add(digest)
+        if digest in self.index:
+            self.reused += 1
+            return digest
+
+        blob = zlib.compress(raw, self.level)
+        self._appender().write(blob)
+        self.index[digest] = (self._size, len(blob))
+        self._size += len(blob)
+        self.added += 1
+        return digest
+
+    def keep(self, digest: str) -> bool:
+        """Mark a stored body as still used (False if it isn't stored: put() it again)"""
+        if digest not in self.index:
+            return False
+        self.used.add(digest)
+        self.reused += 1
+        return True
+
+    def get(self, digest: str) -> str:
+        """Body of a hash (KeyError if it isn't stored)"""
+        offset, length = self.index[digest]
+        view = self._view(offset + length)
+        return zlib.decompress(view[offset:offset + length]).decode('utf-8')
+
+    def get_many(self, digests: Iterable[str]) -> Dict[str, str]:
+        """Bodies of several hashes, read in pack order (unknown hashes skipped)"""
+        known = sorted({digest for digest in digests if digest in self.index}, key=lambda digest: self.index[digest])
+        return {digest: self.get(digest) for digest in known}
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def size(self) -> int:
+        """Compressed bytes in the pack"""
+        return self._size
+
+    # ===== Files =====
+
+    def _appender(self):
+        if self._pack is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._pack = open(self.pack_path, 'a+b')
+            self._pack.truncate(self._size)  # drop a tail the index never covered
+        return self._pack
+
+    def _view(self, end: int) -> mmap.mmap:
+        """Read-only map of the pack, remapped once it grew past the mapped size"""
+        if self._pack is not None:
+            self._pack.flush()
+        if self._map is None or len(self._map) < end:
+            if self._map is not None:
+                self._map.close()
+            with open(self.pack_path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _close_pack(self):
+        if self._pack is not None:
+            self._pack.close()
+            self._pack = None
+
+    def close(self):
+        self._close_pack()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
@@ -0,0 +1,127 @@
+# src/tools/checkpoints.py
+
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+import json
+import logging
+import os
+import pickle
+
+from .scan_manifest import hash_bytes
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(*parts) -> str:
+    """Stable hash of JSON-able parts (dict key order doesn't matter)"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hash_bytes(payload.encode('utf-8'))
+
+
+def file_fingerprint(*paths) -> str:
+    """Hash of the bytes of config files (a missing file hashes as missing)"""
+    return fingerprint(*[hash_bytes(Path(path).read_bytes()) if Path(path).exists() else "missing"
+                         for path in paths])
+
+
+class Plan(NamedTuple):
+    """What a phase run would do with its items"""
+    rebuild: Dict[str, str]   # key → reason: new, changed, config or forced
+    reuse: List[str]
+    removed: List[str]        # recorded last run, gone from the inputs
+
+    def describe(self, limit: int = 20) -> List[str]:
+        """Summary line + up to `limit` items to rebuild (for --dry-run)"""
+        reasons: Dict[str, int] = {}
+        for reason in self.rebuild.values():
+            reasons[reason] = reasons.get(reason, 0) + 1
+        detail = ", ".join(f"{count} {reason}" for reason, count in sorted(reasons.items()))
+        lines = [f"{len(self.rebuild)} to rebuild ({detail or 'nothing'}), "
+                 f"{len(self.reuse)} up to date, {len(self.removed)} removed"]
+        for key, reason in list(self.rebuild.items())[:limit]:
+            lines.append(f"   {reason:<8} {key}")
+        if len(self.rebuild) > limit:
+            lines.append(f"   ... {len(self.rebuild) - limit} more")
+        return lines
+
+
+class Checkpoint:
+    """
+    Make-style record of a phase artifact: item key → (input hash, config fingerprint, output)
+
+    plan() compares this run's input hashes against the recorded ones;
+    an item is rebuilt when it is new, its inputs changed, it was built
+    under another config (code version, rules, model...) or force is
+    set, and its recorded output is reused otherwise. Items that failed
+    are simply not recorded, so the next run retries them. save() keeps
+    the items of the last plan (built or not) and drops removed ones.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, config: str):
+        self.path = Path(path)
+        self.config = config
+        self.items: Dict[str, Dict] = {}
+        self.current = None   # keys of the last plan
+
+    def load(self) -> "Checkpoint":
+        """Load recorded items (silently starts empty if missing/stale)"""
+        if not self.path.exists():
+            return self
+
+        try:
+            with open(self.path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable checkpoint {self.path.name}: {e}")
+            return self
+
+        if data.get("version") == self.VERSION:
+            self.items = data.get("items", {})
+        return self
+
+    def save(self):
+        """Atomically write the items still part of the inputs"""
+        if self.current is not None:
+            self.items = {key: item for key, item in self.items.items() if key in self.current}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({"version": self.VERSION, "config": self.config, "items": self.items},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+    def retain(self, keys):
+        """Items save() keeps (plan() sets them from its inputs)"""
+        self.current = set(keys)
+
+    def plan(self, inputs: Dict[str, str], force: bool = False) -> Plan:
+        """Sort items (key → input hash) into rebuild / reuse"""
+        self.retain(inputs)
+        rebuild, reuse = {}, []
+        for key, input_hash in inputs.items():
+            item = self.items.get(key)
+            if force:
+                rebuild[key] = "forced"
+            elif item is None:
+                rebuild[key] = "new"
+            elif item["config"] != self.config:
+                rebuild[key] = "config"
+            elif item["inputs"] != input_hash:
+                rebuild[key] = "changed"
+            else:
+                reuse.append(key)
+        removed = [key for key in self.items if key not in self.current]
+        return Plan(rebuild, reuse, removed)
+
+    def output(self, key: str, input_hash: str) -> Optional[Dict]:
+        """Recorded output if it was built from these inputs under this config, else None"""
+        item = self.items.get(key)
+        if item is None or item["inputs"] != input_hash or item["config"] != self.config:
+            return None
+        return item["output"]
+
+    def record(self, key: str, input_hash: str, output):
+        self.items[key] = {"inputs": input_hash, "config": self.config, "output": output}
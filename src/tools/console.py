@@ -0,0 +1,16 @@
+# src/tools/console.py
+
+import logging
+
+
+def configure_logging(level: str = "INFO", quiet: bool = False):
+    """
+    Console output of main.py and the phase scripts: bare messages, one style
+
+    Status and summary lines go through the "phase1" / "phase2" / "phase3"
+    loggers, so they only show once an entry point calls this (interactive
+    review prompts stay plain print/input). quiet=True silences everything.
+    """
+    logging.basicConfig(level=level, format="%(message)s")
+    if quiet:
+        logging.disable(logging.CRITICAL)
@@ -1,70 +1,67 @@
 # tools/content_analyzer.py
 
+from collections import Counter
+from operator import itemgetter
 from typing import Dict, List
 
+from .lexicon import tokenize
+from .platform_router import default_router
+from .tone_classifier import default_classifier
+
+
+STOP_WORDS = frozenset({"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "is", "are"})
 
 class ContentAnalyzer:
     """Analyze content for tone, topic, and platform suitability"""
-    
+
     @staticmethod
-    def analyze_tone(content: str) -> str:
-        """Detect content tone"""
-        content_lower = content.lower()
-        
-        # Tone keywords
-        tones = {
-            "professional": ["business", "enterprise", "solution", "strategy", "innovation"],
-            "technical": ["code", "api", "system", "architecture", "implementation"],
-            "casual": ["hey", "awesome", "cool", "love", "excited"],
-            "educational": ["learn", "guide", "tutorial", "how to", "step by step"]
+    def analyze(page_data: Dict, top_n: int = 5) -> Dict:
+        """
+        Tone, platforms + keywords of a page from a single tokenizer pass
+
+        The note is lowercased and split into words once; the word counts
+        feed the keywords, and the same tokens are matched against the
+        compiled tone lexicons (config/tones.yaml) and routing rules
+        (config/routing.yaml).
+
+        Returns:
+            {tone, tone_scores, tone_confidence, tone_ties, platforms, keywords}
+        """
+        tokens, counts = tokenize(page_data["content"])
+        classifier = default_classifier()
+        tone = classifier.classify_one(classifier.matcher.match(tokens, counts))
+
+        return {
+            "tone": tone.tone,
+            "tone_scores": tone.scores,
+            "tone_confidence": tone.confidence,
+            "tone_ties": tone.ties,
+            "platforms": default_router().route(page_data, (tokens, counts)).platforms,
+            "keywords": _keywords(counts, top_n),
         }
-        
-        tone_scores = {}
-        for tone, keywords in tones.items():
-            score = sum(1 for kw in keywords if kw in content_lower)
-            tone_scores[tone] = score
-        
-        # Return highest scoring tone
-        return max(tone_scores, key=tone_scores.get) if tone_scores else "neutral"
-    
+
+    @staticmethod
+    def analyze_tone(content: str) -> str:
+        """Detect content tone ("neutral" when no tone keyword occurs)"""
+        return default_classifier().classify(content).tone
+
     @staticmethod
     def suggest_platforms(page_data: Dict) -> List[str]:
         """Suggest best platforms based on content analysis"""
-        content = page_data["content"]
-        metadata = page_data["metadata"]
-        
-        # Respect manual platform selection in frontmatter
-        if "platforms" in metadata:
-            return metadata["platforms"]
-        
-        suggested = []
-        
-        # LinkedIn: Professional/technical content
-        if any(kw in content.lower() for kw in ["business", "strategy", "innovation", "ai", "tech"]):
-            suggested.append("linkedin")
-        
-        # X (Twitter): Short, punchy topics
-        if page_data["word_count"] < 500 or "announcement" in content.lower():
-            suggested.append("x")
-        
-        # Facebook: Community/casual
-        if any(kw in content.lower() for kw in ["community", "event", "join", "share"]):
-            suggested.append("facebook")
-        
-        # Instagram: Visual content
-        if page_data["images"]:
-            suggested.append("instagram")
-        
-        # Default fallback
-        return suggested if suggested else ["linkedin", "x"]
-    
+        return default_router().route(page_data).platforms
+
     @staticmethod
     def extract_keywords(content: str, top_n: int = 5) -> List[str]:
         """Extract top keywords"""
-        stop_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "is", "are"}
-        words = content.lower().split()
-        filtered = [w for w in words if w not in stop_words and len(w) > 3]
-        
-        from collections import Counter
-        word_counts = Counter(filtered)
-        return [word for word, _ in word_counts.most_common(top_n)]
+        return _keywords(tokenize(content)[1], top_n)
+
+
+def _keywords(counts: Counter, top_n: int) -> List[str]:
+    # Same order as Counter.most_common (stable on ties): sort once in C, filter only until top_n are found
+    keywords = []
+    for word, _ in sorted(counts.items(), key=itemgetter(1), reverse=True):
+        if len(word) > 3 and word not in STOP_WORDS:
+            keywords.append(word)
+            if len(keywords) == top_n:
+                break
+    return keywords
@@ -2,6 +2,8 @@
 
 from crewai_tools import tool
 
+from .platform_router import default_router
+
 @tool("Content Platform Router")
 def classify_content(content: str, metadata: dict) -> dict:
     """
@@ -15,47 +17,25 @@ def classify_content(content: str, metadata: dict) -> dict:
         Dictionary with platform routing decisions
     """
     
-    # Check for manual platform specification
-    if 'platforms' in metadata and metadata['platforms']:
+    route = default_router().route({'content': content, 'metadata': metadata})
+
+    # Manual platform specification in frontmatter
+    if route.manual:
         return {
-            'platforms': metadata['platforms'],
+            'platforms': route.platforms,
             'content_type': metadata.get('type', 'update'),
             'manual_override': True,
             'reasoning': 'Manual platform specification in frontmatter'
         }
-    
-    # Auto-classification logic
-    classification = {
-        'platforms': [],
+
+    # Auto-classification: rule table in config/routing.yaml
+    tags = metadata.get('tags') or []
+    return {
+        'platforms': route.platforms,
         'content_type': 'update',
         'priority': 'medium',
-        'manual_override': False
+        'manual_override': False,
+        'rules': route.rules,
+        'reasoning': f"Auto-classified based on {len(tags)} tags and {len(content.split())} words "
+                     f"(rules: {', '.join(route.rules)})"
     }
-    
-    tags = metadata.get('tags', [])
-    word_count = len(content.split())
-    
-    # LinkedIn: Professional, technical, long-form
-    linkedin_indicators = ['tech', 'ai', 'professional', 'business', 'opensource', 'security']
-    if any(tag in linkedin_indicators for tag in tags) or word_count > 300:
-        classification['platforms'].append('linkedin')
-    
-    # X (Twitter): Short, punchy updates
-    if word_count < 280 or any(tag in ['update', 'news', 'quick'] for tag in tags):
-        classification['platforms'].append('x')
-    
-    # Instagram: Visual content
-    if 'visual' in tags or '![' in content:
-        classification['platforms'].append('instagram')
-    
-    # Facebook: Community, conversational
-    if any(tag in ['community', 'discussion', 'social'] for tag in tags):
-        classification['platforms'].append('facebook')
-    
-    # Default: LinkedIn for all professional content
-    if not classification['platforms']:
-        classification['platforms'] = ['linkedin']
-    
-    classification['reasoning'] = f"Auto-classified based on {len(tags)} tags and {word_count} words"
-    
-    return classification
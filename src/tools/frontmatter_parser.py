@@ -0,0 +1,198 @@
+# src/tools/frontmatter_parser.py
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import copy
+import hashlib
+import re
+
+import frontmatter
+import yaml
+from yaml.resolver import Resolver
+
+# C-accelerated loader when PyYAML was built with libyaml
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Same boundary python-frontmatter uses, so headers split identically
+FM_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+# `key: value` / `key:` lines and `- item` lines the fast path understands
+KEY_LINE = re.compile(r"^([A-Za-z0-9_][\w .-]*?):(?:[ \t]+(.*?))?[ \t]*$")
+ITEM_LINE = re.compile(r"^[ \t]*-[ \t]+(.*?)[ \t]*$|^[ \t]*-$")
+# Comment start / mapping indicator inside a plain value (space or tab alike)
+VALUE_INDICATOR = re.compile(r"[ \t]#|:[ \t]")
+DECIMAL_INT = re.compile(r"^[-+]?(?:0|[1-9][0-9]*)$")
+
+STR_TAG = "tag:yaml.org,2002:str"
+INT_TAG = "tag:yaml.org,2002:int"
+BOOL_TAG = "tag:yaml.org,2002:bool"
+NULL_TAG = "tag:yaml.org,2002:null"
+
+HEADER_CACHE_SIZE = 4096
+_header_cache: "OrderedDict[bytes, Tuple[Dict, bool]]" = OrderedDict()
+_resolver = Resolver()
+
+
+class _NotFlat(Exception):
+    """Header needs the real YAML loader"""
+
+
+def parse_frontmatter(text: str) -> Tuple[Dict, str, int]:
+    """
+    Split + parse a note's frontmatter header
+
+    Same results as python-frontmatter's loads(), but flat headers
+    (scalars, inline/block lists of scalars) are parsed directly and only
+    complex ones go through the C YAML loader. Parsed headers are cached
+    by header hash, so identical headers are parsed once per process.
+
+    Returns:
+        (metadata, content, body_offset) where content is the stripped
+        body and text[body_offset:].rstrip() == content
+
+    Raises:
+        yaml.YAMLError: invalid YAML header (caller decides the fallback)
+    """
+    stripped = text.strip()
+
+    if stripped.startswith("{"):
+        # JSON frontmatter: rare, leave it to python-frontmatter
+        post = frontmatter.loads(text)
+        metadata, content = post.metadata, post.content
+    else:
+        header, content = _split(stripped)
+        metadata = parse_header(header) if header is not None else {}
+
+    return metadata, content, len(text.rstrip()) - len(content)
+
+
+def _split(stripped: str) -> Tuple[Optional[str], str]:
+    opening = FM_BOUNDARY.match(stripped)
+    if not opening:
+        return None, stripped
+
+    closing = FM_BOUNDARY.search(stripped, opening.end())
+    if not closing:
+        return None, stripped
+
+    return stripped[opening.end():closing.start()], stripped[closing.end():].strip()
+
+
+def parse_header(header: str) -> Dict:
+    """Parse a YAML header block (without --- delimiters), cached by hash"""
+    key = hashlib.blake2b(header.encode("utf-8"), digest_size=16).digest()
+
+    cached = _header_cache.get(key)
+    if cached is None:
+        try:
+            cached = (_parse_flat(header), True)
+        except _NotFlat:
+            data = yaml.load(header, Loader=YAMLLoader)
+            cached = (data if isinstance(data, dict) else {}, False)
+
+        _header_cache[key] = cached
+        if len(_header_cache) > HEADER_CACHE_SIZE:
+            _header_cache.popitem(last=False)
+    else:
+        _header_cache.move_to_end(key)
+
+    # Callers own their metadata dict (flat values only need the lists copied)
+    metadata, flat = cached
+    if flat:
+        return {key: list(value) if isinstance(value, list) else value for key, value in metadata.items()}
+    return copy.deepcopy(metadata)
+
+
+def _parse_flat(header: str) -> Dict:
+    """Fast path for flat `key: value` headers; raises _NotFlat for anything else"""
+    metadata = {}
+    list_key = None
+    list_indent = None
+
+    for line in header.split("\n"):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if "\t" in line[:len(line) - len(line.lstrip())]:
+            raise _NotFlat
+
+        if list_key is not None:
+            item = ITEM_LINE.match(line)
+            if item:
+                # Items at another indent continue / nest the previous item in YAML
+                indent = len(line) - len(line.lstrip())
+                if metadata[list_key] is None:
+                    metadata[list_key] = []
+                    list_indent = indent
+                elif indent != list_indent:
+                    raise _NotFlat
+                metadata[list_key].append(_scalar(item.group(1) or ""))
+                continue
+            list_key = None
+
+        if line[0] in " \t":
+            raise _NotFlat
+
+        match = KEY_LINE.match(line)
+        if not match:
+            raise _NotFlat
+
+        key = match.group(1).strip()
+        if _resolver.resolve(yaml.ScalarNode, key, (True, False)) != STR_TAG:
+            raise _NotFlat
+
+        value = match.group(2)
+        if not value:
+            # Either null or the start of a block list
+            metadata[key] = None
+            list_key = key
+        elif value.startswith("["):
+            metadata[key] = _inline_list(value)
+        else:
+            metadata[key] = _scalar(value)
+
+    return metadata
+
+
+def _inline_list(value: str) -> List:
+    if not value.endswith("]") or any(ch in value[1:-1] for ch in "[]{}\"'"):
+        raise _NotFlat
+
+    inner = value[1:-1].strip()
+    if not inner:
+        return []
+
+    items = [item.strip() for item in inner.split(",")]
+    if items[-1] == "":
+        items.pop()  # trailing comma
+    if any(not item for item in items):
+        raise _NotFlat
+    return [_scalar(item) for item in items]
+
+
+def _scalar(value: str):
+    """Resolve one scalar exactly like PyYAML would, or bail out"""
+    if not value:
+        return None
+
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        inner = value[1:-1]
+        if value[0] in inner or "\\" in inner:
+            raise _NotFlat
+        return inner
+
+    # Indicators, comments, nested mappings, anchors... → real YAML
+    if value[0] in "-?:,[]{}#&*!|>'\"%@`" or VALUE_INDICATOR.search(value) or value.endswith(":"):
+        raise _NotFlat
+
+    tag = _resolver.resolve(yaml.ScalarNode, value, (True, False))
+    if tag == STR_TAG:
+        return value
+    if tag == NULL_TAG:
+        return None
+    if tag == BOOL_TAG:
+        return value.lower() in ("yes", "true", "on")
+    if tag == INT_TAG and DECIMAL_INT.match(value):
+        return int(value)
+
+    # floats, dates, octal/hex/sexagesimal ints...
+    raise _NotFlat
@@ -0,0 +1,235 @@
+# src/tools/image_metadata.py
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+import logging
+import os
+import pickle
+import re
+import struct
+
+logger = logging.getLogger(__name__)
+
+
+# SOFn markers (baseline, progressive, lossless...), not DHT/JPG/DAC
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+# Only this much of an SVG is read looking for the <svg ...> tag
+SVG_HEADER_BYTES = 16 * 1024
+
+SVG_TAG = re.compile(rb"<svg\b([^>]*)>", re.IGNORECASE | re.DOTALL)
+SVG_LENGTH = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*(px)?\s*$")
+
+
+def read_image_header(path: str) -> Dict:
+    """
+    Width, height + format of an image, read from its header only
+
+    PNG (IHDR), GIF (logical screen), WebP (VP8/VP8L/VP8X), JPEG (first
+    SOF segment, skipping over the others with seek) and SVG (width/height
+    attributes, else viewBox). Pixel data is never read or decoded.
+
+    Returns:
+        {format, width, height}; width/height are None if unknown
+    """
+    with open(path, 'rb') as f:
+        head = f.read(32)
+
+        if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return _meta("png", width, height)
+
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            width, height = struct.unpack("<HH", head[6:10])
+            return _meta("gif", width, height)
+
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _webp(head)
+
+        if head[:2] == b"\xff\xd8":
+            return _jpeg(f)
+
+        f.seek(0)
+        text = f.read(SVG_HEADER_BYTES)
+        if b"<svg" in text.lower():
+            return _svg(text)
+
+    return _meta(Path(path).suffix.lstrip(".").lower() or None, None, None)
+
+
+def _meta(fmt: Optional[str], width: Optional[int], height: Optional[int]) -> Dict:
+    return {"format": fmt, "width": width, "height": height}
+
+
+def _webp(head: bytes) -> Dict:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", head[26:30])
+        return _meta("webp", width & 0x3FFF, height & 0x3FFF)
+    if chunk == b"VP8L" and head[20:21] == b"\x2f":
+        bits = int.from_bytes(head[21:25], "little")
+        return _meta("webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return _meta("webp", width, height)
+    return _meta("webp", None, None)
+
+
+def _jpeg(f) -> Dict:
+    """Walk JPEG segments (length-prefixed) until the first SOF marker"""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b"\xff":
+            byte = f.read(1)
+        while byte == b"\xff":  # fill bytes
+            byte = f.read(1)
+        if not byte:
+            break
+
+        marker = byte[0]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            continue  # standalone markers, no length
+        if marker == 0xD9:
+            break
+
+        segment = f.read(2)
+        if len(segment) < 2:
+            break
+        length = struct.unpack(">H", segment)[0]
+
+        if marker in JPEG_SOF_MARKERS:
+            sof = f.read(5)
+            if len(sof) < 5:
+                break
+            height, width = struct.unpack(">HH", sof[1:5])
+            return _meta("jpeg", width, height)
+
+        f.seek(length - 2, os.SEEK_CUR)
+
+    return _meta("jpeg", None, None)
+
+
+def _svg(text: bytes) -> Dict:
+    tag = SVG_TAG.search(text)
+    if not tag:
+        return _meta("svg", None, None)
+
+    attributes = dict(
+        (name.lower(), value)
+        for name, value in re.findall(r'([\w:-]+)\s*=\s*["\']([^"\']*)["\']', tag.group(1).decode('utf-8', 'replace'))
+    )
+
+    width = _svg_length(attributes.get("width"))
+    height = _svg_length(attributes.get("height"))
+    if width is None or height is None:
+        view_box = attributes.get("viewbox", "").replace(",", " ").split()
+        if len(view_box) == 4:
+            try:
+                width, height = float(view_box[2]), float(view_box[3])
+            except ValueError:
+                pass
+
+    if width is None or height is None:
+        return _meta("svg", None, None)
+    return _meta("svg", round(width), round(height))
+
+
+def _svg_length(value: Optional[str]) -> Optional[float]:
+    """Absolute (unitless / px) SVG length, None for %, em, etc."""
+    if not value:
+        return None
+    match = SVG_LENGTH.match(value)
+    return float(match.group(1)) if match else None
+
+
+class ImageMetadataCache:
+    """
+    Image header metadata cached by path + (mtime, size)
+
+    Unchanged images cost one stat() on repeat scans; their bytes are only
+    read again once the file changes. Persisted next to the scan manifest.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_path: str = None):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.entries: Dict[str, tuple] = {}  # path → (mtime_ns, size, metadata)
+        self.dirty = False
+
+    def load(self) -> "ImageMetadataCache":
+        """Load cache from disk (silently starts empty if missing/stale)"""
+        if self.cache_path is None or not self.cache_path.exists():
+            return self
+
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable image metadata cache: {e}")
+            return self
+
+        if data.get("version") == self.VERSION:
+            self.entries = data.get("entries", {})
+        return self
+
+    def save(self):
+        """Atomically write cache to disk (no-op if nothing changed)"""
+        if self.cache_path is None or not self.dirty:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({"version": self.VERSION, "entries": self.entries}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+    def get(self, path: str) -> Dict:
+        """
+        {format, width, height, bytes, aspect} for an image file
+
+        aspect is width / height (None when the size is unknown); all
+        fields are None if the file can't be read.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {"format": None, "width": None, "height": None, "bytes": None, "aspect": None}
+
+        entry = self.entries.get(path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return dict(entry[2])
+
+        try:
+            metadata = read_image_header(path)
+        except (OSError, struct.error) as e:
+            logger.warning(f"   ⚠️ Cannot read image header of {Path(path).name}: {e}")
+            metadata = _meta(None, None, None)
+
+        width, height = metadata["width"], metadata["height"]
+        metadata["bytes"] = stat.st_size
+        metadata["aspect"] = round(width / height, 3) if width and height else None
+
+        self.entries[path] = (stat.st_mtime_ns, stat.st_size, metadata)
+        self.dirty = True
+        return dict(metadata)
+
+    def describe(self, image: Dict) -> Dict:
+        """Copy of a resolved image dict ({name, found, path, safe}) with its metadata"""
+        return {**image, **self.get(image["path"])}
+
+    def prune(self, paths: Iterable[str]) -> int:
+        """Forget images that are gone, return how many entries were dropped"""
+        keep = set(paths)
+        stale = [path for path in self.entries if path not in keep]
+        for path in stale:
+            del self.entries[path]
+        if stale:
+            self.dirty = True
+        return len(stale)
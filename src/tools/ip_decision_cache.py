@@ -0,0 +1,90 @@
+# src/tools/ip_decision_cache.py
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+logger = logging.getLogger(__name__)
+
+
+def tags_hash(metadata: Dict) -> str:
+    """Stable hash of a note's frontmatter tags (the only metadata the filter reads)"""
+    tags = metadata.get('tags') if metadata else None
+    encoded = json.dumps(tags, sort_keys=True, default=str, ensure_ascii=False).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+class IPDecisionCache:
+    """
+    Persistent allow/block decisions of the IP filter
+
+    Keyed by (content hash, tags hash) under a ruleset fingerprint: the
+    whole cache is dropped as soon as the block rules or Presence.md
+    change, so a hit is always what the filter would decide today.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_path: str = None):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.fingerprint: Optional[str] = None
+        self.entries: Dict[Tuple[str, str], tuple] = {}  # (content hash, tags hash) → decision tuple
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, fingerprint: str) -> "IPDecisionCache":
+        """Load decisions made under this ruleset fingerprint (silently starts empty otherwise), counting afresh"""
+        self.fingerprint = fingerprint
+        self.entries = {}
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_path is None or not self.cache_path.exists():
+            return self
+
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable IP decision cache: {e}")
+            return self
+
+        if data.get("version") == self.VERSION and data.get("fingerprint") == fingerprint:
+            self.entries = data.get("entries", {})
+        return self
+
+    def save(self):
+        """Atomically write the decisions used this run"""
+        if self.cache_path is None:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                "version": self.VERSION,
+                "fingerprint": self.fingerprint,
+                "entries": {key: self.entries[key] for key in self.used if key in self.entries},
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, self.cache_path)
+
+    def get(self, key: Tuple[str, str]) -> Optional[tuple]:
+        self.used.add(key)
+        decision = self.entries.get(key)
+        if decision is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return decision
+
+    def put(self, key: Tuple[str, str], decision: tuple):
+        self.used.add(key)
+        self.entries[key] = tuple(decision)
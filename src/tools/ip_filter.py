@@ -1,7 +1,96 @@
 # src/tools/ip_filter.py
 
 from pathlib import Path
-import frontmatter
+from typing import Dict, List, NamedTuple, Optional
+import hashlib
+import logging
+import re
+
+from .ip_decision_cache import IPDecisionCache, tags_hash
+from .presence_cache import PresenceContext, PresenceMatch, extract_public_narrative, get_presence
+
+logger = logging.getLogger(__name__)
+
+
+# Hard block: vault-only tags in frontmatter (without #)
+VAULT_ONLY_TAGS = frozenset(['vault-only', 'private', 'internal', 'confidential', 'secret'])
+
+# Hard block: sensitive patterns (STRICT - only truly dangerous stuff)
+DANGEROUS_PATTERNS = (
+    'api_key',
+    'secret_key',
+    'password:',
+    'token:',
+    'private_key',
+    'credential',
+)
+
+# Block: Personal/private markers in content (lowercase)
+PRIVATE_MARKERS = (
+    '#vault-only',
+    '#private',
+    '#internal',
+    '⚠️ vault only',
+    '⚠️ private',
+)
+
+
+class FilterDecision(NamedTuple):
+    """Outcome of is_safe_to_share(): truthy when the note may be shared"""
+    safe: bool
+    rule: Optional[str] = None      # pattern / marker / tag that blocked the note
+    kind: Optional[str] = None      # "tag", "pattern" or "marker"
+    position: Optional[int] = None  # offset in the note body (index in tags for "tag")
+
+    def __bool__(self) -> bool:
+        return self.safe
+
+    @property
+    def reason(self) -> str:
+        if self.safe:
+            return "safe"
+        where = f"tag #{self.position + 1}" if self.kind == "tag" else f"offset {self.position}"
+        return f"{self.kind} '{self.rule}' at {where}"
+
+
+SAFE = FilterDecision(True)
+
+
+def _rules_repr() -> bytes:
+    return repr((sorted(VAULT_ONLY_TAGS), DANGEROUS_PATTERNS, PRIVATE_MARKERS)).encode('utf-8')
+
+
+def _compile_block_rules():
+    """
+    One regex for every content rule, plus suffix → rules for reporting
+
+    A literal with punctuation in it (api_key, token:, #private...) is
+    matched from that character on, with a lookbehind for the rest, and
+    literals sharing that suffix share one branch: the regex engine then
+    only tries those branches at rare characters like _ : # instead of
+    at every common letter. No capture groups, they would disable the
+    engine's first-character skipping.
+    """
+    rules = [(rule, "pattern") for rule in DANGEROUS_PATTERNS] + [(rule, "marker") for rule in PRIVATE_MARKERS]
+    branches = {}
+    for rule, kind in rules:
+        anchor = next((i for i, ch in enumerate(rule) if not ch.isalnum() and not ch.isspace()), 0)
+        branches.setdefault(rule[anchor:], []).append((rule, kind))
+    
+    parts = []
+    for suffix, candidates in branches.items():
+        if len(candidates) == 1 and candidates[0][0] == suffix:
+            parts.append(re.escape(suffix))
+        else:
+            lookbehinds = "|".join(f"(?<={re.escape(rule)})" for rule, _ in candidates)
+            parts.append(f"{re.escape(suffix)}(?:{lookbehinds})")
+    
+    # Plain literals first, anchored branches after
+    parts.sort(key=lambda part: "(?" in part)
+    return re.compile("|".join(parts)), branches
+
+
+BLOCK_RULES, BLOCK_RULE_BRANCHES = _compile_block_rules()
 
 
 class PresenceBasedIPFilter:
@@ -10,9 +99,25 @@ class PresenceBasedIPFilter:
     for what's shareable vs vault-only
     """
     
-    def __init__(self, vault_path: str):
+    def __init__(self, vault_path: str, cache_dir: str = None):
         self.vault_path = Path(vault_path)
-        self.presence_page = self.load_presence()
+        if self.presence.path is None:
+            logger.warning(f"⚠️ Presence file not found, using permissive filtering")
+        
+        # Persistent decisions for check_page() (None = no cache_dir, always filter)
+        self.decisions = IPDecisionCache(Path(cache_dir) / "ip_decisions.pkl") if cache_dir else None
+        self._decisions_fingerprint = None
+        self._fingerprint_for = None
+        self._fingerprint = None
+    
+    @property
+    def presence(self) -> PresenceContext:
+        """Shared Presence.md context (re-parsed only when the file changes)"""
+        return get_presence(self.vault_path)
+    
+    @property
+    def presence_page(self) -> dict:
+        return self.load_presence()
     
     def load_presence(self) -> dict:
         """
@@ -20,121 +125,124 @@ class PresenceBasedIPFilter:
         - What happened today (public-ready content)
         - Tagged exclusions (vault-only)
         """
-        # Try both spellings
-        presence_files = [
-            self.vault_path / "Precence.md",  # Your actual file
-            self.vault_path / "Presence.md",
-            self.vault_path / "Mobile_Vaulte" / "Precence.md",  # Subfolder
-        ]
-        
-        presence_file = None
-        for pf in presence_files:
-            if pf.exists():
-                presence_file = pf
-                break
-        
-        if not presence_file:
-            print(f"⚠️ Presence file not found, using permissive filtering")
-            return {
-                'daily_summary': '',
-                'public_narrative': [],
-                'timestamp': 'unknown'
-            }
-        
-        try:
-            with open(presence_file, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
-            
-            return {
-                'daily_summary': post.content,
-                'public_narrative': self.extract_public_narrative(post.content),
-                'timestamp': post.metadata.get('updated', 'unknown')
-            }
-        except Exception as e:
-            print(f"⚠️ Error loading Presence file: {e}")
-            return {
-                'daily_summary': '',
-                'public_narrative': [],
-                'timestamp': 'unknown'
-            }
+        presence = self.presence
+        return {
+            'daily_summary': presence.content,
+            'public_narrative': presence.public_narrative,
+            'timestamp': presence.timestamp
+        }
     
-    def is_safe_to_share(self, note_content: str, note_metadata: dict) -> bool:
+    def is_safe_to_share(self, note_content: str, note_metadata: dict) -> "FilterDecision":
         """
         Check against presence page + manual vault exclusions
-        """
         
-        # Hard block: vault-only tags (check both with and without #)
-        vault_only_tags = ['vault-only', 'private', 'internal', 'confidential', 'secret']
-        metadata_tags = note_metadata.get('tags', [])
+        All block rules are compiled once (see BLOCK_RULES); the note is
+        lowercased once and scanned in a single regex pass that stops at
+        the first hit.
         
-        # Check if any vault-only tag is present
-        for tag in metadata_tags:
-            tag_clean = tag.lower().replace('#', '').strip()
-            if tag_clean in vault_only_tags:
-                return False
+        Returns:
+            FilterDecision (truthy when safe) with the rule that blocked
+            the note and where it matched
+        """
+        # Hard block: vault-only tags (check both with and without #)
+        tags = note_metadata.get('tags') or []
+        if isinstance(tags, str):
+            tags = [tags]
         
-        # Hard block: sensitive patterns (STRICT - only truly dangerous stuff)
-        dangerous_patterns = [
-            'api_key',
-            'secret_key',
-            'password:',
-            'token:',
-            'private_key',
-            'credential',
-        ]
+        for index, tag in enumerate(tags):
+            tag_clean = str(tag).lower().replace('#', '').strip()
+            if tag_clean in VAULT_ONLY_TAGS:
+                return FilterDecision(False, tag_clean, "tag", index)
         
+        # Hard block: sensitive patterns + private markers, one pass
         content_lower = note_content.lower()
-        if any(pattern in content_lower for pattern in dangerous_patterns):
-            return False
-        
-        # Block: Personal/private markers in content
-        private_markers = [
-            '#vault-only',
-            '#private',
-            '#internal',
-            '⚠️ vault only',
-            '⚠️ private',
-        ]
-        
-        if any(marker.lower() in content_lower for marker in private_markers):
-            return False
+        match = BLOCK_RULES.search(content_lower)
+        if match:
+            end = match.end()
+            for rule, kind in BLOCK_RULE_BRANCHES[match.group()]:
+                if content_lower.startswith(rule, end - len(rule)):
+                    return FilterDecision(False, rule, kind, end - len(rule))
         
         # PERMISSIVE: Allow by default if no red flags
         # (We're not blocking code snippets anymore - those can be shared!)
-        return True
+        return SAFE
+    
+    @staticmethod
+    def rules_fingerprint() -> str:
+        """Hash of the block rules alone (what decides safe vs blocked, whatever Presence.md says)"""
+        return hashlib.blake2b(_rules_repr(), digest_size=16).hexdigest()
+    
+    def ruleset_fingerprint(self) -> str:
+        """Hash of every input a decision depends on: block rules + Presence.md"""
+        presence = self.presence
+        if self._fingerprint_for is presence:
+            return self._fingerprint  # same parsed Presence.md → same fingerprint
+        
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(_rules_repr())
+        digest.update(presence.content.encode('utf-8'))
+        digest.update(repr(presence.metadata).encode('utf-8'))
+        self._fingerprint_for, self._fingerprint = presence, digest.hexdigest()
+        return self._fingerprint
+    
+    def check_page(self, page: Dict) -> FilterDecision:
+        """
+        is_safe_to_share() for a scanned page, answered from the decision cache when possible
+        
+        Unchanged note + tags under the same ruleset → cached decision,
+        without loading the (lazy) page body.
+        """
+        if self.decisions is None or not page.get("content_hash"):
+            return self.is_safe_to_share(page["content"], page["metadata"])
+        
+        fingerprint = self.ruleset_fingerprint()
+        if fingerprint != self._decisions_fingerprint:
+            # First check of a run, or rules / Presence.md changed mid-run
+            self.decisions.load(fingerprint)
+            self._decisions_fingerprint = fingerprint
+        
+        key = (page["content_hash"], tags_hash(page["metadata"]))
+        cached = self.decisions.get(key)
+        if cached is not None:
+            return FilterDecision(*cached)
+        
+        decision = self.is_safe_to_share(page["content"], page["metadata"])
+        self.decisions.put(key, decision)
+        return decision
+    
+    def save_decisions(self):
+        """Persist the run's decisions; the next check_page() starts a new run (reload + fresh counters)"""
+        if self.decisions is not None and self._decisions_fingerprint is not None:
+            self.decisions.save()
+            self._decisions_fingerprint = None
     
     def extract_public_narrative(self, presence_content: str) -> list:
         """
         Extract bullet points/sections marked as shareable
         from your daily Presence notes
         """
-        if not presence_content:
-            return []
-        
-        lines = presence_content.split('\n')
-        # Filter out lines marked as private
-        public_items = [
-            line for line in lines 
-            if not any(marker in line.lower() for marker in ['⚠️', 'vault-only', 'private'])
-        ]
-        return public_items
+        return extract_public_narrative(presence_content)
     
     def is_mentioned_in_presence(self, note_content: str) -> bool:
         """
         Check if content or keywords from note appear in Presence.md
         Simple matching for now (can be upgraded to semantic similarity)
         """
-        if not self.presence_page['public_narrative']:
-            return False
+        # Extract key keywords from note (first 20 words), looked up in the presence index
+        opening = " ".join(note_content.split()[:20])
         
-        presence_text = '\n'.join(self.presence_page['public_narrative']).lower()
-        
-        # Extract key keywords from note (first 20 words)
-        words = note_content.split()[:20]
-        significant_words = [w for w in words if len(w) > 4]
+        # If 2+ words match, likely related to public narrative
+        return self.presence.match(opening).score >= 2
+    
+    def score_pages(self, pages: List[Dict]) -> List[PresenceMatch]:
+        """
+        Score many pages against today's presence in one call
         
-        # Check if any significant words appear in presence
-        matches = sum(1 for word in significant_words if word.lower() in presence_text)
+        The presence index is fetched once for the batch; each page costs
+        one tokenizer pass over its title + content.
         
-        # If 2+ words match, likely related to public narrative
-        return matches >= 2
+        Returns:
+            PresenceMatch (score, matched tokens, matching presence lines) per page
+        """
+        presence = self.presence
+        return [presence.match(f"{page.get('title', '')}\n{page.get('content', '')}") for page in pages]
@@ -0,0 +1,152 @@
+# src/tools/jsonl_store.py
+
+from pathlib import Path
+from typing import Dict, Iterable, Iterator
+import gzip
+import io
+import json
+import os
+
+# Optional fast JSON backend (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional zstd (stdlib from Python 3.14, else the zstandard package)
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def dumps(record) -> bytes:
+    """One compact JSON line (UTF-8, newline-terminated)"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def jsonl_path(base_path, compression: str = None) -> Path:
+    """safe_content.jsonl (+ .gz / .zst for the given compression)"""
+    path = Path(base_path)
+    if compression and compression != "none":
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression {compression!r} (expected one of {sorted(COMPRESSION_SUFFIXES)})")
+        path = path.with_name(path.name + COMPRESSION_SUFFIXES[compression])
+    return path
+
+
+def find_jsonl(base_path) -> Path:
+    """Newest existing variant of a JSONL artifact (plain, .gz or .zst), None if there is none"""
+    candidates = [jsonl_path(base_path, compression) for compression in (None, *COMPRESSION_SUFFIXES)]
+    existing = [path for path in candidates if path.exists()]
+    return max(existing, key=lambda path: path.stat().st_mtime) if existing else None
+
+
+def _open(path: Path, mode: str, suffix: str = None):
+    """Binary stream of a (possibly compressed) file, compression picked by suffix (default: the path's)"""
+    suffix = suffix or path.suffix
+    if suffix == ".gz":
+        return gzip.open(path, mode, compresslevel=6) if "w" in mode else gzip.open(path, mode)
+    if suffix == ".zst":
+        if zstd is None:
+            raise RuntimeError(f"{path.name}: zstd needs Python 3.14+ or `pip install zstandard`")
+        if hasattr(zstd, "open"):
+            return zstd.open(path, mode)
+        raw = open(path, mode)
+        if "w" in mode:
+            return zstd.ZstdCompressor(level=3).stream_writer(raw, closefd=True)
+        return io.BufferedReader(zstd.ZstdDecompressor().stream_reader(raw, closefd=True))
+    return open(path, mode, buffering=1 << 16)
+
+
+class JsonlWriter:
+    """
+    Append records to a JSONL file as they are produced
+
+    Lines go to a temp file that replaces the target on close(), so a
+    reader never sees a half-written artifact and a crashed run keeps
+    the previous one. Compression follows the suffix (.gz, .zst).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self.count = 0
+        self._file = _open(self.tmp_path, "wb", self.path.suffix)
+
+    def write(self, record: Dict):
+        self._file.write(dumps(record))
+        self.count += 1
+
+    def write_all(self, records) -> int:
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Drop what was written, the existing artifact stays untouched"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self.tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
+def iter_jsonl(path) -> Iterator[Dict]:
+    """Stream the records of a JSONL file one line at a time (blank lines skipped)"""
+    with _open(Path(path), "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def iter_records(base_path) -> Iterator[Dict]:
+    """
+    Records of a phase artifact: the newest JSONL variant, streamed lazily
+
+    Falls back to the legacy JSON array (same name, .json) written by
+    older runs; that one is loaded in full.
+    """
+    path = find_jsonl(base_path)
+    if path is not None:
+        yield from iter_jsonl(path)
+        return
+
+    legacy_path = Path(base_path).with_suffix(".json")
+    if not legacy_path.exists():
+        raise FileNotFoundError(f"{Path(base_path).name} not found")
+    with open(legacy_path, 'r', encoding='utf-8') as f:
+        yield from json.load(f)
+
+
+def write_jsonl(path, records: Iterable[Dict]) -> int:
+    """Write all records to a JSONL file (atomic), returns the count"""
+    with JsonlWriter(path) as writer:
+        return writer.write_all(records)
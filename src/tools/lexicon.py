@@ -0,0 +1,114 @@
+# src/tools/lexicon.py
+
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+import re
+
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Keywords at least this long also match longer words they start
+# ("tech" → "technical", "learn" → "learning"); shorter ones must match
+# a whole word, so "ai" doesn't fire on "said" nor "api" on "capital"
+PREFIX_MATCH_LENGTH = 4
+
+
+def tokenize(text: str) -> Tuple[List[str], Counter]:
+    """Lowercased word tokens of a text + their counts (the one pass lexicons match against)"""
+    tokens = WORD_PATTERN.findall(text.lower())
+    return tokens, Counter(tokens)
+
+
+class LexiconMatcher:
+    """
+    Keyword lexicons compiled once, matched against a note's word tokens
+
+    Every (group, label, keyword) triple becomes a signal id. Single
+    keywords are matched against the note's distinct words (exact for
+    short keywords, at word start for longer ones) in one regex scan;
+    multi-word keywords ("how to") only walk the token list when their
+    first word occurs in the note.
+    """
+
+    def __init__(self, groups: Dict[str, Dict[str, Iterable[str]]]):
+        self.signals: List[Tuple[str, str, str]] = []  # signal id → (group, label, keyword)
+
+        exact, prefixes, phrases = {}, {}, {}
+        for group, labels in groups.items():
+            for label, keywords in labels.items():
+                for keyword in keywords:
+                    keyword = keyword.lower()
+                    signal = len(self.signals)
+                    self.signals.append((group, label, keyword))
+
+                    words = tuple(WORD_PATTERN.findall(keyword))
+                    if len(words) > 1:
+                        phrases.setdefault(words[0], []).append((words, signal))
+                    elif len(keyword) >= PREFIX_MATCH_LENGTH:
+                        prefixes.setdefault(keyword, []).append(signal)
+                    elif keyword:
+                        exact.setdefault(keyword, []).append(signal)
+
+        # The regex reports the longest keyword starting a word, which also fires any shorter one it extends
+        self.exact = exact
+        self.prefixes = {
+            keyword: [signal for other, signals in prefixes.items() if keyword.startswith(other) for signal in signals]
+            for keyword in prefixes
+        }
+        self.phrases = phrases
+
+        # Text matching (no tokenizer): a C substring test per keyword, the
+        # word-boundary regex only runs for keywords that occur at all
+        self.checks = []
+        for signal, (_, _, keyword) in enumerate(self.signals):
+            words = WORD_PATTERN.findall(keyword)
+            if not words:
+                continue
+            # Literal first (lets re use its fast prefix search), word-start check right after it
+            first = re.escape(words[0])
+            pattern = first + r"(?<!\w" + first + ")" + "".join(r"\W+" + re.escape(word) for word in words[1:])
+            if len(words) > 1 or len(keyword) < PREFIX_MATCH_LENGTH:
+                pattern += r"(?!\w)"
+            self.checks.append((words[0], re.compile(pattern), signal))
+
+        alternatives = sorted(prefixes, key=len, reverse=True)
+        self.prefix_pattern = re.compile(r"^(?:" + "|".join(map(re.escape, alternatives)) + ")", re.MULTILINE) \
+            if alternatives else None
+
+    def match(self, tokens: List[str], counts: Counter) -> set:
+        """Signal ids fired by a note's tokens (see tokenize())"""
+        fired = set()
+        for word, signals in self.exact.items():
+            if word in counts:
+                fired.update(signals)
+        if self.prefix_pattern is not None:
+            for prefix in set(self.prefix_pattern.findall("\n".join(counts))):
+                fired.update(self.prefixes[prefix])
+
+        for first, phrases in self.phrases.items():
+            if first not in counts:
+                continue
+            for words, signal in phrases:
+                if signal in fired:
+                    continue
+                size = len(words)
+                if any(tuple(tokens[i:i + size]) == words
+                       for i, token in enumerate(tokens) if token == first):
+                    fired.add(signal)
+
+        return fired
+
+    def match_text(self, text: str) -> set:
+        """
+        Signal ids fired by a raw text, same rules as match()
+
+        For callers without tokens: costs about one substring scan per
+        keyword instead of a full tokenizer pass.
+        """
+        lower = text.lower()
+        return {signal for first, check, signal in self.checks if first in lower and check.search(lower)}
+
+    def labels(self, signals: Iterable[int], group: str = None) -> set:
+        """Labels fired by these signal ids (optionally only within one group)"""
+        return {self.signals[signal][1] for signal in signals
+                if group is None or self.signals[signal][0] == group}
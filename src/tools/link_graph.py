@@ -0,0 +1,306 @@
+# src/tools/link_graph.py
+
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+import os
+import pickle
+import posixpath
+
+from .attachment_index import AttachmentIndex
+
+logger = logging.getLogger(__name__)
+
+
+class LinkGraph:
+    """
+    Wikilink graph of the vault (notes = nodes, resolved [[links]] = edges)
+
+    Nodes are vault-relative note paths. Each note keeps its raw link
+    targets, resolved with the same Obsidian rules as attachments
+    (note folder, vault root, path suffix, shortest path). Updates are
+    incremental: changing a note re-resolves only its own links, adding
+    or removing a note re-resolves only the notes that reference its name.
+
+    On disk the out-edges are stored as CSR integer arrays
+    (offsets + targets); backlinks are rebuilt from them on load.
+    """
+
+    VERSION = 1
+
+    def __init__(self, graph_path: str = None, vault_path: str = None):
+        self.graph_path = Path(graph_path) if graph_path else None
+        self.vault_path = str(Path(vault_path).resolve()) if vault_path else None
+
+        self.keys: List[Optional[str]] = []        # node id → note key (None = removed)
+        self.ids: Dict[str, int] = {}              # note key → node id
+        self.links: List[Tuple[str, ...]] = []     # node id → normalized link targets
+        self.out: List[array] = []                 # node id → resolved target ids
+        self.inbound: List[Set[int]] = []          # node id → ids linking here
+
+        # Only needed to (re)resolve links, built on first update after a load
+        self._notes: Optional[AttachmentIndex] = AttachmentIndex()   # Obsidian-style resolution
+        self._referrers: Optional[Dict[str, Set[int]]] = {}          # lowercased target name → source ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.ids
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(self.out[node]) for node in self.ids.values())
+
+    # ===== Persistence =====
+
+    def load(self) -> "LinkGraph":
+        """Load graph from disk (silently starts empty if missing/stale)"""
+        if self.graph_path is None or not self.graph_path.exists():
+            return self
+
+        try:
+            with open(self.graph_path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable link graph: {e}")
+            return self
+
+        if data.get("version") != self.VERSION:
+            return self
+        if self.vault_path and data.get("vault_path") != self.vault_path:
+            return self
+
+        keys = data["keys"].split("\n") if data["keys"] else []
+        links = data["links"].split("\n") if keys else []
+        offsets = array('I')
+        offsets.frombytes(data["offsets"])
+        targets = array('I')
+        targets.frombytes(data["targets"])
+
+        self.keys = keys
+        self.ids = {key: node for node, key in enumerate(keys)}
+        self.links = [tuple(entry.split("\x1f")) if entry else () for entry in links]
+        self.out = [targets[offsets[node]:offsets[node + 1]] for node in range(len(keys))]
+        self.inbound = [set() for _ in keys]
+
+        for node, targets in enumerate(self.out):
+            for target in targets:
+                self.inbound[target].add(node)
+
+        # Read-only users (queries) never pay for the resolution indexes
+        self._notes = None
+        self._referrers = None
+        return self
+
+    @property
+    def notes(self) -> AttachmentIndex:
+        if self._notes is None:
+            self._notes = AttachmentIndex()
+            for key in self.ids:
+                self._notes.add(key)
+        return self._notes
+
+    @property
+    def referrers(self) -> Dict[str, Set[int]]:
+        if self._referrers is None:
+            self._referrers = {}
+            for node in self.ids.values():
+                for target in self.links[node]:
+                    self._referrers.setdefault(_name(target), set()).add(node)
+        return self._referrers
+
+    def save(self):
+        """Atomically write the graph as compact CSR arrays (removed nodes are dropped)"""
+        if self.graph_path is None:
+            raise ValueError("LinkGraph.save() requires a graph_path")
+
+        alive = [node for node, key in enumerate(self.keys) if key is not None]
+        remap = {node: new_id for new_id, node in enumerate(alive)}
+
+        offsets = array('I', [0])
+        targets = array('I')
+        for node in alive:
+            targets.extend(remap[target] for target in self.out[node])
+            offsets.append(len(targets))
+
+        self.graph_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.graph_path.with_suffix(self.graph_path.suffix + ".tmp")
+
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                "version": self.VERSION,
+                "vault_path": self.vault_path,
+                "keys": "\n".join(self.keys[node] for node in alive),
+                "links": "\n".join("\x1f".join(self.links[node]) for node in alive),
+                "offsets": offsets.tobytes(),
+                "targets": targets.tobytes(),
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, self.graph_path)
+
+    # ===== Incremental updates =====
+
+    def update(self, key: str, links: Iterable[str]) -> bool:
+        """Set a note's raw [[link]] targets, return True if its links changed"""
+        normalized = tuple(dict.fromkeys(
+            target for target in (normalize_link(link) for link in links) if target
+        ))
+
+        node = self.ids.get(key)
+        if node is None:
+            node = self._add_node(key)
+        elif self.links[node] == normalized:
+            return False
+
+        referrers = self.referrers
+        for target in self.links[node]:
+            referrers[_name(target)].discard(node)
+        for target in normalized:
+            referrers.setdefault(_name(target), set()).add(node)
+
+        self.links[node] = normalized
+        self._resolve_source(node)
+        return True
+
+    def remove(self, key: str):
+        node = self.ids.pop(key, None)
+        if node is None:
+            return
+
+        referrers = self.referrers
+        for target in self.links[node]:
+            referrers[_name(target)].discard(node)
+        self.links[node] = ()
+        self._set_out(node, array('I'))
+
+        self.keys[node] = None
+        self.notes.remove(key)
+
+        # Notes that linked here may now resolve to another note (or nothing)
+        self._reresolve_name(key)
+
+    def sync(self, keys: Iterable[str]) -> tuple:
+        """Bring the node set in line with the latest walk, return (added, removed) counts"""
+        current = set(keys)
+        removed = [key for key in self.ids if key not in current]
+        added = [key for key in current if key not in self.ids]
+
+        for key in removed:
+            self.remove(key)
+        for key in sorted(added):
+            self._add_node(key)
+
+        return len(added), len(removed)
+
+    def _add_node(self, key: str) -> int:
+        node = len(self.keys)
+        self.keys.append(key)
+        self.ids[key] = node
+        self.links.append(())
+        self.out.append(array('I'))
+        self.inbound.append(set())
+        self.notes.add(key)
+
+        # Links that were unresolved (or resolved elsewhere) may now land here
+        self._reresolve_name(key)
+        return node
+
+    def _reresolve_name(self, key: str):
+        for source in list(self.referrers.get(_name(key), ())):
+            self._resolve_source(source)
+
+    def _resolve_source(self, node: int):
+        note_dir = posixpath.dirname(self.keys[node])
+        notes = self.notes
+        resolved = []
+        for target in self.links[node]:
+            rel_path = notes.resolve(target, note_dir)
+            target_id = self.ids.get(rel_path) if rel_path else None
+            if target_id is not None and target_id != node and target_id not in resolved:
+                resolved.append(target_id)
+        self._set_out(node, array('I', resolved))
+
+    def _set_out(self, node: int, targets: array):
+        for target in self.out[node]:
+            self.inbound[target].discard(node)
+        for target in targets:
+            self.inbound[target].add(node)
+        self.out[node] = targets
+
+    # ===== Queries =====
+
+    def resolve(self, link: str, source_key: str = "") -> Optional[str]:
+        """Resolve a raw [[link]] target to a note key (None if it doesn't exist)"""
+        target = normalize_link(link)
+        if not target:
+            return None
+        return self.notes.resolve(target, posixpath.dirname(source_key))
+
+    def outlinks(self, key: str) -> List[str]:
+        return [self.keys[target] for target in self.out[self.ids[key]]]
+
+    def backlinks(self, key: str) -> List[str]:
+        return sorted(self.keys[source] for source in self.inbound[self.ids[key]])
+
+    def orphans(self) -> List[str]:
+        """Notes with no resolved links in or out (Obsidian's graph view orphans)"""
+        return sorted(key for key, node in self.ids.items()
+                      if not self.out[node] and not self.inbound[node])
+
+    def neighborhood(self, key: str, hops: int = 1, direction: str = "both") -> Dict[str, int]:
+        """
+        Notes within `hops` links of a note (breadth-first)
+
+        Args:
+            direction: "out" (follow links), "in" (follow backlinks) or "both"
+
+        Returns:
+            {note key: hop distance}, the note itself excluded
+        """
+        start = self.ids[key]
+        follow_out = direction in ("out", "both")
+        follow_in = direction in ("in", "both")
+
+        distances = {start: 0}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            distance = distances[node] + 1
+            if distance > hops:
+                continue
+
+            neighbors = []
+            if follow_out:
+                neighbors.extend(self.out[node])
+            if follow_in:
+                neighbors.extend(self.inbound[node])
+
+            for neighbor in neighbors:
+                if neighbor not in distances:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+
+        del distances[start]
+        return {self.keys[node]: distance for node, distance in distances.items()}
+
+    def degree(self, key: str) -> int:
+        node = self.ids[key]
+        return len(self.out[node]) + len(self.inbound[node])
+
+
+def normalize_link(link: str) -> str:
+    """[[Folder/Note#Heading|alias]] target → "Folder/Note.md" ("" for same-note links)"""
+    target = link.split("|", 1)[0].split("#", 1)[0].strip()
+    if not target:
+        return ""
+    if not target.lower().endswith(".md"):
+        target += ".md"
+    return target
+
+
+def _name(target: str) -> str:
+    """Lowercased file name of a note key / normalized link target"""
+    return target.rsplit("/", 1)[-1].lower()
@@ -0,0 +1,220 @@
+# src/tools/near_duplicates.py
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+import logging
+import os
+import pickle
+import re
+import zlib
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Prime just above 2**32: (a * x + b) % p stays exact in uint64 for 32-bit a, b, x
+MINHASH_PRIME = np.uint64(4294967311)
+MAX_HASH = np.uint64(0xFFFFFFFF)
+
+
+class NearDuplicateDetector:
+    """
+    Near-duplicate notes via MinHash signatures + LSH banding
+
+    Each note is reduced to a MinHash signature over its word shingles
+    (cached per content hash, so unchanged notes are never re-shingled).
+    Signatures are split into bands; only notes sharing a band bucket are
+    compared, and pairs whose estimated Jaccard similarity reaches the
+    threshold are merged into clusters (union-find).
+
+    bands × rows must equal num_perm; with 16 × 8 the LSH S-curve sits
+    around 0.7, below the 0.8 default threshold, so true duplicates are
+    very unlikely to be missed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_path: str = None, num_perm: int = 128, bands: int = 16,
+                 shingle_size: int = 5, threshold: float = 0.8, seed: int = 42):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self.perm_a = rng.integers(1, 2 ** 32, size=num_perm, dtype=np.uint64)
+        self.perm_b = rng.integers(0, 2 ** 32, size=num_perm, dtype=np.uint64)
+
+        self.signatures: Dict[str, np.ndarray] = {}  # note key → signature
+        self.cache: Dict[str, bytes] = {}            # content hash → signature bytes
+        self.used_hashes = set()
+        self.cache_hits = 0
+
+    # ===== Signature cache =====
+
+    @property
+    def params(self) -> tuple:
+        return (self.VERSION, self.num_perm, self.shingle_size, self.seed)
+
+    def load(self) -> "NearDuplicateDetector":
+        """Load cached signatures (silently starts empty if missing/stale), starting a new run"""
+        # Notes are clustered per run: nothing from an earlier run on this instance carries over
+        self.signatures = {}
+        self.cache = {}
+        self.used_hashes = set()
+        self.cache_hits = 0
+
+        if self.cache_path is None or not self.cache_path.exists():
+            return self
+
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable MinHash cache: {e}")
+            return self
+
+        # Different permutations / shingling → signatures aren't comparable
+        if data.get("params") == self.params:
+            self.cache = data.get("signatures", {})
+        return self
+
+    def save(self):
+        """Atomically write signatures of the notes seen this run"""
+        if self.cache_path is None:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                "params": self.params,
+                "signatures": {key: self.cache[key] for key in self.used_hashes if key in self.cache},
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, self.cache_path)
+
+    # ===== Signatures =====
+
+    def add(self, key: str, content: Union[str, Callable[[], str]], content_hash: str = None) -> Optional[np.ndarray]:
+        """
+        Register a note, return its signature (None for notes without words)
+
+        content may be a callable returning the body: it is only called
+        when content_hash isn't cached, so a hit never loads the note.
+        """
+        signature = None
+        if content_hash is not None:
+            self.used_hashes.add(content_hash)
+            cached = self.cache.get(content_hash)
+            if cached is not None:
+                self.cache_hits += 1
+                signature = np.frombuffer(cached, dtype=np.uint32) if cached else None
+
+        if content_hash is None or content_hash not in self.cache:
+            signature = self.signature(content() if callable(content) else content)
+            if content_hash is not None:
+                self.cache[content_hash] = signature.tobytes() if signature is not None else b""
+
+        if signature is not None:
+            self.signatures[key] = signature
+        return signature
+
+    def shingles(self, content: str) -> np.ndarray:
+        """Unique 32-bit hashes of the note's word k-shingles"""
+        words = WORD_PATTERN.findall(content.lower())
+        if not words:
+            return np.empty(0, dtype=np.uint64)
+
+        word_hashes = np.fromiter((zlib.crc32(word.encode('utf-8')) for word in words),
+                                  dtype=np.uint64, count=len(words))
+
+        k = min(self.shingle_size, len(words))
+        count = len(words) - k + 1
+        shingles = np.zeros(count, dtype=np.uint64)
+        for offset in range(k):
+            # Polynomial rolling combination of k consecutive word hashes, mod 2**32
+            shingles = (shingles * np.uint64(1000003) + word_hashes[offset:offset + count]) & MAX_HASH
+
+        return np.unique(shingles)
+
+    def signature(self, content: str) -> Optional[np.ndarray]:
+        shingles = self.shingles(content)
+        if not len(shingles):
+            return None
+
+        signature = np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        # Chunked so huge notes don't build a num_perm × shingles matrix in one go
+        for start in range(0, len(shingles), 4096):
+            chunk = shingles[start:start + 4096]
+            hashed = (np.outer(self.perm_a, chunk) + self.perm_b[:, None]) % MINHASH_PRIME
+            np.minimum(signature, (hashed & MAX_HASH).min(axis=1), out=signature)
+
+        return signature.astype(np.uint32)
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.count_nonzero(first == second)) / len(first)
+
+    # ===== LSH + clustering =====
+
+    def candidate_pairs(self) -> set:
+        """Pairs of note keys sharing at least one LSH band bucket"""
+        keys = list(self.signatures)
+        if not keys:
+            return set()
+
+        matrix = np.stack([self.signatures[key] for key in keys])
+        pairs = set()
+        for band in range(self.bands):
+            buckets: Dict[bytes, List[int]] = {}
+            rows = np.ascontiguousarray(matrix[:, band * self.rows:(band + 1) * self.rows])
+            for index in range(len(keys)):
+                buckets.setdefault(rows[index].tobytes(), []).append(index)
+
+            for members in buckets.values():
+                if len(members) > 1:
+                    for i, first in enumerate(members):
+                        for second in members[i + 1:]:
+                            pairs.add((first, second))
+
+        return {(keys[first], keys[second]) for first, second in pairs}
+
+    def clusters(self) -> List[List[str]]:
+        """
+        Groups of near-duplicate notes (2+ members), each sorted by key
+
+        Only LSH candidates are verified against the threshold, never all pairs.
+        """
+        parent = {}
+
+        def find(key):
+            while parent.get(key, key) != key:
+                parent[key] = parent.get(parent[key], parent[key])
+                key = parent[key]
+            return key
+
+        for first, second in self.candidate_pairs():
+            if self.similarity(self.signatures[first], self.signatures[second]) >= self.threshold:
+                parent.setdefault(first, first)
+                parent.setdefault(second, second)
+                root_first, root_second = find(first), find(second)
+                if root_first != root_second:
+                    parent[max(root_first, root_second)] = min(root_first, root_second)
+
+        groups: Dict[str, List[str]] = {}
+        for key in parent:
+            groups.setdefault(find(key), []).append(key)
+
+        return sorted(sorted(members) for members in groups.values())
@@ -1,19 +1,25 @@
 # src/tools/obsidian_reader.py
 from pathlib import Path
-import frontmatter
 import json
 from datetime import datetime
+import time
+
+from .frontmatter_parser import parse_frontmatter
+from .presence_cache import find_presence_file, get_presence
+from .scan_manifest import decode_text, hash_bytes
+from .staging_watcher import StagingWatcher
 
 class ObsidianVaultReader:
     """
     Direct file system access to vault
-    Watches for new/updated notes in staging folder
+    Reads (read_staging_notes) or watches (watch_staging_notes)
+    for new/updated notes in staging folder
     """
     
     def __init__(self, vault_path: str):
         self.vault_path = Path(vault_path)
         self.staging_folder = self.vault_path / "Social_Crew_Staging"
-        self.presence_file = self.vault_path / "Presence.md"
+        self.presence_file = find_presence_file(self.vault_path) or self.vault_path / "Presence.md"
     
     def read_staging_notes(self) -> list:
         """
@@ -33,29 +39,88 @@ class ObsidianVaultReader:
         
         return staging_notes
     
-    def parse_note(self, file_path: Path) -> dict:
+    def watch_staging_notes(self, debounce: float = 1.0, use_inotify: bool = True,
+                            stop_event=None, include_existing: bool = False, clock=time.monotonic):
+        """
+        Long-running watch mode: yield lists of notes as they change
+        
+        Only notes whose content actually changed (by hash) and that are
+        `ready: true` are emitted; the folder is never rescanned. Events
+        are debounced so one editor save emits a note once.
+        
+        Args:
+            stop_event: Optional threading.Event to end the loop
+            include_existing: Emit notes already ready at startup too
+            clock: Debounce clock (time.monotonic), see StagingWatcher
+        """
+        self.staging_folder.mkdir(parents=True, exist_ok=True)
+        
+        # Content hash last seen per note, so touch-only saves (and rescans) are ignored
+        seen = {}
+        for note_file in self.staging_folder.glob("*.md"):
+            seen[note_file] = hash_bytes(note_file.read_bytes())
+        
+        with StagingWatcher(self.staging_folder, debounce=debounce, use_inotify=use_inotify,
+                            clock=clock) as watcher:
+            print(f"👀 Watching {self.staging_folder} ({watcher.mode})")
+            
+            if include_existing:
+                initial = self.read_staging_notes()
+                if initial:
+                    yield initial
+            
+            while not (stop_event and stop_event.is_set()):
+                # Wake up periodically so stop_event is honoured
+                changed = watcher.poll(timeout=0.5 if stop_event else None)
+                
+                notes = []
+                for note_file in sorted(changed):
+                    try:
+                        raw = note_file.read_bytes()
+                    except FileNotFoundError:
+                        seen.pop(note_file, None)
+                        continue
+                    
+                    content_hash = hash_bytes(raw)
+                    if seen.get(note_file) == content_hash:
+                        continue
+                    seen[note_file] = content_hash
+                    
+                    try:
+                        note_data = self.parse_note(note_file, raw)
+                    except Exception as e:
+                        print(f"⚠️ Error parsing {note_file.name}: {e}")
+                        continue
+                    
+                    if note_data.get('ready_to_process'):
+                        notes.append(note_data)
+                
+                if notes:
+                    yield notes
+    
+    def parse_note(self, file_path: Path, raw: bytes = None) -> dict:
         """
         Parse markdown with frontmatter
         Extract metadata + content
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            post = frontmatter.load(f)
+        if raw is None:
+            raw = file_path.read_bytes()
+        metadata, content, _ = parse_frontmatter(decode_text(raw))
         
         return {
             'filename': file_path.name,
-            'title': post.metadata.get('title', file_path.stem),
-            'content': post.content,
-            'tags': post.metadata.get('tags', []),
-            'platforms': post.metadata.get('platforms', ['linkedin']),
-            'ready_to_process': post.metadata.get('ready', False),
-            'metadata': post.metadata,
+            'title': metadata.get('title', file_path.stem),
+            'content': content,
+            'tags': metadata.get('tags', []),
+            'platforms': metadata.get('platforms', ['linkedin']),
+            'ready_to_process': metadata.get('ready', False),
+            'metadata': metadata,
             'date_created': file_path.stat().st_ctime
         }
     
     def get_presence_context(self) -> str:
         """
         Read Presence.md as context for Orchestrator
+        (shared cache: same file + parse as the IP filter)
         """
-        with open(self.presence_file, 'r', encoding='utf-8') as f:
-            post = frontmatter.load(f)
-            return post.content
+        return get_presence(self.vault_path).content
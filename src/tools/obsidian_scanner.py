@@ -1,18 +1,43 @@
 # src/tools/obsidian_scanner.py (UPDATED with image handling)
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict
-import frontmatter
+from typing import Dict, Iterator, List
+import logging
+import os
 import re
+import time
 import yaml
 
+from .attachment_index import AttachmentIndex
+from .frontmatter_parser import parse_frontmatter
+from .image_metadata import ImageMetadataCache
+from .link_graph import LinkGraph
+from .markdown_tokens import IMAGE_EXTENSIONS, tokenize
+from .page_record import PageRecord
+from .scan_manifest import ScanManifest, decode_text, hash_bytes
+
+logger = logging.getLogger(__name__)
+
 
 class ObsidianScanner:
     """Recursive Obsidian vault scanner with metadata extraction + image detection"""
     
-    def __init__(self, vault_path: str):
+    # Notes handed to a worker process at a time
+    CHUNK_SIZE = 64
+    
+    def __init__(self, vault_path: str, cache_dir: str = None,
+                 include: List[str] = None, exclude: List[str] = None):
         self.vault_path = Path(vault_path)
         
+        # Where the incremental scan manifest lives (None = no incremental mode)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        
+        # Counts from the last scan: parsed / added / changed / removed / unchanged
+        self.last_scan_stats = {}
+        self.last_scan_errors = []
+        
         # Folders to skip
         self.skip_folders = [
             '.obsidian',
@@ -21,133 +46,442 @@ class ObsidianScanner:
             '.git',
         ]
         
+        # Optional glob patterns on vault-relative paths, e.g. "Projects/**"
+        # (* and ? stay within one folder, ** crosses folders)
+        # include: only scan notes matching one of these
+        # exclude: skip matching notes and never enter matching folders
+        self.include = include or []
+        self.exclude = exclude or []
+        self.last_walk_stats = {}
+        
+        # Vault-wide image index, refreshed from every walk
+        self.attachments = None
+        
+        # Wikilink graph, kept in sync by every iter_vault() (persisted in cache_dir)
+        self.link_graph = None
+        
+        # Image header metadata (size, format...) keyed by path + mtime
+        self.image_metadata = None
+        
         # Allowed image extensions
-        self.image_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp']
+        self.image_extensions = list(IMAGE_EXTENSIONS)
     
-    def scan_vault(self, include_subpages: bool = True) -> List[Dict]:
+    def scan_vault(self, include_subpages: bool = True, incremental: bool = False,
+                   workers: int = 1) -> List[PageRecord]:
         """
         Recursively scan vault for all .md files + images
         
+        Thin wrapper around iter_vault() for callers that want every page at once.
+        
         Returns:
-            List of dicts with file data
+            List of PageRecords (dict-style access), ordered by vault-relative path
+        """
+        return list(self.iter_vault(include_subpages, incremental=incremental, workers=workers))
+    
+    def iter_vault(self, include_subpages: bool = True, incremental: bool = False,
+                   workers: int = 1) -> Iterator[PageRecord]:
+        """
+        Stream pages one at a time (bounded memory, whatever the vault size)
+        
+        Args:
+            incremental: Reuse cached parse output from the scan manifest
+                for notes whose mtime/size (or content hash) didn't change
+            workers: Parse pages across this many processes (1 = in-process)
+        
+        Yields:
+            PageRecord per page (body loaded lazily, images with header metadata),
+            ordered by vault-relative path.
+            last_scan_stats / last_scan_errors are final once exhausted.
         """
         if not self.vault_path.exists():
             raise FileNotFoundError(f"Vault not found: {self.vault_path}")
         
-        pages = []
+        manifest = self._load_manifest() if incremental else None
+        stats = {"parsed": 0, "added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+        self.last_scan_stats = stats
+        self.last_scan_errors = []
+        
+        # Deterministic order regardless of filesystem / worker scheduling
+        wall, cpu = time.perf_counter_ns(), time.process_time_ns()
+        md_files = sorted(self._walk_vault())
+        self.last_walk_stats["wall_ns"] = time.perf_counter_ns() - wall
+        self.last_walk_stats["cpu_ns"] = time.process_time_ns() - cpu
+        
+        # Node set first, so links resolve against the whole vault as pages stream in
+        graph = self._load_link_graph()
+        graph_changed = any(graph.sync(key for key, _ in md_files))
+        image_metadata = self._load_image_metadata()
+        
+        for key, page_data, error in self._iter_parsed(md_files, manifest, stats, workers):
+            if error:
+                logger.warning(f"⚠️ Error parsing {Path(key).name}: {error}")
+                self.last_scan_errors.append({"file": key, "error": error})
+                continue
+            graph_changed |= graph.update(key, page_data.internal_links)
+            if page_data.images:
+                page_data.images = [image_metadata.describe(image) for image in page_data.images]
+            yield page_data
+        
+        if manifest is not None:
+            stats["removed"] = manifest.prune({key for key, _ in md_files})
+            manifest.save()
+        
+        if graph_changed and graph.graph_path is not None:
+            graph.save()
+        
+        image_metadata.prune(str(self.vault_path / rel_path) for rel_path in self.attachments.by_path.values())
+        image_metadata.save()
+    
+    def note_paths(self) -> List:
+        """(vault-relative key, path) of every note a scan would read, sorted, nothing parsed"""
+        return sorted(self._walk_vault())
+    
+    def _walk_vault(self):
+        """
+        Yield (vault-relative key, path) for every note to scan
+        
+        Excluded directories (skip_folders or exclude patterns) are dropped
+        before descending into them, so .git/.trash/.obsidian are never
+        walked. Images seen on the way refresh self.attachments.
+        Counts land in self.last_walk_stats (iter_vault adds the walk's
+        wall_ns / cpu_ns).
+        """
+        stats = {"dirs_visited": 0, "entries_visited": 0, "dirs_skipped": 0, "files_skipped": 0}
+        self.last_walk_stats = stats
+        
+        skip_folders = set(self.skip_folders)
+        exclude = _compile_globs(self.exclude)
+        include = _compile_globs(self.include)
+        
+        image_extensions = tuple(self.image_extensions)
+        attachment_paths = []
+        
+        stack = [(self.vault_path, "")]
+        while stack:
+            directory, rel_dir = stack.pop()
+            stats["dirs_visited"] += 1
+            
+            try:
+                with os.scandir(directory) as entries:
+                    entries = list(entries)
+            except OSError as e:
+                logger.warning(f"⚠️ Cannot read folder {rel_dir or directory}: {e}")
+                continue
+            
+            for entry in entries:
+                stats["entries_visited"] += 1
+                rel_path = f"{rel_dir}{entry.name}"
+                
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in skip_folders or (exclude and exclude(rel_path)):
+                        stats["dirs_skipped"] += 1
+                    else:
+                        stack.append((Path(entry.path), rel_path + "/"))
+                    continue
+                
+                if not entry.name.endswith(".md"):
+                    if entry.name.lower().endswith(image_extensions) and not (exclude and exclude(rel_path)):
+                        attachment_paths.append(rel_path)
+                    continue
+                
+                if (exclude and exclude(rel_path)) or (include and not include(rel_path)):
+                    stats["files_skipped"] += 1
+                    continue
+                
+                yield rel_path, Path(entry.path)
+        
+        if self.attachments is None:
+            self.attachments = AttachmentIndex()
+        self.attachments.sync(attachment_paths)
+    
+    def _load_manifest(self) -> ScanManifest:
+        if self.cache_dir is None:
+            raise ValueError("Incremental scanning requires a cache_dir")
+        
+        manifest_path = self.cache_dir / "scan_manifest.pkl"
+        return ScanManifest(manifest_path, self.vault_path).load()
+    
+    def __getstate__(self):
+        # Worker processes only parse pages: don't ship them the link graph / image cache
+        state = self.__dict__.copy()
+        state["link_graph"] = None
+        state["image_metadata"] = None
+        return state
+    
+    def _load_image_metadata(self) -> ImageMetadataCache:
+        if self.image_metadata is None:
+            cache_path = self.cache_dir / "image_metadata.pkl" if self.cache_dir else None
+            self.image_metadata = ImageMetadataCache(cache_path).load()
+        return self.image_metadata
+    
+    def _load_link_graph(self) -> LinkGraph:
+        if self.link_graph is None:
+            graph_path = self.cache_dir / "link_graph.pkl" if self.cache_dir else None
+            self.link_graph = LinkGraph(graph_path, self.vault_path).load()
+        return self.link_graph
+    
+    def note_key(self, file_path: str) -> str:
+        """Vault-relative key of a note (as used by the manifest + link graph)"""
+        return Path(file_path).relative_to(self.vault_path).as_posix()
+    
+    def _iter_parsed(self, md_files: List, manifest: ScanManifest, stats: Dict, workers: int):
+        """
+        Yield (key, page_data, error) for every note, in input order
+        
+        Notes whose manifest entry still matches their stat signature are
+        answered from the manifest; the rest are read + parsed in chunks,
+        either inline or on a process pool with a bounded number of
+        chunks in flight.
+        """
+        chunk_size = self.CHUNK_SIZE
+        pool = None
+        if workers > 1:
+            chunk_size = max(1, min(chunk_size, len(md_files) // (workers * 4)))
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,))
+        
+        inflight = deque()
+        try:
+            for i in range(0, len(md_files), chunk_size):
+                chunk = md_files[i:i + chunk_size]
+                plan, jobs = self._plan_chunk(chunk, manifest, stats)
+                
+                if pool is None:
+                    outcomes = _load_jobs(self, jobs)
+                else:
+                    outcomes = pool.submit(_parse_chunk, jobs) if jobs else []
+                inflight.append((chunk, plan, outcomes))
+                
+                # Keep at most 2 chunks per worker queued
+                while len(inflight) > max(workers, 1) * 2:
+                    yield from self._finish_chunk(*inflight.popleft(), manifest, stats)
+            
+            while inflight:
+                yield from self._finish_chunk(*inflight.popleft(), manifest, stats)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+    
+    def _plan_chunk(self, chunk: List, manifest: ScanManifest, stats: Dict) -> tuple:
+        """Split a chunk into manifest hits and (index, path, known hash) parse jobs"""
+        plan = [None] * len(chunk)
+        jobs = []
         
-        for md_file in self.vault_path.rglob("*.md"):
-            # Skip excluded folders
-            if any(skip_folder in md_file.parts for skip_folder in self.skip_folders):
-                print(f"⏭️  Skipping (excluded folder): {md_file.name}")
+        for index, (key, md_file) in enumerate(chunk):
+            if manifest is None:
+                jobs.append((index, md_file, None))
                 continue
             
             try:
-                page_data = self._parse_page(md_file)
-                pages.append(page_data)
-            except Exception as e:
-                print(f"⚠️ Error parsing {md_file.name}: {e}")
+                stat = md_file.stat()
+            except OSError as e:
+                plan[index] = (None, str(e))
+                continue
+            
+            entry = manifest.get(key)
+            
+            # Fast path: stat signature unchanged → no read, no parse
+            if entry and manifest.stat_matches(entry, stat):
+                stats["unchanged"] += 1
+                plan[index] = (self._refresh_images(entry["page"], md_file), None)
                 continue
+            
+            jobs.append((index, md_file, entry["content_hash"] if entry else None))
+            plan[index] = stat
         
-        return pages
+        return plan, jobs
     
-    def _parse_page(self, file_path: Path) -> Dict:
+    def _finish_chunk(self, chunk: List, plan: List, outcomes, manifest: ScanManifest, stats: Dict):
+        """Merge parse outcomes back into the chunk plan and record them in the manifest"""
+        if not isinstance(outcomes, list):
+            outcomes = outcomes.result()
+        
+        for index, content_hash, page_data, error in outcomes:
+            key = chunk[index][0]
+            stat = plan[index]
+            
+            if error:
+                plan[index] = (None, error)
+                if manifest is not None:
+                    manifest.discard(key)
+                continue
+            
+            if manifest is None:
+                stats["parsed"] += 1
+                plan[index] = (page_data, None)
+                continue
+            
+            entry = manifest.get(key)
+            
+            # Touched but identical (e.g. sync client rewrote it) → refresh stat only
+            if page_data is None:
+                manifest.update(key, stat, content_hash, entry["page"])
+                stats["unchanged"] += 1
+                plan[index] = (self._refresh_images(entry["page"], chunk[index][1]), None)
+                continue
+            
+            manifest.update(key, stat, content_hash, page_data.without_content())
+            stats["changed" if entry else "added"] += 1
+            stats["parsed"] += 1
+            plan[index] = (page_data, None)
+        
+        for (key, _), (page_data, error) in zip(chunk, plan):
+            yield key, page_data, error
+    
+    def _refresh_images(self, page_data: PageRecord, md_file: Path) -> PageRecord:
+        """Copy of a cached page with images re-resolved against the current attachment index"""
+        page_data = page_data.copy()
+        page_data.images = self._resolve_images(md_file, page_data.image_refs)
+        return page_data
+    
+    def _parse_page(self, file_path: Path, raw: bytes = None, content_hash: str = None) -> PageRecord:
         """Parse single markdown file with frontmatter + image detection"""
-        # Try to parse with frontmatter
+        if raw is None:
+            raw = file_path.read_bytes()
+        text = decode_text(raw)
+        
+        # Fast header parser (C YAML loader + header cache for complex headers)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
-        except yaml.YAMLError as yaml_error:
+            metadata, content, body_offset = parse_frontmatter(text)
+        except yaml.YAMLError:
             # Fallback: parse as plain markdown without frontmatter
-            print(f"   ⚠️ YAML error in {file_path.name}, parsing as plain markdown")
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            # Create empty frontmatter
-            post = type('obj', (object,), {
-                'metadata': {},
-                'content': content
-            })()
-        
-        # Extract metadata
-        metadata = post.metadata if hasattr(post, 'metadata') else {}
-        content = post.content if hasattr(post, 'content') else ""
-        
-        # Find links and images
-        internal_links = re.findall(r'\[\[(.*?)\]\]', content)
-        
-        # Find image references (both Obsidian and markdown formats)
-        image_refs = re.findall(r'!\[\[?(.*?\.(?:png|jpg|jpeg|gif|svg|webp))\]?\]', content, re.IGNORECASE)
-        
-        # Also find markdown image syntax
-        md_images = re.findall(r'!\[.*?\]\((.*?\.(?:png|jpg|jpeg|gif|svg|webp))\)', content, re.IGNORECASE)
-        
-        # Combine and deduplicate
-        all_images = list(set(image_refs + md_images))
-        
-        # Resolve image paths (find actual files in vault)
-        resolved_images = self._resolve_images(file_path, all_images)
-        
-        tags = re.findall(r'#(\w+)', content)
-        
-        return {
-            "file_path": str(file_path),
-            "file_name": file_path.stem,
-            "title": metadata.get("title", file_path.stem),
-            "metadata": metadata,
-            "content": content,
-            "word_count": len(content.split()),
-            "internal_links": internal_links,
-            "image_refs": all_images,  # Raw references from markdown
-            "images": resolved_images,  # Resolved file paths
-            "image_count": len(resolved_images),
-            "tags": tags,
-            "has_subpages": len(internal_links) > 0,
-            # Analysis placeholders
-            "topic": metadata.get("topic", "unknown"),
-            "audience": metadata.get("audience", "general"),
-            "platforms": metadata.get("platforms", ["linkedin", "x", "facebook", "instagram"])
-        }
+            logger.warning(f"   ⚠️ YAML error in {file_path.name}, parsing as plain markdown")
+            metadata = {}
+            content = text.strip()
+            body_offset = len(text.rstrip()) - len(content)
+        
+        # Links, embeds, images, tags + word count in one tokenizer pass
+        tokens = tokenize(content)
+        
+        return PageRecord(
+            file_path=str(file_path),
+            file_name=file_path.stem,
+            content_hash=content_hash or hash_bytes(raw),
+            title=metadata.get("title", file_path.stem),
+            metadata=metadata,
+            word_count=tokens.word_count,
+            internal_links=tokens.links + tokens.embeds,
+            embeds=tokens.embeds,
+            image_refs=tokens.images,  # Raw references from markdown
+            images=self._resolve_images(file_path, tokens.images),  # Resolved file paths
+            tags=tokens.tags,
+            body_offset=body_offset,
+            content=content,
+        )
     
     def _resolve_images(self, md_file: Path, image_refs: List[str]) -> List[Dict]:
         """
         Resolve image references to actual files in vault
         
+        Uses the attachment index (dict lookups, Obsidian shortest-path
+        semantics). Attachments inside excluded folders are never indexed,
+        so anything resolved here is safe to share.
+        
         Returns:
-            List of dicts with image info: {name, path, exists, safe}
+            List of dicts with image info: {name, found, path, safe}
+            (iter_vault() adds header metadata: format, width, height, bytes, aspect)
         """
-        resolved = []
+        if self.attachments is None:
+            # Standalone _parse_page call: one walk to build the index
+            for _ in self._walk_vault():
+                pass
+        
+        try:
+            note_dir = md_file.parent.relative_to(self.vault_path).as_posix()
+        except ValueError:
+            note_dir = ""
+        if note_dir == ".":
+            note_dir = ""
         
+        resolved = []
         for img_ref in image_refs:
             img_ref = img_ref.strip()
-            
-            # Try multiple strategies to find the image
-            candidates = [
-                md_file.parent / img_ref,  # Same folder
-                self.vault_path / img_ref,  # Root of vault
-                self.vault_path / "attachments" / img_ref,  # Common attachments folder
-                self.vault_path / "Images" / img_ref,
-                self.vault_path / "Attachments" / img_ref,
-            ]
-            
-            found_image = None
-            for candidate in candidates:
-                if candidate.exists():
-                    found_image = candidate
-                    break
-            
-            # Check if it's safe (not in excluded folders)
-            is_safe = True
-            if found_image:
-                if any(skip_folder in found_image.parts for skip_folder in self.skip_folders):
-                    is_safe = False
+            rel_path = self.attachments.resolve(img_ref, note_dir)
+            if rel_path is None:
+                continue
             
             resolved.append({
                 "name": img_ref,
-                "found": found_image is not None,
-                "path": str(found_image) if found_image else None,
-                "safe": is_safe
+                "found": True,
+                "path": str(self.vault_path / rel_path),
+                "safe": True
             })
         
-        # Filter to only safe, found images
-        safe_images = [img for img in resolved if img["found"] and img["safe"]]
-        return safe_images
+        return resolved
+
+def _glob_regex(pattern: str) -> str:
+    """
+    Path-aware glob → regex: * and ? stay within one folder, ** crosses folders
+
+    "Projects/*.md" only matches notes directly in Projects, while
+    "Projects/**" and "**/draft.md" match at any depth ("**/" also
+    matches no folder at all). [abc] / [!abc] classes never match "/".
+    """
+    parts, i = [], 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and pattern.find("]", i + 2) != -1:
+            end = pattern.find("]", i + 2)  # "]" right after "[" is part of the class
+            chars = pattern[i + 1:end].replace("\\", "\\\\")
+            if chars.startswith("^"):
+                chars = "\\" + chars
+            parts.append(f"[^/{chars[1:]}]" if chars.startswith("!") else f"(?!/)[{chars}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(parts)
+
+
+def _compile_globs(patterns: List[str]):
+    """Compile glob patterns into a single matcher (None if no patterns), matched against the whole vault-relative path"""
+    if not patterns:
+        return None
+    regex = re.compile("|".join(f"(?:{_glob_regex(pattern)})\\Z" for pattern in patterns), re.IGNORECASE)
+    return lambda rel_path: regex.match(rel_path) is not None
+
+
+# ===== Process pool helpers (module level so they can be pickled) =====
+
+_worker_scanner = None
+
+
+def _init_worker(scanner: ObsidianScanner):
+    global _worker_scanner
+    _worker_scanner = scanner
+
+
+def _parse_chunk(jobs: List) -> List:
+    return _load_jobs(_worker_scanner, jobs)
+
+
+def _load_jobs(scanner: ObsidianScanner, jobs: List) -> List:
+    """
+    Read + parse each (index, path, known_hash) job
+    
+    Returns (index, content_hash, page_data, error) per job; page_data is
+    None when the content hash matches known_hash (no parse needed).
+    Errors are captured per file instead of aborting the chunk.
+    """
+    outcomes = []
+    for index, md_file, known_hash in jobs:
+        try:
+            raw = md_file.read_bytes()
+            content_hash = hash_bytes(raw)
+            if content_hash == known_hash:
+                outcomes.append((index, content_hash, None, None))
+            else:
+                outcomes.append((index, content_hash, scanner._parse_page(md_file, raw, content_hash), None))
+        except Exception as e:
+            outcomes.append((index, None, None, str(e)))
+    return outcomes
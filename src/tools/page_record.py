@@ -0,0 +1,164 @@
+# src/tools/page_record.py
+
+from pathlib import Path
+from typing import Dict, List
+import logging
+
+from .scan_manifest import decode_text, hash_bytes
+
+logger = logging.getLogger(__name__)
+
+
+class PageRecord:
+    """
+    Compact scanner output for one note
+
+    Slots instead of a per-page dict, and no copy of the note body:
+    only the body offset + content hash are kept, and `content` is loaded
+    lazily (re-read from disk) on first access, then cached until
+    release_content(). Supports dict-style access (page["title"],
+    page.get(...), page["tone"] = ...) so phase 1/2 code keeps working.
+    """
+
+    __slots__ = (
+        "file_path", "file_name", "content_hash", "title", "metadata",
+        "word_count", "internal_links", "embeds", "image_refs", "images",
+        "tags", "body_offset", "_content", "_extra",
+    )
+
+    # Stored fields exposed as keys (besides the derived ones below)
+    FIELDS = (
+        "file_path", "file_name", "content_hash", "title", "metadata",
+        "word_count", "internal_links", "embeds", "image_refs", "images", "tags",
+    )
+    DERIVED = ("content", "image_count", "has_subpages", "topic", "audience", "platforms")
+
+    def __init__(self, file_path: str, file_name: str, content_hash: str, title: str,
+                 metadata: Dict, word_count: int, internal_links: List[str], embeds: List[str],
+                 image_refs: List[str], images: List[Dict], tags: List[str],
+                 body_offset: int = 0, content: str = None):
+        self.file_path = file_path
+        self.file_name = file_name
+        self.content_hash = content_hash
+        self.title = title
+        self.metadata = metadata
+        self.word_count = word_count
+        self.internal_links = internal_links
+        self.embeds = embeds
+        self.image_refs = image_refs
+        self.images = images
+        self.tags = tags
+        self.body_offset = body_offset
+        self._content = content
+        self._extra = None
+
+    # ===== Lazy body =====
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = self._load_content()
+        return self._content
+
+    @content.setter
+    def content(self, value: str):
+        self._content = value
+
+    def _load_content(self) -> str:
+        raw = Path(self.file_path).read_bytes()
+        if hash_bytes(raw) != self.content_hash:
+            logger.warning(f"   ⚠️ {self.file_name} changed since it was scanned, using current body")
+        return decode_text(raw)[self.body_offset:].rstrip()
+
+    @property
+    def content_loaded(self) -> bool:
+        return self._content is not None
+
+    def release_content(self):
+        """Drop the cached body (it will be re-read on next access)"""
+        self._content = None
+
+    def without_content(self) -> "PageRecord":
+        """Shallow copy with no cached body (what the scan manifest stores)"""
+        record = self.copy()
+        record._content = None
+        return record
+
+    def copy(self) -> "PageRecord":
+        record = PageRecord.__new__(PageRecord)
+        for slot in self.__slots__:
+            setattr(record, slot, getattr(self, slot))
+        if self._extra is not None:
+            record._extra = dict(self._extra)
+        return record
+
+    # ===== Derived fields =====
+
+    @property
+    def image_count(self) -> int:
+        return len(self.images)
+
+    @property
+    def has_subpages(self) -> bool:
+        return len(self.internal_links) > 0
+
+    @property
+    def topic(self):
+        return self.metadata.get("topic", "unknown")
+
+    @property
+    def audience(self):
+        return self.metadata.get("audience", "general")
+
+    @property
+    def platforms(self):
+        return self.metadata.get("platforms", ["linkedin", "x", "facebook", "instagram"])
+
+    # ===== Dict-style access =====
+
+    def __getitem__(self, key: str):
+        if key in PageRecord.FIELDS or key in PageRecord.DERIVED:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key in PageRecord.FIELDS or key == "content":
+            setattr(self, key, value)
+        elif key in PageRecord.DERIVED:
+            raise KeyError(f"'{key}' is derived and cannot be set")
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return (key in PageRecord.FIELDS or key in PageRecord.DERIVED
+                or (self._extra is not None and key in self._extra))
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        return list(PageRecord.FIELDS) + list(PageRecord.DERIVED) + list(self._extra or ())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self) -> Dict:
+        """Plain dict, body included (loads it if needed)"""
+        return dict(self.items())
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state: Dict):
+        for slot in self.__slots__:
+            setattr(self, slot, state.get(slot))
+
+    def __repr__(self) -> str:
+        return f"PageRecord({self.file_name!r}, words={self.word_count}, images={self.image_count})"
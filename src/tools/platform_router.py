@@ -0,0 +1,243 @@
+# src/tools/platform_router.py
+
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+import threading
+import time
+
+import yaml
+
+from .lexicon import LexiconMatcher
+
+
+ROUTING_CONFIG = Path(__file__).parent.parent / "config" / "routing.yaml"
+
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CONDITIONS = ("tags_any", "keywords_any", "min_words", "max_words", "has_images")
+
+
+class Route(NamedTuple):
+    """Where a page goes, and why"""
+    platforms: List[str]
+    rules: List[str]      # matching rule names ("manual" / "fallback" when the table didn't decide)
+    manual: bool          # frontmatter `platforms:` override
+
+
+class Rule(NamedTuple):
+    name: str
+    platform: str
+    predicate: Callable   # _Page → bool
+
+
+def load_routing_config(config_path: str = None) -> Dict:
+    with open(config_path or ROUTING_CONFIG, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=YAMLLoader) or {}
+
+
+class _Page:
+    """Routing features of a page, the keyword scan only runs if a keyword rule asks"""
+
+    __slots__ = ("content", "tokens", "tags", "word_count", "has_images", "_labels", "_matcher")
+
+    def __init__(self, page: Dict, matcher: LexiconMatcher, tokens: tuple = None):
+        content = page.get("content") or ""
+        tags = (page.get("metadata") or {}).get("tags") or []
+        if isinstance(tags, str):
+            tags = [tags]
+
+        self.content = content
+        self.tokens = tokens
+        self.tags = frozenset(str(tag).lower().lstrip('#').strip() for tag in tags)
+        self.word_count = page["word_count"] if page.get("word_count") is not None else len(content.split())
+        self.has_images = bool(page.get("images"))  # resolved by the scanner: not transclusions or broken embeds
+        self._labels = None
+        self._matcher = matcher
+
+    def labels(self) -> set:
+        """Rule names whose keywords occur in the page (one scan for every keyword rule)"""
+        if self._labels is None:
+            signals = self._matcher.match(*self.tokens) if self.tokens else self._matcher.match_text(self.content)
+            self._labels = self._matcher.labels(signals)
+        return self._labels
+
+
+class PlatformRouter:
+    """
+    Platform routing from the declarative rule table in config/routing.yaml
+
+    Rules are compiled once into predicates (tag sets, word-count bounds,
+    one keyword matcher shared by every keyword rule). A batch is routed
+    rule by rule over all pages, skipping pages already routed to that
+    rule's platform; per-rule counters record how many pages each rule
+    was evaluated on, how many it matched and the time it took (the
+    shared keyword scan is billed to the first keyword rule needing it).
+    Counters are updated under a lock and cleared by reset_stats().
+    """
+
+    def __init__(self, config: Dict = None):
+        config = load_routing_config() if config is None else config
+        self.platforms: List[str] = list(config.get("platforms", []))
+        self.fallback: List[str] = list(config.get("fallback", []))
+
+        rule_configs = config.get("rules", [])
+        self.matcher = LexiconMatcher({"route": {
+            rule["name"]: rule["keywords_any"] for rule in rule_configs if rule.get("keywords_any")
+        }})
+        self.rules: List[Rule] = [self._compile(rule) for rule in rule_configs]
+
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start a new run: zero the per-rule stats and the manual / fallback counters"""
+        with self._lock:
+            self.stats: Dict[str, Dict[str, int]] = {
+                rule.name: {"evaluated": 0, "hits": 0, "ns": 0} for rule in self.rules
+            }
+            self.routed = 0
+            self.manual = 0
+            self.fallbacks = 0
+
+    def _compile(self, rule: Dict) -> Rule:
+        name, platform = rule.get("name"), rule.get("platform")
+        if not name or platform not in self.platforms:
+            raise ValueError(f"Routing rule {name!r}: needs a name and a platform from {self.platforms}")
+
+        unknown = set(rule) - {"name", "platform"} - set(CONDITIONS)
+        if unknown:
+            raise ValueError(f"Routing rule {name!r}: unknown condition(s) {sorted(unknown)}")
+
+        checks = []
+        if rule.get("tags_any"):
+            tags = frozenset(str(tag).lower().lstrip('#') for tag in rule["tags_any"])
+            checks.append(lambda page: not tags.isdisjoint(page.tags))
+        if rule.get("min_words") is not None:
+            min_words = int(rule["min_words"])
+            checks.append(lambda page: page.word_count >= min_words)
+        if rule.get("max_words") is not None:
+            max_words = int(rule["max_words"])
+            checks.append(lambda page: page.word_count <= max_words)
+        if rule.get("has_images") is not None:
+            has_images = bool(rule["has_images"])
+            checks.append(lambda page: page.has_images == has_images)
+        if rule.get("keywords_any"):
+            checks.append(lambda page: name in page.labels())
+
+        if not checks:
+            raise ValueError(f"Routing rule {name!r}: no conditions")
+        if len(checks) == 1:
+            return Rule(name, platform, checks[0])
+        return Rule(name, platform, lambda page: all(check(page) for check in checks))
+
+    def route(self, page: Dict, tokens: tuple = None) -> Route:
+        """
+        Route one page ({content, metadata, word_count?, images?})
+
+        Same rules and stats as route_batch(), without its per-batch setup.
+
+        Args:
+            tokens: (tokens, counts) from lexicon.tokenize() if the caller already has them
+        """
+        manual = (page.get("metadata") or {}).get("platforms")
+        if manual:
+            with self._lock:
+                self.routed += 1
+                self.manual += 1
+            return Route(list(manual), ["manual"], True)
+
+        features = _Page(page, self.matcher, tokens)
+        routed, matched, timings = set(), [], []
+        for rule in self.rules:
+            if rule.platform in routed:
+                continue
+            start = time.perf_counter_ns()
+            hit = rule.predicate(features)
+            timings.append((rule.name, hit, time.perf_counter_ns() - start))
+            if hit:
+                routed.add(rule.platform)
+                matched.append(rule.name)
+
+        with self._lock:
+            for name, hit, ns in timings:
+                stats = self.stats[name]
+                stats["evaluated"] += 1
+                stats["hits"] += hit
+                stats["ns"] += ns
+            self.routed += 1
+            return self._decide(routed, matched)
+
+    def route_batch(self, pages: List[Dict], tokens: List[Optional[tuple]] = None) -> List[Route]:
+        """Route every page in one call, rule by rule"""
+        tokens = tokens or [None] * len(pages)
+        routes: List[Optional[Route]] = [None] * len(pages)
+
+        pending = []
+        for index, page in enumerate(pages):
+            manual = (page.get("metadata") or {}).get("platforms")
+            if manual:
+                routes[index] = Route(list(manual), ["manual"], True)
+            else:
+                pending.append(index)
+
+        features = {index: _Page(pages[index], self.matcher, tokens[index]) for index in pending}
+        routed = {index: set() for index in pending}
+        matched = {index: [] for index in pending}
+
+        timings = []
+        for rule in self.rules:
+            candidates = [index for index in pending if rule.platform not in routed[index]]
+            predicate = rule.predicate
+
+            start = time.perf_counter_ns()
+            hits = [index for index in candidates if predicate(features[index])]
+            timings.append((rule.name, len(candidates), len(hits), time.perf_counter_ns() - start))
+
+            for index in hits:
+                routed[index].add(rule.platform)
+                matched[index].append(rule.name)
+
+        with self._lock:
+            for name, evaluated, hits, ns in timings:
+                stats = self.stats[name]
+                stats["evaluated"] += evaluated
+                stats["hits"] += hits
+                stats["ns"] += ns
+            for index in pending:
+                routes[index] = self._decide(routed[index], matched[index])
+            self.routed += len(pages)
+            self.manual += len(pages) - len(pending)
+        return routes
+
+    def _decide(self, routed: set, matched: List[str]) -> Route:
+        """Route from the platforms a page's rules matched (caller holds the lock)"""
+        platforms = [platform for platform in self.platforms if platform in routed]
+        if platforms:
+            return Route(platforms, matched, False)
+        self.fallbacks += 1
+        return Route(list(self.fallback), ["fallback"], False)
+
+    def report(self) -> List[str]:
+        """One line per rule: hits / evaluations + time spent (since the last reset_stats())"""
+        lines = []
+        for rule in self.rules:
+            stats = self.stats[rule.name]
+            per_page = stats["ns"] / stats["evaluated"] if stats["evaluated"] else 0.0
+            lines.append(f"{rule.name:<20} → {rule.platform:<9} {stats['hits']:>6}/{stats['evaluated']:<6} hits "
+                         f"{stats['ns'] / 1e6:>8.2f} ms ({per_page:,.0f} ns/page)")
+        lines.append(f"{'manual override':<20}   {'':<9} {self.manual:>6}/{self.routed:<6} pages")
+        lines.append(f"{'fallback':<20} → {', '.join(self.fallback):<9} {self.fallbacks:>6}/{self.routed:<6} pages")
+        return lines
+
+
+_default: Optional[PlatformRouter] = None
+_lock = threading.Lock()
+
+
+def default_router() -> PlatformRouter:
+    """Shared router compiled from the routing config (once per process)"""
+    global _default
+    with _lock:
+        if _default is None:
+            _default = PlatformRouter()
+        return _default
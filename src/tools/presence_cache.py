@@ -0,0 +1,164 @@
+# src/tools/presence_cache.py
+
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Optional
+import logging
+import re
+import threading
+
+from .frontmatter_parser import parse_frontmatter
+from .scan_manifest import decode_text
+
+logger = logging.getLogger(__name__)
+
+
+# Vault-relative candidates, first existing one wins (both spellings are in use)
+PRESENCE_FILES = (
+    "Precence.md",
+    "Presence.md",
+    "Mobile_Vaulte/Precence.md",
+    "Mobile_Vaulte/Presence.md",
+)
+
+# Lines carrying one of these are never part of the public narrative
+PRIVATE_LINE_MARKERS = ('⚠️', 'vault-only', 'private')
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Note words shorter than this never count as a presence match ("the", "and"...)
+MIN_MATCH_LENGTH = 5
+
+
+class PresenceMatch(NamedTuple):
+    """How strongly a note relates to today's public narrative"""
+    score: int          # distinct note tokens found in the narrative
+    tokens: List[str]   # those tokens, sorted
+    lines: List[str]    # matching narrative lines, most matched tokens first
+
+
+class PresenceContext(NamedTuple):
+    """Parsed Presence.md plus the lookups derived from it (computed once per file version)"""
+    path: Optional[Path]
+    mtime_ns: int
+    size: int                      # with mtime_ns: the file version this was parsed from
+    content: str                   # note body (no frontmatter)
+    metadata: Dict
+    public_narrative: List[str]    # lines without private markers
+    narrative_lower: str           # public narrative joined + lowercased
+    tokens: FrozenSet[str]         # lowercased word tokens of the narrative
+    index: Dict[str, tuple]        # token → narrative line numbers containing it
+
+    @property
+    def timestamp(self):
+        return self.metadata.get('updated', 'unknown')
+
+    def match(self, text: str, max_lines: int = 3) -> PresenceMatch:
+        """
+        Score a note against the narrative via the inverted index
+
+        Cost is one tokenizer pass over the note plus one dict lookup per
+        distinct significant word, whatever the size of the presence note.
+        """
+        return self.match_tokens(note_tokens(text), max_lines)
+
+    def match_tokens(self, tokens, max_lines: int = 3) -> PresenceMatch:
+        index = self.index
+        matched = sorted(token for token in tokens if token in index)
+        if not matched:
+            return NO_MATCH
+
+        hits: Dict[int, int] = {}
+        for token in matched:
+            for line in index[token]:
+                hits[line] = hits.get(line, 0) + 1
+
+        best = sorted(hits, key=lambda line: (-hits[line], line))[:max_lines]
+        return PresenceMatch(len(matched), matched, [self.public_narrative[line] for line in best])
+
+
+NO_MATCH = PresenceMatch(0, [], [])
+EMPTY_PRESENCE = PresenceContext(None, 0, 0, "", {}, [], "", frozenset(), {})
+
+_cache: Dict[Path, PresenceContext] = {}  # resolved path → context
+_lock = threading.Lock()
+
+
+def find_presence_file(vault_path: str) -> Optional[Path]:
+    vault = Path(vault_path)
+    for name in PRESENCE_FILES:
+        candidate = vault / name
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def get_presence(vault_path: str) -> PresenceContext:
+    """
+    Shared, mtime-checked Presence.md for a vault
+
+    Every caller (IP filter, vault reader, phase 1, the crew) gets the
+    same parsed context; the file is only re-read + re-parsed when its
+    mtime/size change. Missing file → EMPTY_PRESENCE.
+    """
+    presence_file = find_presence_file(vault_path)
+    if presence_file is None:
+        return EMPTY_PRESENCE
+
+    path = presence_file.resolve()
+    try:
+        stat = path.stat()
+    except OSError:
+        return EMPTY_PRESENCE
+
+    with _lock:
+        cached = _cache.get(path)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached
+
+        context = _parse_presence(path, stat.st_mtime_ns, stat.st_size)
+        _cache[path] = context
+        return context
+
+
+def _parse_presence(path: Path, mtime_ns: int, size: int) -> PresenceContext:
+    try:
+        metadata, content, _ = parse_frontmatter(decode_text(path.read_bytes()))
+    except Exception as e:
+        logger.warning(f"⚠️ Error loading Presence file: {e}")
+        return EMPTY_PRESENCE._replace(path=path, mtime_ns=mtime_ns, size=size)
+
+    public_narrative = extract_public_narrative(content)
+    narrative_lower = "\n".join(public_narrative).lower()
+
+    index: Dict[str, list] = {}
+    for number, line in enumerate(public_narrative):
+        for token in set(TOKEN_PATTERN.findall(line.lower())):
+            index.setdefault(token, []).append(number)
+
+    return PresenceContext(
+        path=path,
+        mtime_ns=mtime_ns,
+        size=size,
+        content=content,
+        metadata=metadata,
+        public_narrative=public_narrative,
+        narrative_lower=narrative_lower,
+        tokens=frozenset(index),
+        index={token: tuple(lines) for token, lines in index.items()},
+    )
+
+
+def note_tokens(text: str) -> FrozenSet[str]:
+    """Distinct lowercased words of a note long enough to count as a match"""
+    return frozenset(token for token in TOKEN_PATTERN.findall(text.lower()) if len(token) >= MIN_MATCH_LENGTH)
+
+
+def extract_public_narrative(presence_content: str) -> List[str]:
+    """Lines of the presence note not marked as private"""
+    if not presence_content:
+        return []
+
+    return [
+        line for line in presence_content.split('\n')
+        if not any(marker in line.lower() for marker in PRIVATE_LINE_MARKERS)
+    ]
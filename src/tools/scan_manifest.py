@@ -0,0 +1,99 @@
+# src/tools/scan_manifest.py
+
+from pathlib import Path
+from typing import Dict, Optional
+import hashlib
+import logging
+import os
+import pickle
+
+logger = logging.getLogger(__name__)
+
+
+def hash_bytes(raw: bytes) -> str:
+    """Stable content hash used to detect changed notes"""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def decode_text(raw: bytes) -> str:
+    """Decode note bytes like a text-mode open() would (UTF-8, universal newlines)"""
+    text = raw.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+class ScanManifest:
+    """
+    On-disk manifest of scanned notes
+
+    Maps each note (vault-relative path) to its stat signature
+    (mtime, size), content hash and the cached `_parse_page` output
+    (a PageRecord without its body), so unchanged notes never have to
+    be re-parsed.
+    """
+
+    VERSION = 2
+
+    def __init__(self, manifest_path: str, vault_path: str):
+        self.manifest_path = Path(manifest_path)
+        self.vault_path = str(Path(vault_path).resolve())
+        self.entries: Dict[str, Dict] = {}
+
+    def load(self) -> "ScanManifest":
+        """Load manifest from disk (silently starts empty if missing/stale)"""
+        if not self.manifest_path.exists():
+            return self
+
+        try:
+            with open(self.manifest_path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable scan manifest: {e}")
+            return self
+
+        # Different format or vault → start over
+        if data.get("version") == self.VERSION and data.get("vault_path") == self.vault_path:
+            self.entries = data.get("entries", {})
+
+        return self
+
+    def save(self):
+        """Atomically write manifest to disk"""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + ".tmp")
+
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                "version": self.VERSION,
+                "vault_path": self.vault_path,
+                "entries": self.entries,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, self.manifest_path)
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.entries.get(key)
+
+    @staticmethod
+    def stat_matches(entry: Dict, stat: os.stat_result) -> bool:
+        """Cheap check: same mtime + size means the note is unchanged"""
+        return entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+
+    def update(self, key: str, stat: os.stat_result, content_hash: str, page: Dict):
+        self.entries[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "content_hash": content_hash,
+            "page": page,
+        }
+
+    def discard(self, key: str):
+        self.entries.pop(key, None)
+
+    def prune(self, seen_keys: set) -> int:
+        """Drop entries for notes that no longer exist, return removed count"""
+        removed = [key for key in self.entries if key not in seen_keys]
+        for key in removed:
+            del self.entries[key]
+        return len(removed)
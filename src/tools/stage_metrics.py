@@ -0,0 +1,126 @@
+# src/tools/stage_metrics.py
+
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+import json
+import os
+import time
+
+import numpy as np
+
+
+PERCENTILES = (50, 95, 99)
+
+
+class Stage:
+    """Wall + CPU time, item count and per-item latencies (ns) of one pipeline stage"""
+
+    __slots__ = ("name", "wall_ns", "cpu_ns", "items", "latencies")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall_ns = 0
+        self.cpu_ns = 0
+        self.items = 0
+        self.latencies = array('q')
+
+    def add(self, wall_ns: int, cpu_ns: int, items: int = 1, sample: bool = True):
+        """Record one measurement; sample=True keeps wall_ns as a per-item latency"""
+        self.wall_ns += wall_ns
+        self.cpu_ns += cpu_ns
+        self.items += items
+        if sample:
+            self.latencies.append(wall_ns)
+
+    def summary(self) -> Dict:
+        summary = {
+            "wall_s": round(self.wall_ns / 1e9, 6),
+            "cpu_s": round(self.cpu_ns / 1e9, 6),
+            "items": self.items,
+        }
+        if self.latencies:
+            latencies = np.frombuffer(self.latencies, dtype=np.int64) / 1e6
+            for percentile, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES)):
+                summary[f"p{percentile}_ms"] = round(float(value), 4)
+            summary["max_ms"] = round(float(latencies.max()), 4)
+        return summary
+
+
+class _Measure:
+    """Context manager adding one measurement to a stage"""
+
+    __slots__ = ("stage", "items", "sample", "wall", "cpu")
+
+    def __init__(self, stage: Stage, items: int, sample: bool):
+        self.stage = stage
+        self.items = items
+        self.sample = sample
+
+    def __enter__(self):
+        self.wall = time.perf_counter_ns()
+        self.cpu = time.process_time_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.stage.add(time.perf_counter_ns() - self.wall, time.process_time_ns() - self.cpu,
+                       self.items, self.sample)
+        return False
+
+
+class StageMetrics:
+    """
+    Per-stage timings of one pipeline run, saved as machine-readable JSON
+
+    Per-page stages are measured once per page (one latency sample each,
+    for p50/p95/p99); corpus-wide stages are one measurement covering
+    all their items. Stages are reported in the order first measured.
+    """
+
+    def __init__(self, phase: str):
+        self.phase = phase
+        self.stages: Dict[str, Stage] = {}
+        self.counts: Dict[str, int] = {}
+        self.started = datetime.now().isoformat(timespec='seconds')
+        self._wall = time.perf_counter_ns()
+        self._cpu = time.process_time_ns()
+
+    def stage(self, name: str) -> Stage:
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = Stage(name)
+        return stage
+
+    def measure(self, name: str, items: int = 1, sample: bool = True) -> _Measure:
+        """with metrics.measure("filter"): ... (one page → one latency sample)"""
+        return _Measure(self.stage(name), items, sample)
+
+    def summary(self) -> Dict:
+        return {
+            "phase": self.phase,
+            "started": self.started,
+            "wall_s": round((time.perf_counter_ns() - self._wall) / 1e9, 6),
+            "cpu_s": round((time.process_time_ns() - self._cpu) / 1e9, 6),
+            "counts": dict(self.counts),
+            "stages": {name: stage.summary() for name, stage in self.stages.items()},
+        }
+
+    def report(self) -> list:
+        """One line per stage: wall / CPU time, items + latency percentiles"""
+        lines = []
+        for name, summary in self.summary()["stages"].items():
+            line = f"{name:<11} {summary['wall_s'] * 1e3:>9.1f} ms wall {summary['cpu_s'] * 1e3:>9.1f} ms CPU " \
+                   f"{summary['items']:>7} items"
+            if "p50_ms" in summary:
+                line += f"  p50 {summary['p50_ms']:.3f} / p95 {summary['p95_ms']:.3f} / p99 {summary['p99_ms']:.3f} ms"
+            lines.append(line)
+        return lines
+
+    def save(self, path):
+        """Write the summary as JSON (atomic: temp file + rename)"""
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+        os.replace(tmp_path, path)
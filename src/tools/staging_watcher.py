@@ -0,0 +1,200 @@
+# src/tools/staging_watcher.py
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+
+class StagingWatcher:
+    """
+    Event-driven watcher for a single folder of notes (non-recursive)
+
+    Uses inotify on Linux and falls back to mtime/size polling elsewhere
+    (or when inotify is unavailable). Events are debounced per file:
+    a file is reported once it has been quiet for `debounce` seconds,
+    so an editor's save storm (write, rename, touch...) yields one change.
+    If the inotify queue overflows, every file in the folder is reported
+    (a full rescan) since events were lost.
+
+    `clock` (default time.monotonic) times the debouncing; tests pass a
+    fake one and call poll(timeout=0).
+    """
+
+    def __init__(self, folder: str, debounce: float = 1.0, poll_interval: float = 1.0,
+                 use_inotify: bool = True, suffix: str = ".md", clock: Callable[[], float] = time.monotonic):
+        self.folder = Path(folder)
+        self.debounce = debounce
+        self.suffix = suffix
+        self.clock = clock
+        self.pending: Dict[str, float] = {}  # file name → clock() of last event
+
+        self.backend = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self.backend = _InotifyBackend(self.folder)
+            except OSError as e:
+                print(f"⚠️ inotify unavailable ({e}), falling back to polling")
+        if self.backend is None:
+            self.backend = _PollingBackend(self.folder, poll_interval)
+
+    @property
+    def mode(self) -> str:
+        return self.backend.name
+
+    def poll(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Block until at least one file has settled, return the changed paths
+
+        Returns an empty set if `timeout` seconds pass first (timeout=0:
+        only take in the events already queued, never block).
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        self._record(self.backend.read(0))
+
+        while True:
+            now = self.clock()
+            settled = {name for name, last in self.pending.items() if now - last >= self.debounce}
+            if settled:
+                for name in settled:
+                    del self.pending[name]
+                return {self.folder / name for name in settled}
+            if deadline is not None and now >= deadline:
+                return set()
+
+            # Sleep until the next event, the oldest pending file settles, or the deadline
+            wait = None
+            if self.pending:
+                wait = max(0.0, self.debounce - (now - min(self.pending.values())))
+            if deadline is not None:
+                wait = deadline - now if wait is None else min(wait, deadline - now)
+            self._record(self.backend.read(wait))
+
+    def _record(self, names: List[str]):
+        now = self.clock()
+        for name in names:
+            if name.endswith(self.suffix):
+                self.pending[name] = now
+
+    def close(self):
+        self.backend.close()
+
+    def __enter__(self) -> "StagingWatcher":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _InotifyBackend:
+    """Raw inotify through ctypes (no third-party dependency)"""
+
+    name = "inotify"
+
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_Q_OVERFLOW = 0x4000  # events were dropped (always reported, listed in the mask for clarity)
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+    def __init__(self, folder: Path):
+        self.folder = folder
+        self.overflows = 0
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        mask = (self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+                | self.IN_MODIFY | self.IN_MOVED_FROM | self.IN_DELETE | self.IN_Q_OVERFLOW)
+        if libc.inotify_add_watch(self.fd, os.fsencode(str(folder)), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {folder}")
+
+    def read(self, timeout: Optional[float]) -> List[str]:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        return self._names(data)
+
+    def _names(self, data: bytes) -> List[str]:
+        """File names in a buffer of inotify events, every file in the folder after an overflow"""
+        names = []
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                self.overflows += 1
+                print(f"⚠️ inotify queue overflowed, rescanning {self.folder}")
+                return self._rescan()
+            if name:
+                names.append(os.fsdecode(name))
+        return names
+
+    def _rescan(self) -> List[str]:
+        try:
+            with os.scandir(self.folder) as entries:
+                return [entry.name for entry in entries if entry.is_file()]
+        except OSError:
+            return []
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class _PollingBackend:
+    """Fallback: diff (mtime, size) snapshots of the folder every poll_interval"""
+
+    name = "polling"
+
+    def __init__(self, folder: Path, poll_interval: float):
+        self.folder = folder
+        self.poll_interval = poll_interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> Dict[str, tuple]:
+        snapshot = {}
+        try:
+            with os.scandir(self.folder) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+        return snapshot
+
+    def read(self, timeout: Optional[float]) -> List[str]:
+        time.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+
+        current = self._snapshot()
+        changed = [name for name, signature in current.items() if self.snapshot.get(name) != signature]
+        changed += [name for name in self.snapshot if name not in current]
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
@@ -0,0 +1,140 @@
+# src/tools/tone_classifier.py
+
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+import threading
+
+import numpy as np
+import yaml
+
+from .lexicon import LexiconMatcher
+
+
+TONES_CONFIG = Path(__file__).parent.parent / "config" / "tones.yaml"
+
+# Label when no tone keyword occurs at all
+NEUTRAL = "neutral"
+
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class ToneResult(NamedTuple):
+    """Full tone distribution of a note"""
+    tone: str                     # best tone (first listed on ties), NEUTRAL if nothing matched
+    scores: Dict[str, float]      # tone → summed keyword weights
+    distribution: Dict[str, float]  # tone → share of the total score (all 0.0 when neutral)
+    confidence: float             # share of the best tone, 0.0 when neutral
+    ties: List[str]               # every tone sharing the best score (2+ = ambiguous)
+
+
+def load_tone_lexicons(config_path: str = None) -> Dict[str, Dict[str, float]]:
+    """
+    {tone: {keyword: weight}} from the tones config
+
+    Keywords are listed per tone either bare ("- code", weight 1.0) or
+    as a one-entry mapping ("- {code: 2.0}").
+    """
+    with open(config_path or TONES_CONFIG, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=YAMLLoader) or {}
+
+    lexicons = {}
+    for tone, keywords in config.items():
+        weights = lexicons.setdefault(str(tone), {})
+        for entry in keywords or []:
+            if isinstance(entry, dict):
+                for keyword, weight in entry.items():
+                    weights[str(keyword).lower()] = float(weight)
+            else:
+                weights[str(entry).lower()] = 1.0
+    return lexicons
+
+
+class ToneClassifier:
+    """
+    Tone scores as one sparse matrix product
+
+    The lexicons are compiled once into a keyword matcher and a
+    keyword × tone weight matrix W. A batch of notes becomes a sparse
+    note × keyword incidence matrix X (each keyword counts once per
+    note); scores = X · W gives every note's tone scores at once.
+    """
+
+    def __init__(self, lexicons: Dict[str, Dict[str, float]] = None):
+        lexicons = load_tone_lexicons() if lexicons is None else lexicons
+        # The matcher lowercases keywords: key the weights the same way (as tones.yaml is loaded)
+        lexicons = {tone: {str(keyword).lower(): weight for keyword, weight in keywords.items()}
+                    for tone, keywords in lexicons.items()}
+        self.tones: List[str] = list(lexicons)
+        self.matcher = LexiconMatcher({"tone": lexicons})
+
+        self.weights = np.zeros((len(self.matcher.signals), len(self.tones)))
+        column = {tone: index for index, tone in enumerate(self.tones)}
+        for signal, (_, tone, keyword) in enumerate(self.matcher.signals):
+            self.weights[signal, column[tone]] = lexicons[tone][keyword]
+        # Scalar path for one note: signal id → (tone column, weight)
+        self.signal_weights = [(column[tone], lexicons[tone][keyword]) for _, tone, keyword in self.matcher.signals]
+
+    def classify(self, text: str) -> ToneResult:
+        return self.classify_one(self.matcher.match_text(text))
+
+    def classify_batch(self, texts: Iterable[str]) -> List[ToneResult]:
+        """Tone results of many notes, scored with a single X · W product"""
+        return self.classify_signals([self.matcher.match_text(text) for text in texts])
+
+    def classify_one(self, signals: Iterable[int]) -> ToneResult:
+        """Tone result of a single note's signal ids (plain sums, no matrix setup)"""
+        row = [0.0] * len(self.tones)
+        signal_weights = self.signal_weights
+        for signal in signals:
+            tone, weight = signal_weights[signal]
+            row[tone] += weight
+        return self._result(row)
+
+    def classify_signals(self, signal_sets: List[Iterable[int]]) -> List[ToneResult]:
+        """Tone results from already matched keyword signal ids (one set per note)"""
+        signal_sets = [list(signals) for signals in signal_sets]
+        lengths = np.fromiter((len(signals) for signals in signal_sets), dtype=np.int64, count=len(signal_sets))
+        rows = np.repeat(np.arange(len(signal_sets)), lengths)
+        cols = np.fromiter((signal for signals in signal_sets for signal in signals),
+                           dtype=np.int64, count=int(lengths.sum()))
+
+        return self._results(_sparse_dot(rows, cols, len(signal_sets), self.weights))
+
+    def _results(self, scores: np.ndarray) -> List[ToneResult]:
+        return [self._result(row) for row in scores.tolist()]
+
+    def _result(self, row: List[float]) -> ToneResult:
+        tones = self.tones
+        total = sum(row)
+        if total <= 0:
+            return ToneResult(NEUTRAL, dict.fromkeys(tones, 0.0), dict.fromkeys(tones, 0.0), 0.0, [])
+
+        best = max(row)
+        return ToneResult(
+            tone=tones[row.index(best)],
+            scores=dict(zip(tones, row)),
+            distribution={tone: round(score / total, 4) for tone, score in zip(tones, row)},
+            confidence=round(best / total, 4),
+            ties=[tone for tone, score in zip(tones, row) if score == best],
+        )
+
+
+def _sparse_dot(rows: np.ndarray, cols: np.ndarray, n_rows: int, weights: np.ndarray) -> np.ndarray:
+    """X · W for a 0/1 sparse X given as (row, col) coordinates and a dense W"""
+    scores = np.zeros((n_rows, weights.shape[1]))
+    for tone in range(weights.shape[1]):
+        scores[:, tone] = np.bincount(rows, weights=weights[cols, tone], minlength=n_rows)
+    return scores
+
+
+_default: Optional[ToneClassifier] = None
+_lock = threading.Lock()
+
+
+def default_classifier() -> ToneClassifier:
+    """Shared classifier compiled from the tones config (once per process)"""
+    global _default
+    with _lock:
+        if _default is None:
+            _default = ToneClassifier()
+        return _default
@@ -0,0 +1,254 @@
+# src/tools/topic_clusters.py
+
+from typing import Dict, List, NamedTuple
+import math
+
+import numpy as np
+
+from .keyword_index import KeywordIndex, top_entries
+
+
+class Topic(NamedTuple):
+    """One topic of the vault"""
+    topic_id: int
+    members: List[str]            # note keys, closest to the centroid first
+    top_terms: List[str]          # heaviest centroid terms
+    centroid: Dict[str, float]    # centroid truncated to its heaviest terms (unit-norm before truncation)
+
+
+class TopicClusterer:
+    """
+    Spherical k-means over the TF-IDF vectors of a KeywordIndex
+
+    Note vectors are truncated to their heaviest terms and L2-normalized,
+    so cosine similarity is a dot product. Similarities to the centroids
+    are computed straight from the sparse rows (gathering the centroid
+    columns of each nonzero, chunked), and centroids are rebuilt with one
+    bincount: cost per iteration is O(nonzeros × topics), memory never
+    grows with notes² as a pairwise distance matrix would.
+    """
+
+    def __init__(self, n_topics: int = None, max_iter: int = 20, max_terms: int = 64,
+                 top_terms: int = 8, centroid_terms: int = 20, batch_size: int = 2048,
+                 max_batches: int = 100, seed: int = 42):
+        self.n_topics = n_topics
+        self.max_iter = max_iter
+        self.max_terms = max_terms
+        self.top_terms = top_terms
+        self.centroid_terms = centroid_terms
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.seed = seed
+        self.iterations = 0
+
+    @staticmethod
+    def default_topics(n_notes: int) -> int:
+        """Rule-of-thumb topic count: sqrt(n / 2), capped at 100"""
+        return max(1, min(100, int(round(math.sqrt(n_notes / 2)))))
+
+    def fit(self, index: KeywordIndex, keys: List[str] = None) -> tuple:
+        """
+        Cluster notes into topics
+
+        Up to 4 × batch_size notes run full k-means (Lloyd) until no
+        note changes topic; larger vaults run mini-batch k-means on
+        random batches, then assign every note in one final pass.
+
+        Returns:
+            (labels, topics): {note key: topic id} for every note with
+            indexed terms, and the non-empty topics numbered from 1,
+            largest first
+        """
+        keys, indptr, indices, weights = index.tfidf(keys)
+        keys, indptr, indices, weights = _truncate(keys, indptr, indices, weights, self.max_terms)
+        if not keys:
+            return {}, []
+
+        matrix = (indptr, indices, weights)
+        n_topics = min(self.n_topics or self.default_topics(len(keys)), len(keys))
+        vocabulary = len(index.terms)
+        rng = np.random.default_rng(self.seed)
+
+        if len(keys) > 4 * self.batch_size:
+            centroids = self._minibatch(matrix, vocabulary, n_topics, rng)
+            similarities = _similarities(*matrix, centroids)
+            labels = similarities.argmax(axis=1)
+        else:
+            labels, similarities, centroids = self._lloyd(matrix, vocabulary, n_topics, rng)
+
+        closeness = similarities[np.arange(len(keys)), labels]
+        return self._topics(keys, labels, closeness, centroids, index.terms)
+
+    def _lloyd(self, matrix, vocabulary, n_topics, rng) -> tuple:
+        """Full-batch spherical k-means: (labels, similarities, centroids)"""
+        n_rows = len(matrix[0]) - 1
+        centroids = self._init_centroids(matrix, vocabulary, n_topics, rng)
+        labels = np.full(n_rows, -1)
+
+        self.iterations = 0
+        while True:
+            self.iterations += 1
+            similarities = _similarities(*matrix, centroids)
+            new_labels = similarities.argmax(axis=1)
+            if np.array_equal(new_labels, labels) or self.iterations >= self.max_iter:
+                return new_labels, similarities, centroids
+            labels = new_labels
+            centroids = _normalize(_topic_sums(labels, matrix, n_topics, vocabulary))
+
+            # Empty topic: restart it on the note that fits its own topic worst
+            best = similarities[np.arange(n_rows), labels]
+            for topic in np.flatnonzero(~centroids.any(axis=1)):
+                worst = int(best.argmin())
+                centroids[topic] = _row_vector(worst, matrix, vocabulary)
+                best[worst] = np.inf
+
+    def _minibatch(self, matrix, vocabulary, n_topics, rng) -> np.ndarray:
+        """
+        Mini-batch spherical k-means (Sculley 2010), returns the centroids
+
+        Each topic keeps the running mean of every note ever assigned to
+        it; a batch moves a centroid by its members' share of that mean.
+        """
+        n_rows = len(matrix[0]) - 1
+        seed_rows = rng.choice(n_rows, size=min(n_rows, max(self.batch_size, 20 * n_topics)), replace=False)
+        centroids = self._init_centroids(_take_rows(np.sort(seed_rows), matrix), vocabulary, n_topics, rng)
+        means = centroids.copy()
+        counts = np.zeros(n_topics)
+
+        self.iterations = 0
+        while self.iterations < self.max_batches:
+            self.iterations += 1
+            batch = _take_rows(np.sort(rng.choice(n_rows, size=self.batch_size, replace=False)), matrix)
+            labels = _similarities(*batch, centroids).argmax(axis=1)
+
+            batch_counts = np.bincount(labels, minlength=n_topics)
+            counts += batch_counts
+            rate = np.divide(batch_counts, counts, out=np.zeros(n_topics), where=counts > 0)[:, None]
+            batch_means = _topic_sums(labels, batch, n_topics, vocabulary) / np.maximum(batch_counts, 1)[:, None]
+            means += (rate * (batch_means - means)).astype(np.float32)
+
+            previous, centroids = centroids, _normalize(means)
+            if float(np.abs(centroids - previous).max()) < 1e-4:
+                break
+
+        return centroids
+
+    def _init_centroids(self, matrix, vocabulary, n_topics, rng) -> np.ndarray:
+        """k-means++ seeding on cosine distance (one sparse pass per seed)"""
+        indptr, indices, weights = matrix
+        n_rows = len(indptr) - 1
+        rows = np.repeat(np.arange(n_rows), np.diff(indptr))
+
+        centroids = np.zeros((n_topics, vocabulary), dtype=np.float32)
+        centroids[0] = _row_vector(int(rng.integers(n_rows)), matrix, vocabulary)
+
+        closest = np.zeros(n_rows)
+        for topic in range(1, n_topics):
+            similarity = np.bincount(rows, weights=weights * centroids[topic - 1][indices], minlength=n_rows)
+            np.maximum(closest, similarity, out=closest)
+            distance = np.clip(1.0 - closest, 0.0, None) ** 2
+            total = distance.sum()
+            pick = int(rng.choice(n_rows, p=distance / total)) if total > 0 else int(rng.integers(n_rows))
+            centroids[topic] = _row_vector(pick, matrix, vocabulary)
+        return centroids
+
+    def _topics(self, keys, labels, closeness, centroids, terms) -> tuple:
+        sizes = np.bincount(labels, minlength=len(centroids))
+        order = [int(topic) for topic in np.argsort(-sizes, kind='stable') if sizes[topic]]
+        topic_ids = {old: new for new, old in enumerate(order, 1)}
+
+        members: Dict[int, List[int]] = {}
+        for row in np.lexsort((-closeness, labels)):
+            members.setdefault(int(labels[row]), []).append(int(row))
+
+        topics = []
+        for old in order:
+            heaviest = np.argsort(-centroids[old], kind='stable')[:max(self.top_terms, self.centroid_terms)]
+            heaviest = [term for term in heaviest if centroids[old, term] > 0]
+            topics.append(Topic(
+                topic_id=topic_ids[old],
+                members=[keys[row] for row in members[old]],
+                top_terms=[terms[term] for term in heaviest[:self.top_terms]],
+                centroid={terms[term]: round(float(centroids[old, term]), 4)
+                          for term in heaviest[:self.centroid_terms]},
+            ))
+
+        labels_by_key = {key: topic_ids[int(label)] for key, label in zip(keys, labels)}
+        return labels_by_key, topics
+
+
+def _truncate(keys, indptr, indices, weights, max_terms: int) -> tuple:
+    """Keep each row's heaviest terms, L2-normalize, drop notes without terms"""
+    top = np.sort(top_entries(indptr, weights, max_terms))
+    lengths = np.minimum(np.diff(indptr), max_terms)
+    indices = indices[top].astype(np.int64)
+    weights = weights[top].astype(np.float32)
+
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    norms = np.sqrt(np.bincount(rows, weights=weights.astype(np.float64) ** 2, minlength=len(lengths)))
+    weights /= norms[rows].astype(np.float32)
+
+    keep = lengths > 0
+    keys = [key for key, kept in zip(keys, keep) if kept]
+    indptr = np.zeros(len(keys) + 1, dtype=np.int64)
+    np.cumsum(lengths[keep], out=indptr[1:])
+    return keys, indptr, indices, weights
+
+
+def _row_vector(row: int, matrix, vocabulary: int) -> np.ndarray:
+    indptr, indices, weights = matrix
+    vector = np.zeros(vocabulary, dtype=np.float32)
+    vector[indices[indptr[row]:indptr[row + 1]]] = weights[indptr[row]:indptr[row + 1]]
+    return vector
+
+
+def _take_rows(rows: np.ndarray, matrix) -> tuple:
+    """CSR sub-matrix of the given rows (in that order)"""
+    indptr, indices, weights = matrix
+    lengths = indptr[rows + 1] - indptr[rows]
+    sub_indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=sub_indptr[1:])
+    positions = np.repeat(indptr[rows] - sub_indptr[:-1], lengths) + np.arange(sub_indptr[-1])
+    return sub_indptr, indices[positions], weights[positions]
+
+
+# Nonzeros per chunk in _similarities: the chunk × topics scratch should stay cache-sized
+CHUNK_NONZEROS = 4096
+
+
+def _similarities(indptr, indices, weights, centroids: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every (unit) row to every (unit) centroid: X · Cᵀ without densifying X"""
+    n_rows = len(indptr) - 1
+    columns = np.ascontiguousarray(centroids.T)   # term → its weight in every centroid
+    similarities = np.zeros((n_rows, len(centroids)), dtype=np.float32)
+
+    start_row = 0
+    while start_row < n_rows:
+        # Whole rows only, about CHUNK_NONZEROS entries per chunk
+        end_row = int(np.searchsorted(indptr, indptr[start_row] + CHUNK_NONZEROS, side='right')) - 1
+        end_row = min(max(end_row, start_row + 1), n_rows)
+        lo, hi = indptr[start_row], indptr[end_row]
+
+        if hi > lo:
+            products = columns[indices[lo:hi]] * weights[lo:hi, None]
+            starts = indptr[start_row:end_row] - lo
+            nonempty = starts < (indptr[start_row + 1:end_row + 1] - lo)
+            similarities[start_row:end_row][nonempty] = np.add.reduceat(products, starts[nonempty], axis=0)
+        start_row = end_row
+
+    return similarities
+
+
+def _topic_sums(labels: np.ndarray, matrix, n_topics: int, vocabulary: int) -> np.ndarray:
+    """Sum of each topic's note vectors (topics × vocabulary, one bincount)"""
+    indptr, indices, weights = matrix
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    flat = labels[rows] * vocabulary + indices
+    sums = np.bincount(flat, weights=weights, minlength=n_topics * vocabulary)
+    return sums.reshape(n_topics, vocabulary).astype(np.float32)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Unit-norm rows (all-zero rows stay zero)"""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
@@ -0,0 +1,58 @@
+# tests/test_blob_store.py
+
+from src.phase2_approval import ProposalGenerator
+from src.tools.blob_store import BlobStore
+
+
+def test_bodies_are_stored_once_and_survive_reload(tmp_path):
+    store = BlobStore(tmp_path / "bodies")
+    first = store.put("Één body with ümlauts\n" * 50)
+    assert store.put("Één body with ümlauts\n" * 50) == first  # identical body → same blob
+    second = store.put("Another note")
+    assert (len(store), store.added, store.reused) == (2, 2, 1)
+    assert store.get(first) == "Één body with ümlauts\n" * 50  # readable before save
+    store.save()
+
+    # A crashed writer leaves bytes the index never covered: ignored, then truncated
+    with open(store.pack_path, 'ab') as f:
+        f.write(b"half-written blob")
+
+    reader = BlobStore(tmp_path / "bodies").load()
+    assert reader.get_many([second, first, "missing"]) == {first: "Één body with ümlauts\n" * 50,
+                                                           second: "Another note"}
+    third = reader.put("Third")
+    assert reader.get(third) == "Third" and reader.get(second) == "Another note"
+    reader.close()
+
+
+def test_save_compacts_unused_bodies_and_phase2_reads_previews(tmp_path):
+    store = BlobStore(tmp_path / "bodies")
+    old = store.put("old body " * 500)
+    store.put("kept body")
+    store.save()
+
+    store = BlobStore(tmp_path / "bodies").load()
+    kept = store.put("kept body")
+    store.save()  # "old" wasn't put this run and is most of the pack → rewritten
+    assert old not in store and store.size == store.pack_path.stat().st_size < 100
+
+    store = BlobStore(tmp_path / "bodies").load()
+    generator = ProposalGenerator(bodies=store)
+    page = {"title": "Kept", "file_name": "kept", "word_count": 20, "body_hash": kept}
+    proposal = generator.generate_proposals([page])[0]
+    assert proposal["content_preview"] == "kept body" and proposal["body_hash"] == kept
+    assert ProposalGenerator().generate_proposals([page])[0]["content_preview"] == ""
+
+
+def test_reload_starts_a_new_run(tmp_path):
+    store = BlobStore(tmp_path / "bodies").load()
+    first = store.put("first")
+    store.put("second")
+    store.save()
+
+    # Second run on the same instance: only "first" is still used
+    store.load()
+    assert store.put("first") == first and (store.added, store.reused) == (0, 1)
+    store.save()
+    assert len(store) == 1 and first in store
+    store.close()
@@ -0,0 +1,52 @@
+# tests/test_checkpoints.py
+
+from src.tools.checkpoints import Checkpoint, file_fingerprint, fingerprint
+
+
+def test_fingerprint_ignores_key_order_and_tracks_files(tmp_path):
+    assert fingerprint({"a": 1, "b": [2, 3]}) == fingerprint({"b": [2, 3], "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+    config = tmp_path / "rules.yaml"
+    missing = file_fingerprint(config)
+    config.write_text("rules: []")
+    assert file_fingerprint(config) != missing
+
+
+def test_plan_sorts_items_into_rebuild_and_reuse(tmp_path):
+    path = tmp_path / "checkpoints" / "phase.pkl"
+    checkpoint = Checkpoint(path, config="v1").load()
+    first = {"a": "h1", "b": "h2", "gone": "h3"}
+    assert checkpoint.plan(first).rebuild == dict.fromkeys(first, "new")
+
+    checkpoint.record("a", "h1", {"tone": "technical"})
+    checkpoint.record("b", "h2", {"tone": "casual"})
+    checkpoint.record("gone", "h3", {"tone": "casual"})
+    checkpoint.save()
+
+    checkpoint = Checkpoint(path, config="v1").load()
+    plan = checkpoint.plan({"a": "h1", "b": "edited", "c": "h4"})
+    assert plan.rebuild == {"b": "changed", "c": "new"}
+    assert plan.reuse == ["a"] and plan.removed == ["gone"]
+    assert plan.describe()[0] == "2 to rebuild (1 changed, 1 new), 1 up to date, 1 removed"
+    assert checkpoint.output("a", "h1") == {"tone": "technical"}
+    assert checkpoint.output("b", "edited") is None
+
+    assert Checkpoint(path, config="v1").load().plan({"a": "h1"}, force=True).rebuild == {"a": "forced"}
+    other_config = Checkpoint(path, config="v2").load()
+    assert other_config.plan({"a": "h1"}).rebuild == {"a": "config"}
+    assert other_config.output("a", "h1") is None
+
+
+def test_save_drops_items_no_longer_in_the_inputs(tmp_path):
+    path = tmp_path / "phase.pkl"
+    checkpoint = Checkpoint(path, config="v1")
+    for key in ("a", "b", "c"):
+        checkpoint.record(key, key, key.upper())
+    checkpoint.retain(["a", "c"])
+    checkpoint.save()
+
+    assert set(Checkpoint(path, config="v1").load().items) == {"a", "c"}
+
+    path.write_bytes(b"not a pickle")
+    assert Checkpoint(path, config="v1").load().items == {}  # unreadable → starts empty
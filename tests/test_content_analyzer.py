@@ -0,0 +1,49 @@
+# tests/test_content_analyzer.py
+
+from src.tools.content_analyzer import ContentAnalyzer
+
+
+def _page(content, metadata=None, images=None):
+    return {
+        "content": content,
+        "metadata": metadata or {},
+        "word_count": len(content.split()),
+        "images": images or [],
+    }
+
+
+def test_analyze_matches_the_single_methods():
+    content = ("A step by step guide: learn how to design the system architecture. "
+               "Our community event shares the technical implementation. " * 3)
+    page = _page(content, images=[{"name": "diagram.png"}])
+
+    analysis = ContentAnalyzer.analyze(page)
+
+    assert analysis["tone"] == "educational" == ContentAnalyzer.analyze_tone(content)
+    assert analysis["tone_scores"] == {"professional": 0, "technical": 3, "casual": 0, "educational": 4}
+    assert analysis["platforms"] == ["linkedin", "x", "facebook", "instagram"] == ContentAnalyzer.suggest_platforms(page)
+    assert analysis["keywords"] == ContentAnalyzer.extract_keywords(content)
+    assert analysis["keywords"][0] == "step"
+
+
+def test_keywords_match_word_starts_only():
+    # "ai" inside "said", "api" inside "capital", "code" inside "decode": no signal
+    page = _page("He said the capital letters decode fine. " * 200)
+    analysis = ContentAnalyzer.analyze(page)
+
+    assert analysis["tone_scores"] == {"professional": 0, "technical": 0, "casual": 0, "educational": 0}
+    assert analysis["tone"] == "neutral" and analysis["tone_confidence"] == 0.0
+    assert analysis["platforms"] == ["linkedin"]  # long-form only, no keyword rule fires
+
+    # Longer keywords still match inflections ("tech" → "technology", "join" → "joined")
+    page = _page("Technology people joined. " * 200)
+    assert ContentAnalyzer.analyze(page)["platforms"] == ["linkedin", "facebook"]
+
+
+def test_manual_platforms_and_phrase_boundaries():
+    page = _page("how\nto build a guide", metadata={"platforms": ["x"]})
+    analysis = ContentAnalyzer.analyze(page)
+
+    assert analysis["platforms"] == ["x"]
+    assert analysis["tone_scores"]["educational"] == 2  # "how to" across a line break + "guide"
+    assert ContentAnalyzer.analyze(_page("how it goes to plan"))["tone_scores"]["educational"] == 0
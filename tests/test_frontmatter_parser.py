@@ -0,0 +1,49 @@
+# tests/test_frontmatter_parser.py
+
+import frontmatter
+import pytest
+import yaml
+
+from src.tools.frontmatter_parser import parse_frontmatter
+
+
+HEADERS = [
+    "title: Hello\ntags: [tech, ai, 'quoted']\nready: yes\ncount: 3\nempty:\nnothing: ~",
+    "tags:\n  - a\n  - b\nplatforms:\n- linkedin\n- x",
+    "created: 2025-11-21\nratio: 1.5\noctal: 0123\ntime: 12:30\nbig: 1_000",
+    "nested:\n  topic: ai\n  audience: devs\nurl: https://example.com/x#y",
+    "title: x # comment\nsummary: >\n  folded text\nlist: [a, [b, c]]",
+    "list:\n- a\n  - b\nnext:\n  - c\n  - d",
+    "title: foo\t# tab comment\nready: yes",
+    "# only a comment",
+    "",
+]
+
+
+@pytest.mark.parametrize("header", HEADERS)
+def test_parse_frontmatter_matches_python_frontmatter(header):
+    text = f"\n---\n{header}\n---\n\n  Body with [[Link]] and #tag\n\n"
+    post = frontmatter.loads(text)
+
+    metadata, content, body_offset = parse_frontmatter(text)
+
+    assert metadata == post.metadata
+    assert content == post.content
+    assert text[body_offset:].rstrip() == content
+
+
+def test_parse_frontmatter_without_header_and_invalid_yaml():
+    assert parse_frontmatter("Just a note\n---\nafter a rule") == ({}, "Just a note\n---\nafter a rule", 0)
+
+    with pytest.raises(yaml.YAMLError):
+        parse_frontmatter("---\ntags: [unclosed\n---\nbody")
+
+
+def test_cached_headers_return_independent_metadata():
+    text = "---\ntags: [a, b]\nnested:\n  x: [1]\n---\nbody"
+    first, _, _ = parse_frontmatter(text)
+    first["tags"].append("mutated")
+    first["nested"]["x"].append(2)
+
+    second, _, _ = parse_frontmatter(text)
+    assert second == {"tags": ["a", "b"], "nested": {"x": [1]}}
@@ -0,0 +1,68 @@
+# tests/test_image_metadata.py
+
+import struct
+
+from src.tools import image_metadata
+from src.tools.image_metadata import ImageMetadataCache, read_image_header
+from src.tools.obsidian_scanner import ObsidianScanner
+
+
+def _png(width, height):
+    return (b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR"
+            + struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0) + b"\x00" * 64)
+
+
+def _jpeg(width, height):
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof2 = b"\xff\xc2" + struct.pack(">HBHHB", 11, 8, height, width, 1) + b"\x01\x11\x00"
+    return b"\xff\xd8" + app0 + sof2 + b"\xff\xda" + b"\x00" * 64
+
+
+def test_read_image_header_formats(tmp_path):
+    files = {
+        "a.png": _png(1080, 1350),
+        "b.jpg": _jpeg(1920, 1080),
+        "c.gif": b"GIF89a" + struct.pack("<HH", 320, 200) + b"\x00" * 32,
+        "d.webp": b"RIFF" + struct.pack("<I", 30) + b"WEBPVP8X" + struct.pack("<I", 10)
+                  + b"\x00" * 4 + (799).to_bytes(3, "little") + (599).to_bytes(3, "little"),
+        "e.svg": b'<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 300 150"></svg>',
+        "f.svg": b'<svg width="64px" height="32" viewBox="0 0 1 1"/>',
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_bytes(data)
+
+    assert read_image_header(tmp_path / "a.png") == {"format": "png", "width": 1080, "height": 1350}
+    assert read_image_header(tmp_path / "b.jpg") == {"format": "jpeg", "width": 1920, "height": 1080}
+    assert read_image_header(tmp_path / "c.gif") == {"format": "gif", "width": 320, "height": 200}
+    assert read_image_header(tmp_path / "d.webp") == {"format": "webp", "width": 800, "height": 600}
+    assert read_image_header(tmp_path / "e.svg") == {"format": "svg", "width": 300, "height": 150}
+    assert read_image_header(tmp_path / "f.svg") == {"format": "svg", "width": 64, "height": 32}
+
+
+def test_cache_reads_headers_once_per_mtime(tmp_path, monkeypatch):
+    image = tmp_path / "a.png"
+    image.write_bytes(_png(1000, 500))
+    cache = ImageMetadataCache(tmp_path / "meta.pkl")
+    assert cache.get(str(image)) == {"format": "png", "width": 1000, "height": 500,
+                                     "bytes": image.stat().st_size, "aspect": 2.0}
+    cache.save()
+
+    def no_reads(path):
+        raise AssertionError("header re-read for an unchanged image")
+
+    monkeypatch.setattr(image_metadata, "read_image_header", no_reads)
+    assert ImageMetadataCache(tmp_path / "meta.pkl").load().get(str(image))["width"] == 1000
+
+
+def test_scanner_adds_image_metadata(tmp_path):
+    vault = tmp_path / "vault"
+    (vault / "assets").mkdir(parents=True)
+    (vault / "assets" / "cover.png").write_bytes(_png(1080, 1080))
+    (vault / "note.md").write_text("Cover ![[cover.png]]", encoding='utf-8')
+
+    scanner = ObsidianScanner(str(vault), cache_dir=str(tmp_path / "cache"))
+    [page] = scanner.scan_vault()
+
+    [image] = page["images"]
+    assert (image["format"], image["width"], image["height"], image["aspect"]) == ("png", 1080, 1080, 1.0)
+    assert (tmp_path / "cache" / "image_metadata.pkl").exists()
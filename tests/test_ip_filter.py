@@ -0,0 +1,82 @@
+# tests/test_ip_filter.py
+
+import pytest
+
+from src.tools.ip_filter import PresenceBasedIPFilter
+
+
+def test_blocks_with_rule_and_position(tmp_path):
+    ip_filter = PresenceBasedIPFilter(str(tmp_path))
+
+    decision = ip_filter.is_safe_to_share("Setup notes\nAPI_KEY=abc123", {})
+    assert not decision
+    assert (decision.rule, decision.kind, decision.position) == ("api_key", "pattern", 12)
+
+    decision = ip_filter.is_safe_to_share("Draft ⚠️ Private section", {})
+    assert (decision.rule, decision.kind, decision.position) == ("⚠️ private", "marker", 6)
+
+    # First hit in the note wins
+    decision = ip_filter.is_safe_to_share("#internal memo, token: xyz", {})
+    assert (decision.rule, decision.position) == ("#internal", 0)
+
+
+def test_blocks_vault_only_tags(tmp_path):
+    ip_filter = PresenceBasedIPFilter(str(tmp_path))
+
+    decision = ip_filter.is_safe_to_share("Harmless", {"tags": ["ai", "#Confidential"]})
+    assert (decision.safe, decision.rule, decision.kind, decision.position) == (False, "confidential", "tag", 1)
+    assert not ip_filter.is_safe_to_share("Harmless", {"tags": "private"})
+
+
+def test_allows_clean_notes(tmp_path):
+    ip_filter = PresenceBasedIPFilter(str(tmp_path))
+
+    decision = ip_filter.is_safe_to_share("# Heading\nmy_key ideas: #ai and a token of thanks", {"tags": ["ai"]})
+    assert decision
+    assert decision.rule is None
+
+
+def test_decision_cache_skips_unchanged_notes_and_tracks_rules(tmp_path, monkeypatch):
+    from src.tools import ip_filter as ip_filter_module
+
+    cache_dir = tmp_path / "cache"
+    page = {"content": "token: abc", "content_hash": "h1", "metadata": {"tags": ["ai"]}}
+
+    first = PresenceBasedIPFilter(str(tmp_path), cache_dir=str(cache_dir))
+    assert first.check_page(page).rule == "token:"
+    first.save_decisions()
+
+    second = PresenceBasedIPFilter(str(tmp_path), cache_dir=str(cache_dir))
+    monkeypatch.setattr(second, "is_safe_to_share", lambda *args: pytest.fail("re-filtered a cached note"))
+    assert second.check_page(page) == (False, "token:", "pattern", 0)
+    # Different tags → different key
+    monkeypatch.undo()
+    assert not second.check_page({**page, "metadata": {"tags": ["private"]}})
+    assert second.decisions.misses == 1
+
+    # Rule lists change → old decisions are dropped
+    monkeypatch.setattr(ip_filter_module, "DANGEROUS_PATTERNS", ("api_key",))
+    third = PresenceBasedIPFilter(str(tmp_path), cache_dir=str(cache_dir))
+    third.check_page(page)
+    assert third.decisions.hits == 0
+
+    # Presence.md changes → fingerprint changes too
+    before = third.ruleset_fingerprint()
+    (tmp_path / "Presence.md").write_text("New day", encoding='utf-8')
+    assert third.ruleset_fingerprint() != before
+
+
+def test_decision_counters_are_per_run(tmp_path):
+    ip_filter = PresenceBasedIPFilter(str(tmp_path), cache_dir=str(tmp_path / "cache"))
+    pages = [{"content": f"note {i}", "content_hash": f"h{i}", "metadata": {}} for i in range(5)]
+
+    for page in pages:
+        ip_filter.check_page(page)
+    ip_filter.save_decisions()
+    assert (ip_filter.decisions.hits, ip_filter.decisions.misses) == (0, 5)
+
+    # Same instance, second run: everything cached, nothing filtered again
+    for page in pages:
+        ip_filter.check_page(page)
+    ip_filter.save_decisions()
+    assert (ip_filter.decisions.hits, ip_filter.decisions.misses) == (5, 0)
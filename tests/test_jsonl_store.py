@@ -0,0 +1,50 @@
+# tests/test_jsonl_store.py
+
+import json
+import os
+
+import pytest
+
+from src.tools import jsonl_store
+from src.tools.jsonl_store import JsonlWriter, find_jsonl, iter_jsonl, iter_records, jsonl_path, write_jsonl
+
+
+RECORDS = [
+    {"title": "Één note", "keywords": ["vault", "privacy"], "word_count": 12, "images": []},
+    {"title": "Second", "keywords": [], "word_count": 0, "images": [{"name": "a.png", "width": 10}]},
+]
+
+
+@pytest.mark.parametrize("compression", [
+    None,
+    "gzip",
+    pytest.param("zstd", marks=pytest.mark.skipif(jsonl_store.zstd is None, reason="no zstd module")),
+])
+def test_roundtrip_streams_records(tmp_path, compression):
+    path = jsonl_path(tmp_path / "safe_content.jsonl", compression)
+    assert write_jsonl(path, RECORDS) == 2
+
+    records = iter_jsonl(path)
+    assert next(records) == RECORDS[0]  # lazy: one line at a time
+    assert list(records) == RECORDS[1:]
+    assert list(iter_records(tmp_path / "safe_content.jsonl")) == RECORDS
+    assert not (tmp_path / (path.name + ".tmp")).exists()
+
+
+def test_failed_write_keeps_previous_artifact_and_legacy_json_fallback(tmp_path):
+    base = tmp_path / "safe_content.jsonl"
+    (tmp_path / "safe_content.json").write_text(json.dumps(RECORDS), encoding="utf-8")
+    assert find_jsonl(base) is None
+    assert list(iter_records(base)) == RECORDS  # older runs' JSON array
+
+    write_jsonl(base, RECORDS[:1])
+    with pytest.raises(RuntimeError):
+        with JsonlWriter(base) as writer:
+            writer.write(RECORDS[1])
+            raise RuntimeError("crash mid-run")
+    assert list(iter_records(base)) == RECORDS[:1]
+
+    # Newest variant wins when several exist
+    gz_path = write_jsonl(jsonl_path(base, "gzip"), RECORDS) and jsonl_path(base, "gzip")
+    os.utime(base, (0, 0))
+    assert find_jsonl(base) == gz_path and list(iter_records(base)) == RECORDS
@@ -0,0 +1,60 @@
+# tests/test_keyword_index.py
+
+import numpy as np
+import pytest
+
+from src.tools.keyword_index import KeywordIndex
+
+
+NOTES = {
+    "a.md": "The user enabled the guardian widget. Guardian widget threat checks for the user.",
+    "b.md": "The user enabled dark mode in the settings.",
+    "c.md": "The user enabled logging for the crewai agent.",
+}
+
+
+def test_corpus_terms_outrank_common_words():
+    index = KeywordIndex()
+    for key, content in NOTES.items():
+        index.add(key, content, key)
+
+    top = index.top_keywords(top_n=2)
+
+    # "user" / "enabled" are in every note, so they lose to note-specific terms
+    assert top["a.md"] == ["guardian", "widget"]
+    assert "user" not in top["b.md"] and "enabled" not in top["c.md"]
+    assert index.top_keywords(["c.md", "missing.md"], top_n=1) == {"c.md": ["logging"]}
+
+
+def test_incremental_updates_match_a_fresh_build(tmp_path):
+    index = KeywordIndex(tmp_path / "keywords.pkl")
+    for key, content in NOTES.items():
+        index.add(key, content, key)
+    index.save()
+
+    index = KeywordIndex(tmp_path / "keywords.pkl").load()
+    # Unchanged hash → no re-tokenizing, the body isn't even loaded
+    assert index.add("a.md", lambda: pytest.fail("loaded an indexed note"), "a.md") is False
+    assert index.add("b.md", "Completely rewritten note about the guardian.", "b2") is True
+    assert index.prune(["a.md", "b.md"]) == 1
+    index.save()
+    index = KeywordIndex(tmp_path / "keywords.pkl").load()
+
+    fresh = KeywordIndex()
+    fresh.add("a.md", NOTES["a.md"])
+    fresh.add("b.md", "Completely rewritten note about the guardian.")
+
+    assert index.term_count == fresh.term_count == len(index.terms)
+    assert np.array_equal(index.df, fresh.df[:len(fresh.terms)])
+    assert index.top_keywords(top_n=3) == fresh.top_keywords(top_n=3)
+
+
+def test_terms_in_any_script():
+    index = KeywordIndex()
+    index.add("pl.md", "Łódź: zażółć gęślą jaźń, python3 i snake_case")
+    index.add("tr.md", "İstanbul şehir merkezi")
+    index.add("ru.md", "Привет мир, программирование")
+
+    assert {"łódź", "zażółć", "gęślą", "jaźń", "python", "snake", "case"} <= set(index.terms)
+    assert {"şehir", "merkezi", "привет", "мир", "программирование"} <= set(index.terms)
+    assert not {"dź", "ż", "ł"} & set(index.terms)
@@ -0,0 +1,71 @@
+# tests/test_link_graph.py
+
+from src.tools.link_graph import LinkGraph
+from src.tools.obsidian_scanner import ObsidianScanner
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+
+def test_link_graph_resolves_backlinks_orphans_and_neighborhoods():
+    graph = LinkGraph()
+    graph.sync(["Hub.md", "Projects/Guardian.md", "Projects/Roadmap.md", "Archive/Roadmap.md", "Lonely.md"])
+    graph.update("Hub.md", ["Guardian|the paper", "Projects/Roadmap#Q1", "Missing note"])
+    graph.update("Projects/Guardian.md", ["Roadmap", "Guardian#self"])
+
+    assert graph.outlinks("Hub.md") == ["Projects/Guardian.md", "Projects/Roadmap.md"]
+    # Bare name → same folder first; self links are dropped
+    assert graph.outlinks("Projects/Guardian.md") == ["Projects/Roadmap.md"]
+    assert graph.backlinks("Projects/Roadmap.md") == ["Hub.md", "Projects/Guardian.md"]
+    assert graph.orphans() == ["Archive/Roadmap.md", "Lonely.md"]
+
+    assert graph.neighborhood("Hub.md", hops=1, direction="out") == {
+        "Projects/Guardian.md": 1, "Projects/Roadmap.md": 1,
+    }
+    assert graph.neighborhood("Projects/Roadmap.md", hops=2, direction="in") == {
+        "Hub.md": 1, "Projects/Guardian.md": 1,
+    }
+
+
+def test_link_graph_incremental_updates_and_persistence(tmp_path):
+    graph = LinkGraph(tmp_path / "graph.pkl")
+    graph.sync(["a.md", "b.md"])
+    graph.update("a.md", ["c"])
+    assert graph.outlinks("a.md") == []
+
+    # A new note resolves links that were dangling
+    graph.sync(["a.md", "b.md", "sub/c.md"])
+    assert graph.outlinks("a.md") == ["sub/c.md"]
+
+    # Removing it unresolves them again; unchanged links are a no-op
+    graph.sync(["a.md", "b.md"])
+    assert graph.outlinks("a.md") == []
+    assert graph.update("a.md", ["c"]) is False
+    graph.update("b.md", ["a"])
+    graph.save()
+
+    loaded = LinkGraph(tmp_path / "graph.pkl").load()
+    assert len(loaded) == 2
+    assert loaded.backlinks("a.md") == ["b.md"]
+    loaded.sync(["a.md", "b.md", "c.md"])
+    assert loaded.outlinks("a.md") == ["c.md"]
+
+
+def test_scanner_keeps_link_graph_in_sync(tmp_path):
+    vault = tmp_path / "vault"
+    _write(vault / "a.md", "Links to [[b]] and ![[c]]")
+    _write(vault / "b.md", "Back to [[a|Alpha]]")
+    _write(vault / "c.md", "Embedded")
+
+    ObsidianScanner(str(vault), cache_dir=str(tmp_path / "cache")).scan_vault(incremental=True)
+
+    _write(vault / "b.md", "No links any more")
+    scanner = ObsidianScanner(str(vault), cache_dir=str(tmp_path / "cache"))
+    scanner.scan_vault(incremental=True)
+
+    graph = scanner.link_graph
+    assert graph.outlinks("a.md") == ["b.md", "c.md"]
+    assert graph.backlinks("a.md") == []
+    assert LinkGraph(tmp_path / "cache" / "link_graph.pkl").load().outlinks("b.md") == []
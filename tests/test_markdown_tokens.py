@@ -0,0 +1,36 @@
+# tests/test_markdown_tokens.py
+
+from src.tools.markdown_tokens import tokenize
+
+
+def test_tokenize_links_embeds_images_and_tags():
+    content = (
+        "# Heading\n"
+        "See [[Archie Guardian|the paper]] and ![[Roadmap]] #release #ai/agents\n"
+        "![[diagram.png|300]] ![alt](sub/logo%20one.png \"Logo\") ![[diagram.png]]\n"
+        "Issue #42 and color#fff are not tags.\n"
+    )
+    tokens = tokenize(content)
+
+    assert tokens.links == ["Archie Guardian|the paper"]
+    assert tokens.embeds == ["Roadmap"]
+    assert tokens.images == ["diagram.png", "sub/logo%20one.png"]
+    assert tokens.tags == ["release", "ai/agents"]
+    assert tokens.word_count == len(content.split())
+
+
+def test_tokenize_skips_code():
+    content = (
+        "Real #tag\n"
+        "```python\n"
+        "#include <stdio.h>\n"
+        "x = '[[not a link]]'  # comment\n"
+        "```\n"
+        "Inline `#nope` then #after\n"
+        "~~~\n"
+        "#unterminated fence swallows the rest\n"
+    )
+    tokens = tokenize(content)
+
+    assert tokens.tags == ["tag", "after"]
+    assert tokens.links == []
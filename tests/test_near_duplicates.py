@@ -0,0 +1,44 @@
+# tests/test_near_duplicates.py
+
+import random
+
+import pytest
+
+from src.tools.near_duplicates import NearDuplicateDetector
+
+
+def _text(seed, words=300):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(2000)]
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def test_clusters_near_duplicates_only():
+    paper = _text(1)
+    draft = paper.replace("word1 ", "WORD1 edited ", 1) + " one extra closing line"
+    detector = NearDuplicateDetector(threshold=0.8)
+
+    detector.add("Archie Guardian.md", paper)
+    detector.add("Archies Guardian.md", draft)
+    detector.add("Roadmap.md", _text(2))
+    detector.add("Empty.md", "")
+
+    assert detector.clusters() == [["Archie Guardian.md", "Archies Guardian.md"]]
+
+
+def test_signatures_cached_per_content_hash(tmp_path):
+    detector = NearDuplicateDetector(tmp_path / "minhash.pkl")
+    first = detector.add("a.md", _text(3), content_hash="h1")
+    detector.save()
+
+    reloaded = NearDuplicateDetector(tmp_path / "minhash.pkl").load()
+    again = reloaded.add("a.md", lambda: pytest.fail("loaded the body of a cached note"), content_hash="h1")
+    assert reloaded.cache_hits == 1
+    assert (again == first).all()
+    loads = []
+    reloaded.add("b.md", lambda: loads.append("b.md") or _text(4), content_hash="h2")
+    assert loads == ["b.md"]  # a miss loads the body once
+
+    # Different MinHash parameters → cache is ignored
+    other = NearDuplicateDetector(tmp_path / "minhash.pkl", num_perm=64, bands=8).load()
+    assert other.cache == {}
@@ -0,0 +1,168 @@
+# tests/test_obsidian_scanner.py
+
+import os
+
+from src.tools.obsidian_scanner import ObsidianScanner
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+
+def test_incremental_scan_reports_added_changed_removed(tmp_path):
+    vault = tmp_path / "vault"
+    _write(vault / "a.md", "---\ntitle: A\n---\nAlpha note about [[b]]")
+    _write(vault / "b.md", "Beta note")
+    _write(vault / "old.md", "Going away")
+    _write(vault / ".obsidian" / "skip.md", "Never scanned")
+
+    scanner = ObsidianScanner(str(vault), cache_dir=str(tmp_path / "cache"))
+    pages = scanner.scan_vault(incremental=True)
+    assert sorted(p["file_name"] for p in pages) == ["a", "b", "old"]
+    assert scanner.last_scan_stats["added"] == 3
+
+    # Nothing changed → nothing parsed
+    pages = scanner.scan_vault(incremental=True)
+    assert scanner.last_scan_stats["parsed"] == 0
+    assert scanner.last_scan_stats["unchanged"] == 3
+    assert {p["title"] for p in pages} == {"A", "b", "old"}
+
+    # Manifest survives across scanner instances
+    _write(vault / "b.md", "Beta note, edited and longer")
+    pages = ObsidianScanner(str(vault), cache_dir=str(tmp_path / "cache")).scan_vault(incremental=True)
+    by_name = {p["file_name"]: p for p in pages}
+    assert by_name["b"]["content"] == "Beta note, edited and longer"
+
+
+def test_incremental_scan_stats_on_rescan(tmp_path):
+    vault = tmp_path / "vault"
+    _write(vault / "a.md", "Alpha")
+    _write(vault / "b.md", "Beta")
+
+    scanner = ObsidianScanner(str(vault), cache_dir=str(tmp_path / "cache"))
+    scanner.scan_vault(incremental=True)
+
+    _write(vault / "b.md", "Beta, edited")
+    os.remove(vault / "a.md")
+    _write(vault / "c.md", "Gamma")
+
+    scanner.scan_vault(incremental=True)
+    stats = scanner.last_scan_stats
+    assert (stats["added"], stats["changed"], stats["removed"], stats["unchanged"]) == (1, 1, 1, 0)
+
+
+def test_parallel_scan_matches_serial_and_captures_errors(tmp_path):
+    vault = tmp_path / "vault"
+    for i in range(20):
+        _write(vault / f"folder{i % 3}" / f"note{i:02d}.md", f"Note {i} links [[note{i + 1:02d}]] #tag{i}")
+    (vault / "broken.md").write_bytes(b"\xff\xfe not utf-8")
+
+    scanner = ObsidianScanner(str(vault))
+    serial = scanner.scan_vault(workers=1)
+    parallel = scanner.scan_vault(workers=2)
+
+    assert [p["file_path"] for p in parallel] == [p["file_path"] for p in serial]
+    assert [p["internal_links"] for p in parallel] == [p["internal_links"] for p in serial]
+    assert [e["file"] for e in scanner.last_scan_errors] == ["broken.md"]
+
+
+def test_walk_prunes_skip_folders_and_applies_globs(tmp_path):
+    vault = tmp_path / "vault"
+    _write(vault / "Projects" / "keep.md", "Keep")
+    _write(vault / "Projects" / "draft.md", "Draft")
+    _write(vault / "Archive" / "old.md", "Old")
+    for i in range(10):
+        _write(vault / ".git" / "objects" / f"{i}.md", "Git internals")
+
+    scanner = ObsidianScanner(str(vault), exclude=["Archive", "*/draft.md"])
+    pages = scanner.scan_vault()
+
+    assert [p["file_name"] for p in pages] == ["keep"]
+    walk = scanner.last_walk_stats
+    assert walk["dirs_skipped"] == 2  # .git + Archive, never entered
+    assert walk["files_skipped"] == 1
+    assert walk["dirs_visited"] == 2  # vault root + Projects
+
+    scanner = ObsidianScanner(str(vault), include=["Archive/**"])
+    assert [p["file_name"] for p in scanner.scan_vault()] == ["old"]
+
+
+def test_globs_are_path_aware(tmp_path):
+    vault = tmp_path / "vault"
+    _write(vault / "Projects" / "top.md", "Top")
+    _write(vault / "Projects" / "sub" / "nested.md", "Nested")
+    _write(vault / "Projects" / "sub" / "deep" / "draft.md", "Draft")
+
+    def scanned(**globs):
+        return sorted(p["file_name"] for p in ObsidianScanner(str(vault), **globs).scan_vault())
+
+    # * stops at "/", ** crosses folders ("**/" also matches no folder)
+    assert scanned(include=["Projects/*.md"]) == ["top"]
+    assert scanned(include=["Projects/**"]) == ["draft", "nested", "top"]
+    assert scanned(include=["Projects/**/*.md"]) == ["draft", "nested", "top"]
+    assert scanned(include=["**/draft.md"]) == ["draft"]
+    assert scanned(exclude=["Projects/*/deep"]) == ["nested", "top"]
+    assert scanned(include=["Projects/[st]*/*.md"]) == ["nested"]
+
+
+def test_images_resolve_with_obsidian_shortest_path(tmp_path):
+    vault = tmp_path / "vault"
+    for rel in ["assets/deep/diagram.png", "diagram.png", "Notes/local.png",
+                "Other/local.png", ".trash/gone.png", "Notes/sub/logo one.png"]:
+        (vault / rel).parent.mkdir(parents=True, exist_ok=True)
+        (vault / rel).write_bytes(b"")
+    _write(vault / "Notes" / "post.md",
+           "![[diagram.png]] ![[local.png]] ![[gone.png]] ![[deep/diagram.png]]\n"
+           "![alt](sub/logo%20one.png)")
+
+    scanner = ObsidianScanner(str(vault), cache_dir=str(tmp_path / "cache"))
+    page = scanner.scan_vault()[0]
+    resolved = {img["name"]: img["path"] for img in page["images"]}
+
+    assert resolved == {
+        "diagram.png": str(vault / "diagram.png"),            # shortest path wins
+        "local.png": str(vault / "Notes/local.png"),          # same folder wins
+        "sub/logo%20one.png": str(vault / "Notes/sub/logo one.png"),
+        "deep/diagram.png": str(vault / "assets/deep/diagram.png"),
+    }
+
+    # New attachment shows up for a cached (unparsed) note
+    scanner.scan_vault(incremental=True)
+    (vault / "gone.png").write_bytes(b"")
+    page = scanner.scan_vault(incremental=True)[0]
+    assert scanner.last_scan_stats["parsed"] == 0
+    assert "gone.png" in {img["name"] for img in page["images"]}
+
+
+def test_iter_vault_streams_pages_and_finalizes_manifest(tmp_path):
+    vault = tmp_path / "vault"
+    for i in range(5):
+        _write(vault / f"n{i}.md", f"Note {i}")
+
+    scanner = ObsidianScanner(str(vault), cache_dir=str(tmp_path / "cache"))
+    stream = scanner.iter_vault(incremental=True)
+    assert next(stream)["file_name"] == "n0"
+    assert [p["file_name"] for p in stream] == ["n1", "n2", "n3", "n4"]
+
+    scanner.scan_vault(incremental=True)
+    assert scanner.last_scan_stats["unchanged"] == 5
+
+
+def test_page_record_loads_content_lazily(tmp_path):
+    vault = tmp_path / "vault"
+    (vault).mkdir()
+    (vault / "crlf.md").write_bytes(b"---\r\ntitle: CRLF\r\ntags: [a]\r\n---\r\n\r\n  Body line 1\r\nline 2 #tag  \r\n\r\n")
+    _write(vault / "plain.md", "\n\nNo frontmatter here\n\n")
+
+    scanner = ObsidianScanner(str(vault), cache_dir=str(tmp_path / "cache"))
+    eager = {p["file_name"]: p["content"] for p in scanner.scan_vault(incremental=True)}
+
+    # Second run serves bodiless records from the manifest
+    for page in scanner.scan_vault(incremental=True):
+        assert not page.content_loaded
+        assert page["content"] == eager[page["file_name"]]
+        page["tone"] = "technical"
+        assert page.get("tone") == "technical" and page["image_count"] == 0
+
+    assert eager == {"crlf": "Body line 1\nline 2 #tag", "plain": "No frontmatter here"}
@@ -0,0 +1,150 @@
+# tests/test_phase1_intelligence.py
+
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Phase scripts import tools.* the way they do when run from src/
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from phase1_intelligence import ContentIntelligence
+
+PAPER = " ".join(f"Guardian paper section {i} explains the agent memory design in detail." for i in range(40))
+
+
+def _write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def vault(tmp_path):
+    vault = tmp_path / "vault"
+    _write(vault / "Archie Guardian.md", f"# Archie Guardian\n\n{PAPER}")
+    _write(vault / "Archies Guardian.md", f"# Archie Guardian\n\n{PAPER} One extra closing line.")
+    _write(vault / "Roadmap.md", "# Roadmap\n\nShipping the python api refactor next sprint with better tests and docs.")
+    _write(vault / "Journal.md", "# Journal\n\nA casual weekend note about coffee, hiking and a good book to read.")
+    return vault
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def test_rerun_after_blocking_a_duplicate(vault, tmp_path):
+    intelligence = ContentIntelligence(str(vault), cache_dir=str(tmp_path / "cache"))
+    safe, _ = intelligence.run()
+    clustered = {page["note_key"] for page in safe if page["cluster_id"] is not None}
+    assert clustered == {"Archie Guardian.md", "Archies Guardian.md"}
+
+    # The duplicate becomes private: the same instance must not cluster last run's notes
+    _write(vault / "Archies Guardian.md", f"#private\n\n{PAPER} One extra closing line.")
+    safe, blocked = intelligence.run()
+    assert [page["title"] for page in blocked] == ["Archies Guardian"]
+    assert all(page["cluster_id"] is None and page["canonical"] for page in safe)
+
+
+def _by_key(records):
+    return {record["note_key"]: record for record in records}
+
+
+def test_checkpoint_reuse_force_and_dry_run(vault, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    _write(vault / "Secrets.md", "# Secrets\n\napi_key: do not share")
+
+    # Dry run before the first run: everything is new, and the run rebuilds exactly that
+    intelligence = ContentIntelligence(str(vault), cache_dir=cache_dir)
+    plan = intelligence.plan()
+    assert set(plan.rebuild.values()) == {"new"} and len(plan.rebuild) == 5
+    cold, blocked = intelligence.run()
+    assert sorted(intelligence.rebuilt) == sorted(plan.rebuild)
+    assert [page["title"] for page in blocked] == ["Secrets"]
+
+    # Nothing changed: a fresh process plans and rebuilds nothing, records are identical
+    intelligence = ContentIntelligence(str(vault), cache_dir=cache_dir)
+    plan = intelligence.plan()
+    assert plan.rebuild == {} and len(plan.reuse) == 5
+    warm, _ = intelligence.run()
+    assert intelligence.rebuilt == [] and _by_key(warm) == _by_key(cold)
+
+    # One edited note: planned as changed, the only one analyzed again
+    _write(vault / "Roadmap.md", "# Roadmap\n\nShipping the python api refactor, then a casual coffee break.")
+    intelligence = ContentIntelligence(str(vault), cache_dir=cache_dir)
+    assert intelligence.plan().rebuild == {"Roadmap.md": "changed"}
+    intelligence.run()
+    assert intelligence.rebuilt == ["Roadmap.md"]
+
+    # --force: every note, blocked ones included
+    assert set(intelligence.plan(force=True).rebuild.values()) == {"forced"}
+    intelligence.run(force=True)
+    assert len(intelligence.rebuilt) == 5 and intelligence.metrics.counts["rebuilt"] == 5
+
+
+def test_presence_change_only_rescores_mentions(vault, tmp_path):
+    presence = vault / "Presence.md"
+    _write(presence, "# Today\n\nA quiet day.")
+    intelligence = ContentIntelligence(str(vault), cache_dir=str(tmp_path / "cache"))
+    before = _by_key(intelligence.run()[0])
+    assert before["Roadmap.md"]["presence_score"] == 0
+
+    # Tomorrow's narrative mentions the roadmap: no note is analyzed again, mentions are re-scored
+    _write(presence, "# Today\n\nShipping the python refactor this sprint.\n⚠️ private: salary talk")
+    stat = presence.stat()
+    os.utime(presence, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    after = _by_key(intelligence.run()[0])
+
+    assert intelligence.rebuilt == ["Presence.md"]  # the presence note itself changed
+    assert intelligence.metrics.counts["rescored"] == 4  # every other safe note
+    assert after["Roadmap.md"]["presence_score"] >= 2
+    assert after["Roadmap.md"]["presence_lines"] == ["Shipping the python refactor this sprint."]
+    assert after["Roadmap.md"]["tone"] == before["Roadmap.md"]["tone"]
+
+
+def test_warm_incremental_run_never_loads_bodies(vault, tmp_path, monkeypatch):
+    from tools.page_record import PageRecord
+
+    cache_dir = str(tmp_path / "cache")
+    ContentIntelligence(str(vault), cache_dir=cache_dir).run(incremental=True)
+
+    # Nothing changed: MinHash, keyword, IP decision + analysis caches all answer by content hash
+    monkeypatch.setattr(PageRecord, "_load_content", lambda self: pytest.fail(f"loaded {self.file_name}"))
+    intelligence = ContentIntelligence(str(vault), cache_dir=cache_dir)
+    safe, _ = intelligence.run(incremental=True)
+    assert len(safe) == 4 and intelligence.scanner.last_scan_stats["unchanged"] == 4
+
+
+def test_router_report_covers_one_run(vault, tmp_path):
+    from tools.platform_router import default_router
+
+    cache_dir = str(tmp_path / "cache")
+    ContentIntelligence(str(vault), cache_dir=cache_dir).run()
+    assert default_router().routed == 4
+
+    # Warm run: every analysis is reused, nothing is routed this time
+    ContentIntelligence(str(vault), cache_dir=cache_dir).run()
+    assert default_router().routed == 0
+    assert all(stats["evaluated"] == 0 for stats in default_router().stats.values())
+
+
+def test_blocked_records_stream_and_mentions_come_first(vault, tmp_path):
+    from tools.jsonl_store import JsonlWriter, iter_jsonl
+
+    _write(vault / "Secrets.md", "# Secrets\n\napi_key: do not share")
+    _write(vault / "Presence.md", "# Today\n\nA casual coffee and hiking weekend, then the python api refactor.")
+    intelligence = ContentIntelligence(str(vault), cache_dir=str(tmp_path / "cache"))
+    with JsonlWriter(tmp_path / "blocked_content.jsonl") as blocked_writer:
+        safe, blocked = intelligence.run(blocked_writer=blocked_writer)
+
+    assert blocked == [] and intelligence.metrics.counts["blocked"] == 1
+    assert [record["title"] for record in iter_jsonl(tmp_path / "blocked_content.jsonl")] == ["Secrets"]
+
+    # Same order as a stable sort by presence score, vault order for the rest
+    ordered = list(intelligence._presence_order(safe))
+    assert ordered == sorted(safe, key=lambda record: -record["presence_score"])
+    assert ordered[0]["presence_score"] > 0 and ordered != safe
@@ -0,0 +1,41 @@
+# tests/test_phase2_approval.py
+
+import sys
+from pathlib import Path
+
+# The checkpoint helpers import tools.* the way the script does when run from src/
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.phase2_approval import ProposalGenerator
+
+
+def _page(title, tone="technical", word_count=120):
+    return {"title": title, "file_name": f"{title}.md", "note_key": f"{title}.md", "tone": tone,
+            "platforms": ["linkedin"], "keywords": [], "word_count": word_count, "images": [], "image_count": 0}
+
+
+def test_checkpoint_reports_changes_on_every_run(tmp_path):
+    path = tmp_path / "phase2.pkl"
+    generator = ProposalGenerator()
+    pages = [_page("Roadmap"), _page("Journal", tone="casual")]
+
+    # First run: everything is new; saving records exactly these proposals
+    checkpoint = generator.checkpoint(path).load()
+    inputs = generator.proposal_inputs(generator.generate_proposals(pages))
+    assert set(checkpoint.plan(inputs).rebuild.values()) == {"new"}
+    generator.record_checkpoint(checkpoint, inputs)
+
+    # Next run: one note changed, one is up to date, --force reports both
+    pages[1] = _page("Journal", tone="educational")
+    checkpoint = generator.checkpoint(path).load()
+    inputs = generator.proposal_inputs(generator.generate_proposals(pages))
+    plan = checkpoint.plan(inputs)
+    assert plan.rebuild == {"Journal.md": "changed"} and plan.reuse == ["Roadmap.md"]
+    assert checkpoint.plan(inputs, force=True).rebuild == {"Roadmap.md": "forced", "Journal.md": "forced"}
+
+    # Review fields don't count as changes; related-note settings do
+    reviewed = [{**proposal, "status": "approved", "notes": "ok"} for proposal in generator.generate_proposals(pages)]
+    generator.record_checkpoint(checkpoint, inputs)
+    assert generator.checkpoint(path).load().plan(generator.proposal_inputs(reviewed)).rebuild == {}
+    other = ProposalGenerator(related_limit=3)
+    assert set(other.checkpoint(path).load().plan(inputs).rebuild.values()) == {"config"}
@@ -0,0 +1,68 @@
+# tests/test_platform_router.py
+
+import pytest
+
+from src.tools.lexicon import tokenize
+from src.tools.platform_router import PlatformRouter
+
+
+def _page(content, tags=None, images=None, platforms=None):
+    metadata = {"tags": tags or []}
+    if platforms:
+        metadata["platforms"] = platforms
+    return {"content": content, "metadata": metadata, "word_count": len(content.split()), "images": images or []}
+
+
+def test_batch_routes_match_single_routes_and_count_hits():
+    router = PlatformRouter()
+    pages = [
+        _page("Quick note about the tech stack.", tags=["#AI"]),
+        _page("word " * 600),
+        _page("Join our community! ![[photo.png]]", images=[{"path": "photo.png"}]),
+        _page("Anything", platforms=["facebook"]),
+    ]
+
+    routes = router.route_batch(pages)
+
+    assert routes[0].platforms == ["linkedin", "x"]
+    assert routes[0].rules == ["linkedin-tags", "x-short"]  # linkedin-keywords skipped: already routed
+    assert routes[1].platforms == ["linkedin"]
+    assert routes[2].platforms == ["x", "facebook", "instagram"]
+    assert routes[3].platforms == ["facebook"] and routes[3].manual
+
+    assert router.stats["linkedin-tags"] == {"evaluated": 3, "hits": 1, "ns": router.stats["linkedin-tags"]["ns"]}
+    assert router.stats["linkedin-keywords"]["evaluated"] == 1  # only page 2 was still without linkedin
+    assert router.manual == 1 and router.routed == 4
+
+    # Same answers one page at a time, with or without tokens
+    single = PlatformRouter()
+    assert [single.route(page) for page in pages] == routes
+    assert [single.route(page, tokenize(page["content"])) for page in pages] == routes
+    assert {name: stats["evaluated"] for name, stats in single.stats.items()} == \
+        {name: 2 * stats["evaluated"] for name, stats in router.stats.items()}
+
+
+def test_fallback_and_config_errors():
+    router = PlatformRouter({
+        "platforms": ["linkedin", "x"],
+        "fallback": ["x"],
+        "rules": [{"name": "long", "platform": "linkedin", "min_words": 10, "keywords_any": ["how to"]}],
+    })
+    assert router.route(_page("how to " * 10)).platforms == ["linkedin"]
+    assert router.route(_page("how to")) == (["x"], ["fallback"], False)
+    assert router.fallbacks == 1
+
+    router.reset_stats()
+    assert router.routed == router.fallbacks == 0 and router.stats["long"]["evaluated"] == 0
+
+    with pytest.raises(ValueError):
+        PlatformRouter({"platforms": ["x"], "rules": [{"name": "r", "platform": "mastodon", "tags_any": ["a"]}]})
+    with pytest.raises(ValueError):
+        PlatformRouter({"platforms": ["x"], "rules": [{"name": "r", "platform": "x", "min_word": 3}]})
+
+
+def test_only_resolved_images_count():
+    router = PlatformRouter()
+    # A transclusion or a broken embed is "![" in the body, but no image the scanner resolved
+    assert "instagram" not in router.route(_page("See ![[Other note]] and ![[missing.png]]")).platforms
+    assert "instagram" in router.route(_page("A photo", images=[{"path": "photo.png"}])).platforms
@@ -0,0 +1,68 @@
+# tests/test_presence_cache.py
+
+import os
+
+from src.tools import presence_cache
+from src.tools.ip_filter import PresenceBasedIPFilter
+from src.tools.obsidian_reader import ObsidianVaultReader
+
+
+def test_presence_shared_and_reloaded_on_mtime_change(tmp_path, monkeypatch):
+    presence = tmp_path / "Precence.md"
+    presence.write_text("---\nupdated: today\n---\nShipped Archie Guardian v1.0\n⚠️ private: salary talk\n",
+                        encoding='utf-8')
+
+    parses = []
+    parse = presence_cache._parse_presence
+    monkeypatch.setattr(presence_cache, "_parse_presence", lambda *args: parses.append(args) or parse(*args))
+
+    ip_filter = PresenceBasedIPFilter(str(tmp_path))
+    reader = ObsidianVaultReader(str(tmp_path))
+
+    assert reader.get_presence_context().startswith("Shipped Archie Guardian")
+    assert ip_filter.presence_page["public_narrative"] == ["Shipped Archie Guardian v1.0"]
+    assert ip_filter.presence.tokens == {"shipped", "archie", "guardian", "v1", "0"}
+    assert ip_filter.is_mentioned_in_presence("Notes on Archie Guardian internals")
+    assert len(parses) == 1
+
+    presence.write_text("Nothing public today\n", encoding='utf-8')
+    stat = presence.stat()
+    os.utime(presence, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert not ip_filter.is_mentioned_in_presence("Notes on Archie Guardian internals")
+    assert reader.get_presence_context() == "Nothing public today"
+    assert len(parses) == 2
+
+    # Rewritten with the mtime preserved (sync tools, coarse timestamps): the size change still counts
+    mtime_ns = presence.stat().st_mtime_ns
+    presence.write_text("Shipped Archie Guardian v2.0 publicly\n", encoding='utf-8')
+    os.utime(presence, ns=(mtime_ns, mtime_ns))
+    assert ip_filter.is_mentioned_in_presence("Notes on Archie Guardian internals")
+    assert len(parses) == 3
+
+
+def test_missing_presence_is_permissive(tmp_path):
+    ip_filter = PresenceBasedIPFilter(str(tmp_path))
+    assert ip_filter.presence_page == {'daily_summary': '', 'public_narrative': [], 'timestamp': 'unknown'}
+    assert not ip_filter.is_mentioned_in_presence("anything at all here")
+
+
+def test_score_pages_with_inverted_index(tmp_path):
+    (tmp_path / "Presence.md").write_text(
+        "Shipped Archie Guardian v1.0 today\n"
+        "Working on the Socials crew pipeline\n"
+        "⚠️ private: guardian pricing\n"
+        "Guardian roadmap review with the team\n",
+        encoding='utf-8',
+    )
+    ip_filter = PresenceBasedIPFilter(str(tmp_path))
+
+    scores = ip_filter.score_pages([
+        {"title": "Archie Guardian", "content": "Release notes for the guardian roadmap"},
+        {"title": "Cooking", "content": "Pasta with tomatoes"},
+    ])
+
+    assert scores[0].score == 3
+    assert scores[0].tokens == ["archie", "guardian", "roadmap"]
+    assert scores[0].lines == ["Shipped Archie Guardian v1.0 today", "Guardian roadmap review with the team"]
+    assert scores[1] == (0, [], [])
@@ -0,0 +1,26 @@
+# tests/test_stage_metrics.py
+
+import json
+
+from src.tools.stage_metrics import StageMetrics
+
+
+def test_stages_record_counts_and_percentiles(tmp_path):
+    metrics = StageMetrics("phase1")
+    metrics.stage("walk")
+    for latency in range(1, 101):
+        metrics.stage("parse").add(latency * 1_000_000, latency * 500_000)
+    with metrics.measure("serialize", items=7, sample=False):
+        pass
+    metrics.counts["scanned"] = 100
+
+    metrics.save(tmp_path / "metrics.json")
+    summary = json.loads((tmp_path / "metrics.json").read_text())
+
+    assert list(summary["stages"]) == ["walk", "parse", "serialize"]
+    parse = summary["stages"]["parse"]
+    assert parse["items"] == 100 and parse["wall_s"] == 5.05 and parse["cpu_s"] == 2.525
+    assert (parse["p50_ms"], parse["p95_ms"], parse["p99_ms"], parse["max_ms"]) == (50.5, 95.05, 99.01, 100.0)
+    assert summary["stages"]["serialize"]["items"] == 7 and "p50_ms" not in summary["stages"]["serialize"]
+    assert summary["counts"] == {"scanned": 100} and summary["phase"] == "phase1"
+    assert len(metrics.report()) == 3
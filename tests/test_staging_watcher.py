@@ -0,0 +1,82 @@
+# tests/test_staging_watcher.py
+
+import itertools
+import sys
+
+import pytest
+
+from src.tools.obsidian_reader import ObsidianVaultReader
+from src.tools.staging_watcher import StagingWatcher, _InotifyBackend
+
+
+class FakeClock:
+    """Debounce time the test advances by hand"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher_debounces_save_storms(tmp_path, use_inotify):
+    clock = FakeClock()
+    watcher = StagingWatcher(tmp_path, debounce=1.0, poll_interval=0, use_inotify=use_inotify, clock=clock)
+    try:
+        # Each save restarts the quiet period (sizes differ: the polling backend compares mtime + size)
+        for i in range(5):
+            (tmp_path / "post.md").write_text(f"draft {'.' * i}", encoding='utf-8')
+            assert watcher.poll(timeout=0) == set()
+            clock.now += 0.5
+        (tmp_path / "ignored.txt").write_text("not a note", encoding='utf-8')
+
+        assert watcher.poll(timeout=0) == set()  # only 0.5 s since the last save
+        clock.now += 0.5
+        assert watcher.poll(timeout=0) == {tmp_path / "post.md"}
+        assert watcher.poll(timeout=0) == set()
+    finally:
+        watcher.close()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_queue_overflow_rescans_the_folder(tmp_path):
+    for name in ("a.md", "b.md", "notes.txt"):
+        (tmp_path / name).write_text(name, encoding='utf-8')
+
+    clock = FakeClock()
+    watcher = StagingWatcher(tmp_path, debounce=1.0, clock=clock)
+    try:
+        assert watcher.mode == "inotify"
+        # The kernel drops events and queues one IN_Q_OVERFLOW (wd -1, no name) instead
+        overflow = _InotifyBackend.EVENT_HEADER.pack(-1, _InotifyBackend.IN_Q_OVERFLOW, 0, 0)
+        assert sorted(watcher.backend._names(overflow)) == ["a.md", "b.md", "notes.txt"]
+        assert watcher.backend.overflows == 1
+
+        watcher._record(watcher.backend._names(overflow))
+        clock.now += 1.0
+        assert watcher.poll(timeout=0) == {tmp_path / "a.md", tmp_path / "b.md"}
+    finally:
+        watcher.close()
+
+
+def test_watch_emits_only_changed_ready_notes(tmp_path):
+    staging = tmp_path / "Social_Crew_Staging"
+    staging.mkdir()
+    (staging / "existing.md").write_text("---\nready: true\n---\nAlready here", encoding='utf-8')
+
+    # Every clock read advances 50 ms: notes settle after a fixed number of polls, not wall time
+    reader = ObsidianVaultReader(str(tmp_path))
+    batches = reader.watch_staging_notes(debounce=0.2, include_existing=True,
+                                         clock=itertools.count(0, 0.05).__next__)
+    try:
+        assert [note["filename"] for note in next(batches)] == ["existing.md"]
+
+        (staging / "draft.md").write_text("---\nready: false\n---\nNot yet", encoding='utf-8')
+        (staging / "new.md").write_text("---\nready: true\n---\nShip it", encoding='utf-8')
+        # Touch without changing content → not re-emitted
+        (staging / "existing.md").write_text("---\nready: true\n---\nAlready here", encoding='utf-8')
+
+        assert [note["filename"] for note in next(batches)] == ["new.md"]
+    finally:
+        batches.close()
@@ -0,0 +1,52 @@
+# tests/test_tone_classifier.py
+
+import pytest
+
+from src.tools.tone_classifier import NEUTRAL, ToneClassifier, load_tone_lexicons
+
+
+def test_config_lexicons_load_with_weights(tmp_path):
+    config = tmp_path / "tones.yaml"
+    config.write_text("technical:\n  - code\n  - {api: 2.5}\ncasual:\n  - hey\n", encoding='utf-8')
+
+    assert load_tone_lexicons(config) == {"technical": {"code": 1.0, "api": 2.5}, "casual": {"hey": 1.0}}
+    assert "how to" in load_tone_lexicons()["educational"]  # shipped config
+
+
+def test_batch_scores_distribution_ties_and_neutral():
+    classifier = ToneClassifier({
+        "technical": {"code": 1.0, "api": 2.0},
+        "casual": {"hey": 1.0, "awesome": 1.0},
+        "educational": {"how to": 1.0},
+    })
+
+    technical, tie, neutral, phrase = classifier.classify_batch([
+        "Hey, the API code is documented. Code code code.",
+        "Hey, awesome code and an API!",
+        "Nothing to see here",
+        "How to write code",
+    ])
+
+    assert technical.tone == "technical"
+    assert technical.scores == {"technical": 3.0, "casual": 1.0, "educational": 0.0}
+    assert technical.distribution["technical"] == pytest.approx(0.75)
+    assert technical.confidence == pytest.approx(0.75) and technical.ties == ["technical"]
+
+    assert tie.ties == ["technical"]  # 3.0 vs 2.0: the API weight breaks the tie
+    assert phrase.ties == ["technical", "educational"] and phrase.tone == "technical"
+    assert phrase.confidence == pytest.approx(0.5)
+
+    assert neutral.tone == NEUTRAL and neutral.confidence == 0.0 and neutral.ties == []
+    assert classifier.classify_batch([]) == []
+
+    # The scalar single-note path gives the same results
+    texts = ["Hey, the API code is documented. Code code code.", "Nothing to see here", "How to write code"]
+    assert [classifier.classify_one(classifier.matcher.match_text(text)) for text in texts] == \
+        classifier.classify_batch(texts)
+
+
+def test_mixed_case_lexicon_keys_keep_their_weights():
+    classifier = ToneClassifier({"technical": {"API": 2.0, "Python": 1.0}, "casual": {"Coffee": 1.0}})
+
+    result = classifier.classify("Coffee first, then the python api")
+    assert result.scores == {"technical": 3.0, "casual": 1.0}
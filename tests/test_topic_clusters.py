@@ -0,0 +1,62 @@
+# tests/test_topic_clusters.py
+
+from src.phase2_approval import ProposalGenerator
+from src.tools.keyword_index import KeywordIndex
+from src.tools.topic_clusters import TopicClusterer
+
+
+GARDEN = "tomato garden soil compost watering seedlings greenhouse harvest"
+SECURITY = "firewall malware phishing encryption threat patching exploit network"
+
+
+def _index(notes_per_topic=6):
+    index = KeywordIndex()
+    for i in range(notes_per_topic):
+        # Same vocabulary per topic, varying emphasis
+        index.add(f"garden/{i}.md", f"{GARDEN} {GARDEN.split()[i]} " * 3)
+        index.add(f"security/{i}.md", f"{SECURITY} {SECURITY.split()[i]} " * 3)
+    index.add("empty.md", "the and of")  # no indexed terms
+    return index
+
+
+def test_topics_separate_vocabularies():
+    labels, topics = TopicClusterer(n_topics=2).fit(_index())
+
+    assert "empty.md" not in labels
+    assert len(topics) == 2 and [topic.topic_id for topic in topics] == [1, 2]
+    for topic in topics:
+        folders = {key.split("/")[0] for key in topic.members}
+        assert len(folders) == 1 and len(topic.members) == 6
+        assert set(topic.top_terms) <= set((GARDEN + " " + SECURITY).split())
+        assert all(labels[key] == topic.topic_id for key in topic.members)
+        assert 0 < max(topic.centroid.values()) <= 1
+
+
+def test_minibatch_path_matches_on_clear_topics():
+    index = _index(notes_per_topic=8)
+    clusterer = TopicClusterer(n_topics=2, batch_size=2)  # 16 notes > 4 × batch_size → mini-batch
+    labels, topics = clusterer.fit(index)
+
+    assert sorted(len(topic.members) for topic in topics) == [8, 8]
+    assert len({labels[f"garden/{i}.md"] for i in range(8)}) == 1
+    assert labels["garden/0.md"] != labels["security/0.md"]
+
+
+def test_topic_proposals_merge_sources():
+    pages = [
+        {"title": f"Garden {i}", "file_name": f"{i}.md", "note_key": f"garden/{i}.md", "word_count": 100 + i,
+         "topic_id": 1, "platforms": ["instagram"] if i else ["linkedin", "instagram"], "images": [],
+         "image_count": 0, "keywords": [], "tone": "casual"}
+        for i in range(3)
+    ] + [{"title": "Loose note", "file_name": "loose.md", "note_key": "loose.md", "word_count": 50,
+          "topic_id": None, "platforms": ["x"], "images": [], "image_count": 0, "keywords": []}]
+
+    proposals = ProposalGenerator().generate_topic_proposals(
+        pages, [{"topic_id": 1, "top_terms": ["tomato", "compost"]}])
+
+    topic, loose = proposals
+    assert topic["source_page"] == "Garden 2"  # longest page leads
+    assert [source["title"] for source in topic["sources"]] == ["Garden 2", "Garden 1", "Garden 0"]
+    assert topic["keywords"] == ["tomato", "compost"] and topic["topic_id"] == 1
+    assert topic["suggested_platforms"] == ["instagram", "linkedin"]
+    assert loose["source_page"] == "Loose note" and "sources" not in loose